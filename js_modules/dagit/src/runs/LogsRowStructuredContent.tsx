@@ -137,6 +137,8 @@ export const LogsRowStructuredContent: React.FunctionComponent<IStructuredConten
               ? 'Store'
               : node.operationResult.op === 'GET_OBJECT'
               ? 'Retrieve'
+              : node.operationResult.op === 'RM_OBJECT'
+              ? 'Remove'
               : ''
           }
         >
@@ -152,6 +154,8 @@ export const LogsRowStructuredContent: React.FunctionComponent<IStructuredConten
               ? 'Store Asset'
               : node.assetStoreResult.op === 'GET_ASSET'
               ? 'Retrieve Asset'
+              : node.assetStoreResult.op === 'RM_ASSET'
+              ? 'Remove Asset'
               : ''
           }
         />
@@ -10,6 +10,7 @@
 
 export enum AssetStoreOperationType {
   GET_ASSET = "GET_ASSET",
+  RM_ASSET = "RM_ASSET",
   SET_ASSET = "SET_ASSET",
 }
 
@@ -118,13 +118,12 @@ def download_dump_view(context):
 
     def view(run_id):
         run = context.instance.get_run_by_id(run_id)
-        debug_payload = DebugRunPayload.build(context.instance, run)
         check.invariant(run is not None)
         out_name = "{}.gzip".format(run_id)
 
         result = io.BytesIO()
         with gzip.GzipFile(fileobj=result, mode="wb") as file:
-            debug_payload.write(file)
+            DebugRunPayload.write_for_run(context.instance, run, file)
 
         result.seek(0)  # be kind, please rewind
 
@@ -64,7 +64,7 @@ def get_asset_run_ids(graphene_info, asset_key):
 def get_assets_for_run_id(graphene_info, run_id):
     check.str_param(run_id, "run_id")
 
-    records = graphene_info.context.instance.all_logs(run_id)
+    records = graphene_info.context.instance.iter_logs(run_id)
     asset_keys = [
         record.dagster_event.asset_key
         for record in records
@@ -7,6 +7,7 @@
 from graphql.execution.base import ResolveInfo
 
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import BatchRunLoader
 from .utils import UserFacingGraphQLError, capture_dauphin_error
 
 
@@ -48,6 +49,13 @@ def get_run_by_id(graphene_info, run_id):
         return graphene_info.schema.type_named("PipelineRun")(run)
 
 
+def get_dauphin_runs(graphene_info, runs):
+    """Wraps a list of runs for GraphQL. The runs share a BatchRunLoader, so the event log data of
+    all of them is fetched together."""
+    batch_loader = BatchRunLoader(graphene_info.context.instance, [run.run_id for run in runs])
+    return [graphene_info.schema.type_named("PipelineRun")(run, batch_loader) for run in runs]
+
+
 def get_run_tags(graphene_info):
     instance = graphene_info.context.instance
     return [
@@ -67,8 +75,7 @@ def get_run_group(graphene_info, run_id):
     else:
         root_run_id, run_group = result
         return graphene_info.schema.type_named("RunGroup")(
-            root_run_id=root_run_id,
-            runs=[graphene_info.schema.type_named("PipelineRun")(run) for run in run_group],
+            root_run_id=root_run_id, runs=get_dauphin_runs(graphene_info, run_group),
         )
 
 
@@ -91,7 +98,7 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.get_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named("PipelineRun")(run) for run in runs]
+    return get_dauphin_runs(graphene_info, runs)
 
 
 def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
@@ -104,14 +111,19 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     instance = graphene_info.context.instance
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
 
-    for root_run_id in run_groups:
-        run_groups[root_run_id]["runs"] = [
-            graphene_info.schema.type_named("PipelineRun")(run)
-            for run in run_groups[root_run_id]["runs"]
-        ]
+    # The runs of all of the groups share a single batch
+    batch_loader = BatchRunLoader(
+        instance, [run.run_id for run_group in run_groups.values() for run in run_group["runs"]]
+    )
 
     return [
-        DauphinRunGroup(root_run_id=root_run_id, runs=run_group["runs"])
+        DauphinRunGroup(
+            root_run_id=root_run_id,
+            runs=[
+                graphene_info.schema.type_named("PipelineRun")(run, batch_loader)
+                for run in run_group["runs"]
+            ],
+        )
         for root_run_id, run_group in run_groups.items()
     ]
 
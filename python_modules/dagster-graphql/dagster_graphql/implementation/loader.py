@@ -0,0 +1,38 @@
+from dagster import check
+from dagster.core.instance import DagsterInstance
+
+
+class BatchRunLoader:
+    """Loads the event log data shown for a list of runs, e.g. on the runs page, with a single
+    storage call per field for all of the runs instead of one per run.
+
+    Each field is fetched for every run in the list the first time any of the runs resolves it, and
+    is then served from memory. A loader is created for each list of runs being resolved, so it
+    never outlives the query.
+    """
+
+    def __init__(self, instance, run_ids):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._run_ids = check.list_param(run_ids, "run_ids", of_type=str)
+        self._data = {}
+
+    def get_run_stats(self, run_id):
+        return self._get(run_id, "stats", self._instance.get_runs_stats)
+
+    def get_step_stats(self, run_id):
+        return self._get(run_id, "step_stats", self._instance.get_runs_step_stats)
+
+    def get_asset_keys(self, run_id):
+        return self._get(run_id, "asset_keys", self._instance.get_runs_asset_keys)
+
+    def _get(self, run_id, field, fetch_fn):
+        check.str_param(run_id, "run_id")
+
+        if field not in self._data:
+            self._data[field] = fetch_fn(self._run_ids)
+
+        check.invariant(
+            run_id in self._data[field],
+            "Run {run_id} was not loaded in this batch".format(run_id=run_id),
+        )
+        return self._data[field][run_id]
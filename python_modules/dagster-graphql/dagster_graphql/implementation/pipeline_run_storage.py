@@ -1,19 +1,110 @@
+import threading
+
+from dagster import check
+
+# The maximum number of events delivered to the observer at once, both when loading the run's
+# history and when delivering new events
+DEFAULT_PAGE_SIZE = 1000
+
+# New events are coalesced, and delivered to the observer at most once per interval
+DEFAULT_BATCH_INTERVAL_SECONDS = 0.1
+
+
 class PipelineRunObservableSubscribe:
-    def __init__(self, instance, run_id, after_cursor=None):
+    """Delivers the events of a run to an observer, starting with the events after the given
+    cursor.
+
+    Events are always read from the event log, a page at a time, keyed on the storage id of the
+    last event delivered, so that the ids that storages shared by several runs assign across runs
+    aren't mistaken for positions within the run. The event log watcher only signals that there
+    are new events to read, so events are held in memory one page at a time, however far behind
+    the observer falls.
+    """
+
+    def __init__(
+        self, instance, run_id, after_cursor=None, page_size=None, batch_interval_seconds=None,
+    ):
         self.instance = instance
         self.run_id = run_id
         self.observer = None
         self.after_cursor = after_cursor if after_cursor is not None else -1
 
+        self._page_size = check.opt_int_param(page_size, "page_size", DEFAULT_PAGE_SIZE)
+        self._batch_interval_seconds = check.opt_numeric_param(
+            batch_interval_seconds, "batch_interval_seconds", DEFAULT_BATCH_INTERVAL_SECONDS
+        )
+        check.invariant(self._page_size > 0, "page_size must be greater than 0")
+
+        # Cursor of the next page of events to read from the event log. Only read and written by
+        # the thread calling the subscription, then by the delivery thread once it has started.
+        self._cursor = None
+        self._num_delivered = 0
+
+        # Guards the start of the delivery thread, since the event log watcher may call back from
+        # several threads
+        self._lock = threading.Lock()
+        self._has_new_events = threading.Event()
+        self._disposed = threading.Event()
+        self._delivery_thread = None
+
     def __call__(self, observer):
         self.observer = observer
 
-        events = self.instance.logs_after(self.run_id, self.after_cursor)
-        if events:
-            self.observer.on_next(events)
+        self._cursor = int(self.after_cursor)
+        while self._deliver_page():
+            pass
+
+        self.instance.watch_event_logs(
+            self.run_id, int(self.after_cursor) + self._num_delivered, self.handle_new_event
+        )
+        # Events stored after the last page was read but before the watcher was registered
+        self.handle_new_event(None)
+
+        return self.dispose
+
+    def handle_new_event(self, _new_event):
+        with self._lock:
+            if self._disposed.is_set():
+                return
+
+            self._has_new_events.set()
+            if not self._delivery_thread:
+                self._delivery_thread = threading.Thread(
+                    target=self._deliver_new_events,
+                    name="run-events-subscription-{}".format(self.run_id),
+                )
+                self._delivery_thread.daemon = True
+                self._delivery_thread.start()
+
+    def dispose(self):
+        self._disposed.set()
+        self._has_new_events.set()
+        self.instance.end_watch_event_logs(self.run_id, self.handle_new_event)
+
+    def _deliver_new_events(self):
+        while True:
+            self._has_new_events.wait()
+            if self._disposed.wait(self._batch_interval_seconds):
+                return
+
+            # Cleared before reading, so that events stored while the pages are read are picked
+            # up on the next pass
+            self._has_new_events.clear()
+            while self._deliver_page() and not self._disposed.is_set():
+                pass
 
-        cursor = len(events) + int(self.after_cursor)
-        self.instance.watch_event_logs(self.run_id, cursor, self.handle_new_event)
+    def _deliver_page(self):
+        """Delivers the next page of events after the cursor from the event log. Returns whether
+        the page was full, i.e. whether there may be more events to deliver."""
+        events_by_log_id = self.instance.logs_after_by_log_id(
+            self.run_id, self._cursor, limit=self._page_size
+        )
+        if not events_by_log_id:
+            return False
 
-    def handle_new_event(self, new_event):
-        self.observer.on_next([new_event])
+        events = list(events_by_log_id.values())
+        self.observer.on_next(events)
+        self._num_delivered += len(events)
+        # The logs after the log with a given id are the logs after the cursor one less than it
+        self._cursor = list(events_by_log_id.keys())[-1] - 1
+        return len(events) == self._page_size
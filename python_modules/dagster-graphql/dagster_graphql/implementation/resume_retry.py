@@ -18,7 +18,7 @@ def get_retry_steps_from_execution_plan(instance, execution_plan, parent_run_id)
         return execution_plan.step_keys_in_plan
 
     parent_run = instance.get_run_by_id(parent_run_id)
-    parent_run_logs = instance.all_logs(parent_run_id)
+    parent_run_logs = instance.iter_logs(parent_run_id)
     all_steps_in_parent_run_logs = set([])
     failed_steps_in_parent_run_logs = set([])
     successful_steps_in_parent_run_logs = set([])
@@ -5,7 +5,7 @@
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
 from dagster_graphql import dauphin
 from dagster_graphql.implementation.fetch_assets import get_asset_events, get_asset_run_ids
-from dagster_graphql.implementation.fetch_runs import get_run_by_id
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs, get_run_by_id
 from dagster_graphql.schema.runs import construct_basic_params
 
 from .errors import DauphinError
@@ -58,12 +58,10 @@ def resolve_runs(self, graphene_info, **kwargs):
         if limit:
             run_ids = run_ids[:limit]
 
-        return [
-            graphene_info.schema.type_named("PipelineRun")(r)
-            for r in graphene_info.context.instance.get_runs(
-                filters=PipelineRunsFilter(run_ids=run_ids)
-            )
-        ]
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(filters=PipelineRunsFilter(run_ids=run_ids)),
+        )
 
 
 class DauphinAssetMaterialization(dauphin.ObjectType):
@@ -10,6 +10,7 @@
 )
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 
 
 class DauphinJobTick(dauphin.ObjectType):
@@ -95,12 +96,10 @@ def resolve_runs(self, graphene_info, **kwargs):
             filters = PipelineRunsFilter.for_sensor(self._job_state)
         else:
             filters = PipelineRunsFilter.for_schedule(self._job_state)
-        return [
-            graphene_info.schema.type_named("PipelineRun")(r)
-            for r in graphene_info.context.instance.get_runs(
-                filters=filters, limit=kwargs.get("limit"),
-            )
-        ]
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs(filters=filters, limit=kwargs.get("limit")),
+        )
 
     def resolve_runsCount(self, graphene_info):
         if self._job_state.job_type == JobType.SENSOR:
@@ -27,6 +27,7 @@
 from dagster_graphql.implementation.fetch_assets import get_assets_for_run_id
 from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
 from dagster_graphql.implementation.fetch_runs import get_stats, get_step_stats
+from dagster_graphql.implementation.loader import BatchRunLoader
 
 DauphinPipelineRunStatus = dauphin.Enum.from_enum(PipelineRunStatus)
 DauphinStepEventStatus = dauphin.Enum.from_enum(StepEventStatus)
@@ -127,11 +128,12 @@ class Meta:
     canTerminate = dauphin.NonNull(dauphin.Boolean)
     assets = dauphin.non_null_list("Asset")
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, batch_loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+        self._batch_loader = check.opt_inst_param(batch_loader, "batch_loader", BatchRunLoader)
 
     def resolve_id(self, _):
         return self._pipeline_run.run_id
@@ -158,9 +160,18 @@ def resolve_pipelineSnapshotId(self, _):
         return self._pipeline_run.pipeline_snapshot_id
 
     def resolve_stats(self, graphene_info):
+        if self._batch_loader:
+            return graphene_info.schema.type_named("PipelineRunStatsSnapshot")(
+                self._batch_loader.get_run_stats(self.run_id)
+            )
         return get_stats(graphene_info, self.run_id)
 
     def resolve_stepStats(self, graphene_info):
+        if self._batch_loader:
+            return [
+                graphene_info.schema.type_named("PipelineRunStepStats")(stats)
+                for stats in self._batch_loader.get_step_stats(self.run_id)
+            ]
         return get_step_stats(graphene_info, self.run_id)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
@@ -225,6 +236,11 @@ def resolve_canTerminate(self, graphene_info):
         return graphene_info.context.instance.run_coordinator.can_cancel_run(self.run_id)
 
     def resolve_assets(self, graphene_info):
+        if self._batch_loader:
+            return [
+                graphene_info.schema.type_named("Asset")(key=asset_key)
+                for asset_key in self._batch_loader.get_asset_keys(self.run_id)
+            ]
         return get_assets_for_run_id(graphene_info, self.run_id)
 
 
@@ -613,6 +629,7 @@ class Meta:
 
     SET_ASSET = "SET_ASSET"
     GET_ASSET = "GET_ASSET"
+    RM_ASSET = "RM_ASSET"
 
 
 class DauphinAssetStoreOperationResult(dauphin.ObjectType):
@@ -0,0 +1,188 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from dagster import DagsterEvent, DagsterEventType, DagsterInstance, seven
+from dagster.core.events import EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.instance import InstanceType
+from dagster.core.launcher.sync_in_memory_run_launcher import SyncInMemoryRunLauncher
+from dagster.core.run_coordinator import DefaultRunCoordinator
+from dagster.core.storage.event_log.sqlite import ConsolidatedSqliteEventLogStorage
+from dagster.core.storage.noop_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
+from dagster.core.test_utils import create_run_for_test
+from dagster_graphql.implementation.pipeline_run_storage import PipelineRunObservableSubscribe
+from dagster_graphql_tests.graphql.graphql_context_test_suite import graphql_postgres_instance
+
+
+class _CollectingObserver:
+    def __init__(self, delay=None):
+        self.frames = []
+        self.received = threading.Event()
+        self._delay = delay
+
+    def on_next(self, events):
+        if self._delay:
+            time.sleep(self._delay)
+        self.frames.append(events)
+        self.received.set()
+
+    @property
+    def messages(self):
+        return [event.message for frame in self.frames for event in frame]
+
+
+def _store_event(instance, run_id, message):
+    instance.handle_new_event(
+        DagsterEventRecord(
+            None,
+            message,
+            "debug",
+            "",
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+    )
+
+
+def _wait_for_messages(observer, count, timeout=5):
+    start = time.time()
+    while len(observer.messages) < count:
+        assert time.time() - start < timeout
+        observer.received.wait(0.01)
+        observer.received.clear()
+
+
+def test_run_history_delivered_in_pages():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo")
+    for i in range(5):
+        _store_event(instance, run.run_id, "Message_{}".format(i))
+
+    observer = _CollectingObserver()
+    subscribe = PipelineRunObservableSubscribe(instance, run.run_id, page_size=2)
+    dispose = subscribe(observer)
+
+    assert [len(frame) for frame in observer.frames] == [2, 2, 1]
+    assert observer.messages == ["Message_{}".format(i) for i in range(5)]
+    dispose()
+
+
+def test_run_history_after_cursor():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo")
+    for i in range(5):
+        _store_event(instance, run.run_id, "Message_{}".format(i))
+
+    observer = _CollectingObserver()
+    dispose = PipelineRunObservableSubscribe(instance, run.run_id, after_cursor=2)(observer)
+
+    assert observer.messages == ["Message_3", "Message_4"]
+    dispose()
+
+
+def test_new_events_coalesced():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo")
+
+    observer = _CollectingObserver()
+    subscribe = PipelineRunObservableSubscribe(
+        instance, run.run_id, page_size=3, batch_interval_seconds=0.5
+    )
+    dispose = subscribe(observer)
+    assert observer.frames == []
+
+    for i in range(5):
+        _store_event(instance, run.run_id, "Message_{}".format(i))
+
+    _wait_for_messages(observer, 5)
+    assert [len(frame) for frame in observer.frames] == [3, 2]
+    assert observer.messages == ["Message_{}".format(i) for i in range(5)]
+
+    dispose()
+    _store_event(instance, run.run_id, "Message_5")
+    time.sleep(0.6)
+    assert len(observer.messages) == 5
+
+
+def test_slow_observer():
+    instance = DagsterInstance.ephemeral()
+    run = create_run_for_test(instance, pipeline_name="foo")
+
+    observer = _CollectingObserver(delay=0.2)
+    subscribe = PipelineRunObservableSubscribe(
+        instance, run.run_id, page_size=4, batch_interval_seconds=0.1
+    )
+    dispose = subscribe(observer)
+
+    # events stored while the observer is busy are read from the event log once it's ready
+    for i in range(10):
+        _store_event(instance, run.run_id, "Message_{}".format(i))
+        time.sleep(0.02)
+
+    _wait_for_messages(observer, 10)
+    assert all(len(frame) <= 4 for frame in observer.frames)
+    assert observer.messages == ["Message_{}".format(i) for i in range(10)]
+    dispose()
+
+
+@contextmanager
+def _ephemeral_instance():
+    yield DagsterInstance.ephemeral()
+
+
+@contextmanager
+def _consolidated_sqlite_instance():
+    with seven.TemporaryDirectory() as temp_dir:
+        yield DagsterInstance(
+            instance_type=InstanceType.EPHEMERAL,
+            local_artifact_storage=LocalArtifactStorage(temp_dir),
+            run_storage=InMemoryRunStorage(),
+            event_storage=ConsolidatedSqliteEventLogStorage(temp_dir),
+            compute_log_manager=NoOpComputeLogManager(),
+            run_coordinator=DefaultRunCoordinator(),
+            run_launcher=SyncInMemoryRunLauncher(),
+        )
+
+
+@contextmanager
+def _postgres_instance():
+    with graphql_postgres_instance(overrides={}) as instance:
+        yield instance
+
+
+@pytest.mark.parametrize(
+    "instance_cm_fn", [_ephemeral_instance, _consolidated_sqlite_instance, _postgres_instance],
+)
+def test_interleaved_runs(instance_cm_fn):
+    with instance_cm_fn() as instance:
+        run = create_run_for_test(instance, pipeline_name="foo")
+        other_run = create_run_for_test(instance, pipeline_name="foo")
+
+        def _store_interleaved_events(start, end):
+            for i in range(start, end):
+                _store_event(instance, run.run_id, "Message_{}".format(i))
+                _store_event(instance, other_run.run_id, "Other_{}".format(i))
+
+        _store_interleaved_events(0, 5)
+
+        observer = _CollectingObserver()
+        subscribe = PipelineRunObservableSubscribe(instance, run.run_id, page_size=2)
+        dispose = subscribe(observer)
+        assert [len(frame) for frame in observer.frames] == [2, 2, 1]
+        assert observer.messages == ["Message_{}".format(i) for i in range(5)]
+
+        _store_interleaved_events(5, 10)
+        _wait_for_messages(observer, 10)
+        # each event is delivered exactly once
+        time.sleep(0.5)
+        assert observer.messages == ["Message_{}".format(i) for i in range(10)]
+        dispose()
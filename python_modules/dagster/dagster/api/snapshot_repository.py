@@ -1,3 +1,7 @@
+import threading
+from collections import OrderedDict
+
+import grpc
 from dagster import check
 from dagster.core.host_representation import (
     ExternalRepository,
@@ -8,6 +12,25 @@
 )
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
+# The most recently loaded repository data, so that a process that talks to many servers doesn't
+# hold on to the snapshot of every repository it has ever seen
+EXTERNAL_REPOSITORY_DATA_CACHE_SIZE = 32
+
+# OrderedDict[str, (str, ExternalRepositoryData)], keyed by the id of the repository origin, least
+# recently used first
+_external_repository_data_cache = OrderedDict()
+_external_repository_data_cache_lock = threading.Lock()
+
+
+def _get_external_repository_hash(api_client, external_repository_origin):
+    try:
+        return api_client.external_repository_hash(external_repository_origin)
+    except grpc.RpcError as e:
+        # Servers running an older version of dagster don't implement this call
+        if isinstance(e, grpc.Call) and e.code() == grpc.StatusCode.UNIMPLEMENTED:
+            return None
+        raise
+
 
 def sync_get_external_repositories_grpc(api_client, repository_location_handle):
     check.inst_param(
@@ -43,21 +66,11 @@ def sync_get_streaming_external_repositories_grpc(api_client, repository_locatio
 
     repos = []
     for repository_name in repository_location_handle.repository_names:
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location_handle.origin, repository_name,
-                )
-            )
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location_handle.origin, repository_name,
         )
-
-        external_repository_data = deserialize_json_to_dagster_namedtuple(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            )
+        external_repository_data = _get_streaming_external_repository_data(
+            api_client, external_repository_origin
         )
 
         repos.append(
@@ -70,3 +83,42 @@ def sync_get_streaming_external_repositories_grpc(api_client, repository_locatio
             )
         )
     return repos
+
+
+def _get_streaming_external_repository_data(api_client, external_repository_origin):
+    # The snapshot can be large, so check the server's hash of it first and skip the fetch if we
+    # have already loaded identical data for this origin
+    origin_id = external_repository_origin.get_id()
+    external_repository_hash = _get_external_repository_hash(api_client, external_repository_origin)
+
+    if external_repository_hash is not None:
+        with _external_repository_data_cache_lock:
+            cached = _external_repository_data_cache.get(origin_id)
+            if cached:
+                _external_repository_data_cache.move_to_end(origin_id)
+        if cached and cached[0] == external_repository_hash:
+            return cached[1]
+
+    external_repository_chunks = list(
+        api_client.streaming_external_repository(
+            external_repository_origin=external_repository_origin
+        )
+    )
+
+    external_repository_data = deserialize_json_to_dagster_namedtuple(
+        "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
+    )
+
+    if external_repository_hash is not None:
+        with _external_repository_data_cache_lock:
+            _external_repository_data_cache[origin_id] = (
+                external_repository_hash,
+                external_repository_data,
+            )
+            _external_repository_data_cache.move_to_end(origin_id)
+            while len(_external_repository_data_cache) > EXTERNAL_REPOSITORY_DATA_CACHE_SIZE:
+                _external_repository_data_cache.popitem(last=False)
+
+    return external_repository_data
@@ -22,7 +22,13 @@ def sync_get_external_sensor_execution_data_ephemeral_grpc(
 
 
 def sync_get_external_sensor_execution_data_grpc(
-    api_client, instance, repository_handle, sensor_name, last_completion_time, last_run_key
+    api_client,
+    instance,
+    repository_handle,
+    sensor_name,
+    last_completion_time,
+    last_run_key,
+    timeout=None,
 ):
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
@@ -39,7 +45,8 @@ def sync_get_external_sensor_execution_data_grpc(
                 sensor_name=sensor_name,
                 last_completion_time=last_completion_time,
                 last_run_key=last_run_key,
-            )
+            ),
+            timeout=timeout,
         ),
         (ExternalSensorExecutionData, ExternalSensorExecutionErrorData),
     )
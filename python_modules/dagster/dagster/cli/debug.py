@@ -38,10 +38,9 @@ def export_command(run_id, output_file):
                 )
             )
 
-        debug_payload = DebugRunPayload.build(instance, run)
         with GzipFile(output_file, "wb") as file:
             click.echo("Exporting run_id '{}' to gzip output file {}.".format(run_id, output_file))
-            debug_payload.write(file)
+            DebugRunPayload.write_for_run(instance, run, file)
 
 
 debug_cli = create_debug_cli_group()
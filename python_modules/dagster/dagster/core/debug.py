@@ -1,10 +1,10 @@
 from collections import namedtuple
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.events.log import EventRecord
 from dagster.core.snap import ExecutionPlanSnapshot, PipelineSnapshot
 from dagster.core.storage.pipeline_run import PipelineRun
-from dagster.serdes import serialize_dagster_namedtuple, whitelist_for_serdes
+from dagster.serdes import pack_value, serialize_dagster_namedtuple, whitelist_for_serdes
 
 
 @whitelist_for_serdes
@@ -46,3 +46,41 @@ def build(cls, instance, run):
 
     def write(self, output_file):
         return output_file.write(serialize_dagster_namedtuple(self).encode())
+
+    @classmethod
+    def write_for_run(cls, instance, run, output_file):
+        """Write the debug payload for a run, streaming its event logs from the instance instead of
+        loading the whole event log into memory. The output is the same payload that
+        ``DebugRunPayload.build(instance, run).write(output_file)`` writes.
+        """
+        from dagster import __version__ as dagster_version
+
+        check.inst_param(run, "run", PipelineRun)
+
+        payload = seven.json.dumps(
+            {
+                "__class__": cls.__name__,
+                "version": dagster_version,
+                "pipeline_run": pack_value(run),
+                "pipeline_snapshot": pack_value(
+                    check.inst(
+                        instance.get_pipeline_snapshot(run.pipeline_snapshot_id), PipelineSnapshot,
+                    )
+                ),
+                "execution_plan_snapshot": pack_value(
+                    check.inst(
+                        instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id),
+                        ExecutionPlanSnapshot,
+                    )
+                ),
+            }
+        )
+
+        # splice the event list into the serialized payload object
+        output_file.write(payload[: -len("}")].encode())
+        output_file.write(', "event_list": ['.encode())
+        for i, event in enumerate(instance.iter_logs(run.run_id)):
+            if i:
+                output_file.write(", ".encode())
+            output_file.write(serialize_dagster_namedtuple(event).encode())
+        output_file.write("]}".encode())
@@ -60,6 +60,7 @@ def __init__(self, parent_definition, config_schema, config_or_config_fn):
         check.opt_inst_param(config_schema, "config_schema", DefinitionConfigSchema)
 
         self._current_field = config_schema.as_field() if config_schema else None
+        self._has_config_fn = callable(config_or_config_fn)
 
         if not callable(config_or_config_fn):
             check.invariant(
@@ -73,6 +74,12 @@ def __init__(self, parent_definition, config_schema, config_or_config_fn):
     def as_field(self):
         return self._current_field
 
+    @property
+    def has_config_fn(self):
+        """Whether the config is computed by a user-provided function, rather than given as a
+        value."""
+        return self._has_config_fn
+
     def _invoke_user_config_fn(self, processed_config):
         with user_code_error_boundary(
             DagsterConfigMappingFunctionError, _get_user_code_error_str_lambda(self.parent_def),
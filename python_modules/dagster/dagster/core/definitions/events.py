@@ -755,17 +755,29 @@ def __init__(self, max_retries=1, seconds_to_wait=None):
 class AssetStoreOperationType(Enum):
     SET_ASSET = "SET_ASSET"
     GET_ASSET = "GET_ASSET"
+    RM_ASSET = "RM_ASSET"
 
 
 @whitelist_for_serdes
 class AssetStoreOperation(
-    namedtuple("_AssetStoreOperation", "op step_output_handle asset_store_handle obj",)
+    namedtuple(
+        "_AssetStoreOperation",
+        "op step_output_handle asset_store_handle obj metadata_entries version",
+    )
 ):
     """
     Event related AssetStore
     """
 
-    def __new__(cls, op, step_output_handle, asset_store_handle, obj=None):
+    def __new__(
+        cls,
+        op,
+        step_output_handle,
+        asset_store_handle,
+        obj=None,
+        metadata_entries=None,
+        version=None,
+    ):
         from dagster.core.execution.plan.objects import StepOutputHandle
         from dagster.core.storage.asset_store import AssetStoreHandle
 
@@ -779,6 +791,10 @@ def __new__(cls, op, step_output_handle, asset_store_handle, obj=None):
                 asset_store_handle, "asset_store_handle", AssetStoreHandle
             ),
             obj=obj,
+            metadata_entries=check.opt_list_param(
+                metadata_entries, "metadata_entries", of_type=EventMetadataEntry
+            ),
+            version=check.opt_str_param(version, "version"),
         )
 
 
@@ -3,6 +3,7 @@
 from dagster import check
 from dagster.builtins import Int
 from dagster.config.field import Field
+from dagster.config.field_utils import Selector
 from dagster.core.definitions.configurable import ConfigurableDefinition
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
@@ -136,6 +137,23 @@ def in_process_executor(init_context):
     config_schema={
         "max_concurrent": Field(Int, is_required=False, default_value=0),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "start_method": Field(
+                    Selector(
+                        {
+                            "spawn": {},
+                            "forkserver": {"preload_modules": Field([str], is_required=False)},
+                        }
+                    ),
+                    is_required=False,
+                    default_value={"spawn": {}},
+                ),
+                "max_steps_per_worker": Field(Int, is_required=False),
+                "max_worker_memory_mb": Field(Int, is_required=False),
+            },
+            is_required=False,
+        ),
     },
 )
 def multiprocess_executor(init_context):
@@ -156,12 +174,37 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default, each step is executed in a new process, which imports the pipeline and builds its
+    execution plan before executing the step. The optional ``worker_pool`` config instead executes
+    the steps in a pool of long-lived worker processes, each of which loads the pipeline and the
+    execution plan once and then executes many steps:
+
+    .. code-block:: yaml
+
+        execution:
+          multiprocess:
+            config:
+              worker_pool:
+                start_method:
+                  forkserver:
+                    preload_modules: ["pandas", "my_repository"]
+                max_steps_per_worker: 50
+                max_worker_memory_mb: 4096
+
+    Workers are started with the ``spawn`` start method by default. With ``forkserver``, the
+    modules in ``preload_modules`` are imported once by the fork server, so that every worker
+    starts with them already imported. A worker is replaced with a new one once it has executed
+    ``max_steps_per_worker`` steps, or once its peak memory use reaches ``max_worker_memory_mb``.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
     """
     from dagster.core.executor.init import InitExecutorContext
-    from dagster.core.executor.multiprocess import MultiprocessExecutor
+    from dagster.core.executor.multiprocess import (
+        MultiprocessExecutor,
+        MultiprocessWorkerPoolConfig,
+    )
 
     check.inst_param(init_context, "init_context", InitExecutorContext)
 
@@ -171,6 +214,11 @@ def multiprocess_executor(init_context):
         pipeline=init_context.pipeline,
         max_concurrent=init_context.executor_config["max_concurrent"],
         retries=Retries.from_config(init_context.executor_config["retries"]),
+        worker_pool_config=MultiprocessWorkerPoolConfig.from_config(
+            init_context.executor_config["worker_pool"]
+        )
+        if "worker_pool" in init_context.executor_config
+        else None,
     )
 
 
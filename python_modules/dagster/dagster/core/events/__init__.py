@@ -780,6 +780,14 @@ def object_store_operation(step_context, object_store_operation_result):
                 object_store_name=object_store_name,
                 serialization_strategy_modifier=serialization_strategy_modifier,
             )
+        elif (
+            ObjectStoreOperationType(object_store_operation_result.op)
+            == ObjectStoreOperationType.RM_OBJECT
+        ):
+            message = (
+                "Removed intermediate object for output {value_name} from "
+                "{object_store_name}object store."
+            ).format(value_name=value_name, object_store_name=object_store_name)
         elif (
             ObjectStoreOperationType(object_store_operation_result.op)
             == ObjectStoreOperationType.CP_OBJECT
@@ -831,6 +839,15 @@ def asset_store_operation(step_context, asset_store_operation):
                 output_name=asset_store_operation.step_output_handle.output_name,
                 step_key=asset_store_operation.step_output_handle.step_key,
             )
+        elif AssetStoreOperationType(asset_store_operation.op) == AssetStoreOperationType.RM_ASSET:
+            message = (
+                'Removed output "{output_name}" from step "{step_key}" '
+                'using asset store "{asset_store_key}".'
+            ).format(
+                asset_store_key=asset_store_operation.asset_store_handle.asset_store_key,
+                output_name=asset_store_operation.step_output_handle.output_name,
+                step_key=asset_store_operation.step_output_handle.step_key,
+            )
         else:
             message = ""
 
@@ -842,6 +859,8 @@ def asset_store_operation(step_context, asset_store_operation):
                 step_key=asset_store_operation.step_output_handle.step_key,
                 output_name=asset_store_operation.step_output_handle.output_name,
                 asset_store_key=asset_store_operation.asset_store_handle.asset_store_key,
+                metadata_entries=asset_store_operation.metadata_entries,
+                version=asset_store_operation.version,
             ),
             message=message,
         )
@@ -946,9 +965,28 @@ class StepExpectationResultData(namedtuple("_StepExpectationResultData", "expect
 
 @whitelist_for_serdes
 class AssetStoreOperationData(
-    namedtuple("_AssetStoreOperationData", "op step_key output_name asset_store_key")
+    namedtuple(
+        "_AssetStoreOperationData",
+        "op step_key output_name asset_store_key metadata_entries version",
+    )
 ):
-    pass
+    # serdes log
+    # * added optional metadata_entries
+    # * added optional version
+    def __new__(
+        cls, op, step_key, output_name, asset_store_key, metadata_entries=None, version=None
+    ):
+        return super(AssetStoreOperationData, cls).__new__(
+            cls,
+            op=op,
+            step_key=step_key,
+            output_name=output_name,
+            asset_store_key=asset_store_key,
+            metadata_entries=check.opt_list_param(
+                metadata_entries, "metadata_entries", of_type=EventMetadataEntry
+            ),
+            version=check.opt_str_param(version, "version"),
+        )
 
 
 @whitelist_for_serdes
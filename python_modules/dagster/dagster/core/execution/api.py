@@ -162,7 +162,7 @@ def execute_run(pipeline, pipeline_run, instance, raise_on_error=False):
     )
 
     if is_memoized_run(pipeline_run.tags):
-        execution_plan = resolve_memoized_execution_plan(execution_plan)
+        execution_plan = resolve_memoized_execution_plan(execution_plan, instance=instance)
 
     _execute_run_iterable = _ExecuteRunWithPlanIterable(
         execution_plan=execution_plan,
@@ -4,6 +4,7 @@
 import os
 import subprocess
 import sys
+import threading
 import time
 import uuid
 import warnings
@@ -17,6 +18,11 @@
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
+# How often the in-process mirror checks the captured files for new output
+MIRROR_POLL_INTERVAL_SECONDS = 0.05
+
+MIRROR_READ_CHUNK_BYTES = 64 * 1024
+
 
 @contextmanager
 def redirect_to_file(stream, filepath):
@@ -81,10 +87,121 @@ def tail_to_stream(path, stream):
         with execute_windows_tail(path, stream) as pids:
             yield pids
     else:
-        with execute_posix_tail(path, stream) as pids:
+        with execute_in_process_tail(path, stream) as pids:
             yield pids
 
 
+class _MirroredFile:
+    def __init__(self, path, to_fd):
+        self._file = open(path, "rb")
+        # Only output written from now on is mirrored
+        self._file.seek(0, os.SEEK_END)
+        self._to_fd = to_fd
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def copy(self):
+        with self._lock:
+            if self._closed:
+                return
+
+            data = self._file.read(MIRROR_READ_CHUNK_BYTES)
+            while data:
+                _write_fully(self._to_fd, data)
+                data = self._file.read(MIRROR_READ_CHUNK_BYTES)
+
+    def close(self):
+        self.copy()
+        with self._lock:
+            self._closed = True
+            self._file.close()
+            os.close(self._to_fd)
+
+
+def _write_fully(fd, data):
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    except OSError:
+        # The stream being mirrored to has gone away, e.g. a closed pipe. The output is still
+        # captured in the file.
+        pass
+
+
+class _ComputeLogMirror:
+    """Copies the output appended to each captured file to the stream that was redirected into it,
+    using a single thread for all of the files captured by the process.
+    """
+
+    def __init__(self):
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._files = {}
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="compute-log-mirror")
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def pid(self):
+        return self._pid
+
+    def add(self, path, to_fd):
+        mirrored_file = _MirroredFile(path, to_fd)
+        with self._lock:
+            self._files[id(mirrored_file)] = mirrored_file
+        self._wakeup.set()
+        return mirrored_file
+
+    def remove(self, mirrored_file):
+        with self._lock:
+            del self._files[id(mirrored_file)]
+        # Copies any output the thread has not gotten to yet
+        mirrored_file.close()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                mirrored_files = list(self._files.values())
+
+            for mirrored_file in mirrored_files:
+                mirrored_file.copy()
+
+            self._wakeup.wait(MIRROR_POLL_INTERVAL_SECONDS if mirrored_files else None)
+            self._wakeup.clear()
+
+
+_MIRROR_LOCK = threading.Lock()
+_MIRROR = None
+
+
+def _get_compute_log_mirror():
+    global _MIRROR  # pylint: disable=global-statement
+
+    with _MIRROR_LOCK:
+        # The mirror thread does not survive a fork, so forked processes start their own
+        if _MIRROR is None or _MIRROR.pid != os.getpid():
+            _MIRROR = _ComputeLogMirror()
+        return _MIRROR
+
+
+@contextmanager
+def execute_in_process_tail(path, stream):
+    # Mirror the file to the stream from a thread in this process, rather than spawning a tail
+    # process (and a watcher process to clean it up) for every captured stream
+    fd = _fileno(stream)
+    if not fd:
+        yield (None, None)
+        return
+
+    mirror = _get_compute_log_mirror()
+    mirrored_file = mirror.add(path, os.dup(fd))
+    try:
+        yield (None, None)
+    finally:
+        mirror.remove(mirrored_file)
+
+
 @contextmanager
 def execute_windows_tail(path, stream):
     # Cannot use multiprocessing here because we already may be in a daemonized process
@@ -0,0 +1,137 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.definitions.events import (
+    AssetStoreOperation,
+    AssetStoreOperationType,
+    ObjectStoreOperation,
+)
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.context.system import SystemExecutionContext
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.instance import is_memoized_run
+from dagster.core.storage.object_manager import ObjectManager
+from dagster.core.storage.tags import GC_STEP_OUTPUTS_TAG
+
+
+def should_gc_step_outputs(tags):
+    return (
+        tags is not None
+        and tags.get(GC_STEP_OUTPUTS_TAG) == "true"
+        # memoized runs, and runs memoized against later, look step outputs up by version
+        and not is_memoized_run(tags)
+    )
+
+
+class StepOutputReferenceTracker:
+    """Reference counts the step outputs of an ExecutionPlan by the steps that consume them, so that
+    an output can be released as soon as it will not be read again during the run.
+
+    An output is released once every step that consumes it has succeeded. Outputs that are not
+    produced in this run, that have no consumers, or that are consumed by a step outside of the
+    steps to execute are never released, and neither are the inputs of a step that failed, was
+    skipped, or was abandoned, since re-executing that step from this run will need them.
+    """
+
+    def __init__(self, execution_plan, enabled=True):
+        check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+        check.bool_param(enabled, "enabled")
+
+        # step output handle -> keys of the consuming steps that have not yet succeeded
+        self._pending_consumers = defaultdict(set)
+        # step key -> handles of the step outputs it consumes
+        self._consumed_handles = defaultdict(set)
+
+        if not enabled:
+            return
+
+        step_keys_to_execute = set(execution_plan.step_keys_to_execute)
+        pinned = set()
+        for step in execution_plan.steps:
+            for step_input in step.step_inputs:
+                for handle in step_input.source.step_output_handle_dependencies:
+                    if (
+                        step.key not in step_keys_to_execute
+                        or handle.step_key not in step_keys_to_execute
+                    ):
+                        pinned.add(handle)
+                    else:
+                        self._pending_consumers[handle].add(step.key)
+                        self._consumed_handles[step.key].add(handle)
+
+        for handle in pinned:
+            self._pending_consumers.pop(handle, None)
+
+    def handle_event(self, dagster_event):
+        """Update the reference counts with an event from the execution of the plan.
+
+        Returns:
+            List[StepOutputHandle]: The step outputs that are no longer needed by any step.
+        """
+        check.inst_param(dagster_event, "dagster_event", DagsterEvent)
+
+        if not dagster_event.is_step_success:
+            return []
+
+        releasable = []
+        for handle in self._consumed_handles.pop(dagster_event.step_key, set()):
+            consumers = self._pending_consumers.get(handle)
+            if consumers is None:
+                continue
+
+            consumers.discard(dagster_event.step_key)
+            if not consumers:
+                del self._pending_consumers[handle]
+                releasable.append(handle)
+
+        return sorted(releasable)
+
+
+def release_step_outputs(pipeline_context, execution_plan, step_output_handles):
+    """Remove step outputs from the intermediate storage or object manager that stored them.
+
+    Yields the operations as events. Object managers that do not implement ``rm_output`` keep
+    their outputs.
+    """
+    check.inst_param(pipeline_context, "pipeline_context", SystemExecutionContext)
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.list_param(step_output_handles, "step_output_handles", of_type=StepOutputHandle)
+
+    for step_output_handle in step_output_handles:
+        step_context = pipeline_context.for_step(
+            execution_plan.get_step_by_key(step_output_handle.step_key)
+        )
+
+        if step_context.using_asset_store(step_output_handle):
+            from dagster.core.storage.asset_store import AssetStoreHandle
+
+            output_manager = step_context.get_output_manager(step_output_handle)
+            if not isinstance(output_manager, ObjectManager):
+                continue
+
+            if not output_manager.rm_output(step_context.get_output_context(step_output_handle)):
+                continue
+
+            output_def = execution_plan.get_step_output(step_output_handle).output_def
+            yield DagsterEvent.asset_store_operation(
+                step_context,
+                AssetStoreOperation(
+                    AssetStoreOperationType.RM_ASSET,
+                    step_output_handle,
+                    AssetStoreHandle(output_def.manager_key, output_def.metadata),
+                ),
+            )
+        else:
+            intermediate_storage = step_context.intermediate_storage
+            if not intermediate_storage.has_intermediate(step_context, step_output_handle):
+                continue
+
+            res = intermediate_storage.rm_intermediate(step_context, step_output_handle)
+            if isinstance(res, ObjectStoreOperation):
+                yield DagsterEvent.object_store_operation(
+                    step_context,
+                    ObjectStoreOperation.serializable(
+                        res, value_name=step_output_handle.output_name
+                    ),
+                )
@@ -84,7 +84,7 @@ def copy_required_intermediates_for_execution(pipeline_context, execution_plan):
     if not parent_run_id:
         return
 
-    parent_run_logs = pipeline_context.instance.all_logs(parent_run_id)
+    parent_run_logs = pipeline_context.instance.iter_logs(parent_run_id)
 
     output_handles_for_current_run = output_handles_from_execution_plan(execution_plan)
     output_handles_from_previous_run = output_handles_from_event_logs(parent_run_logs)
@@ -127,28 +127,27 @@ def is_intermediate_storage_write_event(record):
 
 
 def output_handles_from_event_logs(event_logs):
-    output_handles_from_previous_run = set()
-    failed_step_keys = set(
-        record.dagster_event.step_key
-        for record in event_logs
-        if record.dagster_event_type == DagsterEventType.STEP_FAILURE
-    )
+    # event_logs may be an iterator, so collect the handles and failed steps in a single pass
+    written_output_handles = set()
+    failed_step_keys = set()
 
     for record in event_logs:
-        if not is_intermediate_storage_write_event(record):
-            continue
+        if record.dagster_event_type == DagsterEventType.STEP_FAILURE:
+            failed_step_keys.add(record.dagster_event.step_key)
 
-        if record.dagster_event.step_key in failed_step_keys:
-            # skip output events from failed steps
+        if not is_intermediate_storage_write_event(record):
             continue
 
-        output_handles_from_previous_run.add(
+        written_output_handles.add(
             StepOutputHandle(
                 record.dagster_event.step_key, record.dagster_event.event_specific_data.value_name
             )
         )
 
-    return output_handles_from_previous_run
+    # skip output events from failed steps
+    return set(
+        handle for handle in written_output_handles if handle.step_key not in failed_step_keys
+    )
 
 
 def output_handles_from_execution_plan(execution_plan):
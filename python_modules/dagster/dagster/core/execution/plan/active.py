@@ -1,3 +1,5 @@
+import heapq
+import itertools
 import time
 
 from dagster import check
@@ -27,10 +29,37 @@ def __init__(self, execution_plan, retries, sort_key_fn=None):
         self._context_guard = False  # Prevent accidental direct use
 
         # All steps to be executed start out here in _pending
-        self._pending = self._plan.execution_deps()
-
-        # steps move in to these buckets as a result of _update calls
+        self._deps = self._plan.execution_deps()
+        self._pending = {key: set(requirements) for key, requirements in self._deps.items()}
+
+        # Reverse index of _deps, so that completing a step only has to look at the steps that
+        # directly depend on it
+        self._dependents = {key: [] for key in self._deps}
+        for key, requirements in self._deps.items():
+            for requirement in requirements:
+                self._dependents[requirement].append(key)
+
+        # For each pending step, the number of upstream steps that have not yet succeeded or
+        # skipped. A step is ready to be evaluated once this reaches zero.
+        self._unresolved_dep_counts = {
+            key: len(requirements) for key, requirements in self._deps.items()
+        }
+
+        # Ready steps are evaluated in the order they were added to _pending
+        self._pending_order = {}
+        self._pending_counter = itertools.count()
+        for key in self._pending:
+            self._pending_order[key] = next(self._pending_counter)
+        self._ready = set(key for key, count in self._unresolved_dep_counts.items() if count == 0)
+
+        # steps that reached a terminal state since the last _update call, as (step_key, is_ok)
+        self._newly_completed = []
+
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # of (sort key, insertion order, step key) so that steps with equal priority are vended in
+        # the order in which they became executable.
         self._executable = []
+        self._executable_counter = itertools.count()
         self._pending_skip = []
         self._pending_retry = []
         self._pending_abandon = []
@@ -66,7 +95,10 @@ def __exit__(self, exc_type, exc_value, traceback):
         # Requested termination is the only time we should be exiting incomplete without an exception
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [key for _sort_key, _order, key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             raise DagsterIncompleteExecutionPlanError(
                 "Execution of pipeline finished without completing the execution plan, "
@@ -105,20 +137,33 @@ def _update(self):
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
+        for completed_key, is_ok in self._newly_completed:
+            for step_key in self._dependents.get(completed_key, []):
+                if step_key not in self._pending:
+                    continue
+
+                # If any upstream deps failed - this is not executable
+                if not is_ok:
+                    new_steps_to_abandon.append(step_key)
+                    del self._pending[step_key]
+                    self._ready.discard(step_key)
+                    continue
+
+                self._unresolved_dep_counts[step_key] -= 1
+                if self._unresolved_dep_counts[step_key] == 0:
+                    self._ready.add(step_key)
+
+        self._newly_completed = []
 
-        for step_key, requirements in self._pending.items():
-            # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
+        for step_key in sorted(self._ready, key=self._pending_order.get):
+            requirements = self._pending.pop(step_key)
 
             # If all upstream deps are good - this is executable
-            elif requirements.issubset(self._success):
+            if requirements.issubset(self._success):
                 new_steps_to_execute.append(step_key)
 
             # If some upstream deps skipped...
-            elif requirements.issubset(successful_or_skipped_steps):
+            else:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step will skip
@@ -141,17 +186,16 @@ def _update(self):
                 else:
                     new_steps_to_execute.append(step_key)
 
+        self._ready = set()
+
         for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+            self._push_executable(key)
 
         for key in new_steps_to_skip:
             self._pending_skip.append(key)
-            del self._pending[key]
 
         for key in new_steps_to_abandon:
             self._pending_abandon.append(key)
-            del self._pending[key]
 
         ready_to_retry = []
         tick_time = time.time()
@@ -160,9 +204,27 @@ def _update(self):
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
+    def _push_executable(self, step_key):
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
+
+    def _add_pending(self, step_key):
+        requirements = self._deps[step_key]
+        self._pending[step_key] = set(requirements)
+        self._pending_order[step_key] = next(self._pending_counter)
+        self._unresolved_dep_counts[step_key] = len(requirements - self._success - self._skipped)
+        if self._unresolved_dep_counts[step_key] == 0:
+            self._ready.add(step_key)
+
     def sleep_til_ready(self):
         now = time.time()
         sleep_amt = min([ready_at - now for ready_at in self._waiting_to_retry.values()])
@@ -194,16 +256,13 @@ def get_steps_to_execute(self, limit=None):
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable], key=self._sort_key_fn
-        )
-
-        if limit:
-            steps = steps[:limit]
+        num_steps = min(limit, len(self._executable)) if limit else len(self._executable)
 
-        for step in steps:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
+        steps = []
+        for _ in range(num_steps):
+            _sort_key, _order, key = heapq.heappop(self._executable)
+            steps.append(self.get_step_by_key(key))
+            self._in_flight.add(key)
         return steps
 
     def get_steps_to_skip(self):
@@ -282,18 +341,22 @@ def plan_events_iterator(self, pipeline_context):
 
     def mark_failed(self, step_key):
         self._failed.add(step_key)
+        self._newly_completed.append((step_key, False))
         self._mark_complete(step_key)
 
     def mark_success(self, step_key):
         self._success.add(step_key)
+        self._newly_completed.append((step_key, True))
         self._mark_complete(step_key)
 
     def mark_skipped(self, step_key):
         self._skipped.add(step_key)
+        self._newly_completed.append((step_key, True))
         self._mark_complete(step_key)
 
     def mark_abandoned(self, step_key):
         self._abandoned.add(step_key)
+        self._newly_completed.append((step_key, False))
         self._mark_complete(step_key)
 
     def mark_interrupted(self, step_key):
@@ -314,11 +377,12 @@ def mark_up_for_retry(self, step_key, at_time=None):
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.execution_deps()[step_key]
+                self._add_pending(step_key)
 
         elif self._retries.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._newly_completed.append((step_key, False))
 
         self._retries.mark_attempt(step_key)
 
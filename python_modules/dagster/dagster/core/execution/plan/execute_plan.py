@@ -11,6 +11,11 @@
 )
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemExecutionContext, SystemStepExecutionContext
+from dagster.core.execution.gc import (
+    StepOutputReferenceTracker,
+    release_step_outputs,
+    should_gc_step_outputs,
+)
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster.core.execution.plan.inputs import (
@@ -34,11 +39,12 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan):
 
     yield from copy_required_intermediates_for_execution(pipeline_context, execution_plan)
 
-    with execution_plan.start(retries=retries) as active_execution:
+    # release step outputs as soon as every step that consumes them has succeeded
+    step_output_tracker = StepOutputReferenceTracker(
+        execution_plan, enabled=should_gc_step_outputs(pipeline_context.pipeline_run.tags)
+    )
 
-        # It would be good to implement a reference tracking algorithm here to
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
+    with execution_plan.start(retries=retries) as active_execution:
         while not active_execution.is_complete:
             step = active_execution.get_next_step()
             step_context = pipeline_context.for_step(step)
@@ -91,6 +97,11 @@ def inner_plan_execution_iterator(pipeline_context, execution_plan):
                         step_event_list.append(step_event)
                         yield step_event
                         active_execution.handle_event(step_event)
+                        yield from release_step_outputs(
+                            pipeline_context,
+                            execution_plan,
+                            step_output_tracker.handle_event(step_event),
+                        )
 
                 active_execution.verify_complete(pipeline_context, step.key)
 
@@ -1,6 +1,7 @@
 from dagster import check
 from dagster.core.definitions import (
     AssetMaterialization,
+    EventMetadataEntry,
     ExpectationResult,
     Failure,
     Materialization,
@@ -337,22 +338,30 @@ def _create_step_events_for_output(step_context, output):
 
 
 def _materializations_to_events(step_context, step_output_handle, materializations):
-    if materializations is not None:
-        for materialization in ensure_gen(materializations):
-            if not isinstance(materialization, AssetMaterialization):
-                raise DagsterInvariantViolationError(
-                    (
-                        "asset_store on output {output_name} has returned "
-                        "value {value} of type {python_type}. The return type can only be "
-                        "AssetMaterialization."
-                    ).format(
-                        output_name=step_output_handle.output_name,
-                        value=repr(materialization),
-                        python_type=type(materialization).__name__,
-                    )
+    for materialization in materializations:
+        if not isinstance(materialization, AssetMaterialization):
+            raise DagsterInvariantViolationError(
+                (
+                    "asset_store on output {output_name} has returned "
+                    "value {value} of type {python_type}. The return type can only be "
+                    "AssetMaterialization or EventMetadataEntry."
+                ).format(
+                    output_name=step_output_handle.output_name,
+                    value=repr(materialization),
+                    python_type=type(materialization).__name__,
                 )
+            )
+
+        yield DagsterEvent.step_materialization(step_context, materialization)
 
-            yield DagsterEvent.step_materialization(step_context, materialization)
+
+def _handle_output_results(results):
+    if results is None:
+        return []
+    if isinstance(results, list):
+        return results
+    # Results may be yielded lazily, so this consumes them while the output is being handled
+    return list(ensure_gen(results))
 
 
 def _set_objects(step_context, step_output, step_output_handle, output, version):
@@ -362,7 +371,20 @@ def _set_objects(step_context, step_output, step_output_handle, output, version)
     if step_context.using_asset_store(step_output_handle):
         output_manager = getattr(step_context.resources, output_def.manager_key)
         output_context = step_context.get_output_context(step_output_handle)
-        materializations = output_manager.handle_output(output_context, output.value)
+        with time_execution_scope() as timer_result:
+            materializations = _handle_output_results(
+                output_manager.handle_output(output_context, output.value)
+            )
+
+        # Metadata entries returned by the manager describe the store operation itself
+        metadata_entries = [
+            entry for entry in materializations if isinstance(entry, EventMetadataEntry)
+        ]
+        materializations = [
+            materialization
+            for materialization in materializations
+            if not isinstance(materialization, EventMetadataEntry)
+        ]
 
         for evt in _materializations_to_events(step_context, step_output_handle, materializations):
             yield evt
@@ -374,6 +396,11 @@ def _set_objects(step_context, step_output, step_output_handle, output, version)
                 AssetStoreOperationType.SET_ASSET,
                 step_output_handle,
                 AssetStoreHandle(output_def.manager_key, output_def.metadata),
+                metadata_entries=[
+                    EventMetadataEntry.float(timer_result.millis, "duration_ms", "Time to store")
+                ]
+                + metadata_entries,
+                version=version,
             ),
         )
     else:
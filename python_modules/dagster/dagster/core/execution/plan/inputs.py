@@ -3,10 +3,15 @@
 from collections import namedtuple
 
 from dagster import check
-from dagster.core.definitions.events import AssetStoreOperation, AssetStoreOperationType
+from dagster.core.definitions.events import (
+    AssetStoreOperation,
+    AssetStoreOperationType,
+    EventMetadataEntry,
+)
 from dagster.core.definitions.input import InputDefinition
 from dagster.core.errors import DagsterTypeLoadingError, user_code_error_boundary
 from dagster.core.storage.input_manager import InputManager
+from dagster.utils.timing import time_execution_scope
 
 
 def join_and_hash(*args):
@@ -138,7 +143,8 @@ def load_input_object(self, step_context):
                 f'"{step_context.execution_plan.get_manager_key(source_handle)}" is an InputManager.',
             )
 
-            obj = object_manager.load_input(self.get_load_context(step_context))
+            with time_execution_scope() as timer_result:
+                obj = object_manager.load_input(self.get_load_context(step_context))
 
             output_def = step_context.execution_plan.get_step_output(source_handle).output_def
 
@@ -149,6 +155,9 @@ def load_input_object(self, step_context):
                 source_handle,
                 AssetStoreHandle(output_def.manager_key, output_def.metadata),
                 obj=obj,
+                metadata_entries=[
+                    EventMetadataEntry.float(timer_result.millis, "duration_ms", "Time to load")
+                ],
             )
         else:
             return step_context.intermediate_storage.get_intermediate(
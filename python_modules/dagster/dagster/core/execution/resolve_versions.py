@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from dagster import check
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution.context.init import InitResourceContext
@@ -8,6 +10,10 @@
 
 from .plan.inputs import join_and_hash
 
+# The maximum number of step outputs whose existence is probed at a time when resolving a memoized
+# execution plan
+MAX_CONCURRENT_ASSET_PROBES = 8
+
 
 def resolve_config_version(config_value):
     """Resolve a configuration value into a hashed version.
@@ -135,15 +141,50 @@ def resolve_step_output_versions_helper(execution_plan):
     }
 
 
+def _get_object_manager(execution_plan, manager_key):
+    environment_config = execution_plan.environment_config
+    pipeline_def = execution_plan.pipeline.get_definition()
+    mode_def = pipeline_def.get_mode_definition(environment_config.mode)
+
+    # TODO: https://github.com/dagster-io/dagster/issues/3302
+    # The following code block is HIGHLY experimental. It initializes an asset store outside of
+    # the resource initialization context, and will ignore any exit hooks defined for the asset
+    # store.
+    resource_config = (
+        environment_config.resources[manager_key]["config"]
+        if "config" in environment_config.resources[manager_key]
+        else {}
+    )
+    resource_def = mode_def.resource_defs[manager_key]
+    resource_context = InitResourceContext(resource_config, pipeline_def, resource_def, "")
+    return resource_def.resource_fn(resource_context)
+
+
+def _has_asset(execution_plan, object_manager, step_output_handle):
+    context = get_output_context(
+        execution_plan, execution_plan.environment_config, step_output_handle, None
+    )
+    return object_manager.has_asset(AssetStoreContext.from_output_context(context))
+
+
 @experimental
-def resolve_memoized_execution_plan(execution_plan):
+def resolve_memoized_execution_plan(execution_plan, instance=None):
     """
+        Step outputs whose versions are indexed by the instance's event log storage are found with a
+        single lookup. The remaining step outputs are probed with ``has_asset`` on their object
+        managers, concurrently.
+
+        Args:
+            execution_plan (ExecutionPlan): The execution plan to memoize.
+            instance (Optional[DagsterInstance]): The instance whose event log storage indexes the
+                versions of previously stored step outputs.
+
         Returns:
             ExecutionPlan: Execution plan configured to only run unmemoized steps.
         """
-    # pylint: disable=comparison-with-callable
+    from dagster.core.instance import DagsterInstance
 
-    pipeline_def = execution_plan.pipeline.get_definition()
+    check.opt_inst_param(instance, "instance", DagsterInstance)
 
     step_output_versions = execution_plan.resolve_step_output_versions()
     if all(version is None for version in step_output_versions.values()):
@@ -152,28 +193,59 @@ def resolve_memoized_execution_plan(execution_plan):
             "must have a version."
         )
 
-    environment_config = execution_plan.environment_config
-    pipeline_def = execution_plan.pipeline.get_definition()
-    mode_def = pipeline_def.get_mode_definition(environment_config.mode)
+    pipeline_name = execution_plan.pipeline.get_definition().name
+    addresses = (
+        instance.get_addresses_for_step_output_versions(
+            {
+                (pipeline_name, step_output_handle): version
+                for step_output_handle, version in step_output_versions.items()
+                if version is not None
+            }
+        )
+        if instance
+        else {}
+    )
+    unresolved_handles = [
+        step_output_handle
+        for step_output_handle in step_output_versions.keys()
+        if addresses.get((pipeline_name, step_output_handle)) is None
+    ]
+
+    # object managers are initialized once per manager key and shared across their step outputs
+    object_managers = {}
+    for step_output_handle in unresolved_handles:
+        manager_key = execution_plan.get_manager_key(step_output_handle)
+        if manager_key not in object_managers:
+            object_managers[manager_key] = _get_object_manager(execution_plan, manager_key)
+
+    if len(unresolved_handles) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(unresolved_handles), MAX_CONCURRENT_ASSET_PROBES),
+            thread_name_prefix="dagster_memoization",
+        ) as executor:
+            has_assets = list(
+                executor.map(
+                    lambda step_output_handle: _has_asset(
+                        execution_plan,
+                        object_managers[execution_plan.get_manager_key(step_output_handle)],
+                        step_output_handle,
+                    ),
+                    unresolved_handles,
+                )
+            )
+    else:
+        has_assets = [
+            _has_asset(
+                execution_plan,
+                object_managers[execution_plan.get_manager_key(step_output_handle)],
+                step_output_handle,
+            )
+            for step_output_handle in unresolved_handles
+        ]
 
     step_keys_to_execute = []
-
-    for step_output_handle in step_output_versions.keys():
-        manager_key = execution_plan.get_manager_key(step_output_handle)
-        # TODO: https://github.com/dagster-io/dagster/issues/3302
-        # The following code block is HIGHLY experimental. It initializes an asset store outside of
-        # the resource initialization context, and will ignore any exit hooks defined for the asset
-        # store.
-        resource_config = (
-            environment_config.resources[manager_key]["config"]
-            if "config" in environment_config.resources[manager_key]
-            else {}
-        )
-        resource_def = mode_def.resource_defs[manager_key]
-        resource_context = InitResourceContext(resource_config, pipeline_def, resource_def, "")
-        object_manager = resource_def.resource_fn(resource_context)
-        context = get_output_context(execution_plan, environment_config, step_output_handle, None)
-        if not object_manager.has_asset(AssetStoreContext.from_output_context(context)):
+    for step_output_handle, has_asset in zip(unresolved_handles, has_assets):
+        if not has_asset and step_output_handle.step_key not in step_keys_to_execute:
             step_keys_to_execute.append(step_output_handle.step_key)
 
     return execution_plan.build_subset_plan(step_keys_to_execute)
@@ -1,15 +1,15 @@
 """Facilities for running arbitrary commands in child processes."""
 
 import os
-import queue
 import sys
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
+from contextlib import ExitStack
 
 import six
 from dagster import check
-from dagster.seven import multiprocessing
-from dagster.utils import delay_interrupts
+from dagster.seven import IS_WINDOWS, multiprocessing
+from dagster.utils import delay_interrupts, start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 
 
@@ -31,6 +31,13 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerRetiringEvent(
+    namedtuple("ChildProcessWorkerRetiringEvent", "pid"), ChildProcessEvent
+):
+    """Sent by a ChildProcessWorker before the end of the command it is executing, if it will exit
+    instead of executing further commands."""
+
+
 class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     """Inherit from this class in order to use this library.
 
@@ -50,59 +57,425 @@ def __init__(self, exit_code=None):
         self.exit_code = exit_code
 
 
-def _execute_command_in_child_process(event_queue, command):
+def _execute_command_in_child_process(event_writer, command):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process."""
+    Handles errors and communicates across a pipe with the parent process."""
 
     check.inst_param(command, "command", ChildProcessCommand)
 
     with delay_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        try:
+            event_writer.send(ChildProcessStartEvent(pid=pid))
+            try:
+                for step_event in command.execute():
+                    event_writer.send(step_event)
+                event_writer.send(ChildProcessDoneEvent(pid=pid))
+            except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
+                event_writer.send(
+                    ChildProcessSystemErrorEvent(
+                        pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                )
+        finally:
+            event_writer.close()
+
+
+def _execute_commands_in_worker(
+    command_reader, event_writer, term_event, max_commands, max_memory_mb
+):
+    """Executes the commands received from the parent process one at a time, until the parent
+    closes the worker or the worker has reached one of its limits."""
+
+    global _worker_exit_stack  # pylint: disable=global-statement
+
+    start_termination_thread(term_event)
+
+    num_commands = 0
+    with ExitStack() as _worker_exit_stack:
+        try:
+            while True:
+                try:
+                    command = command_reader.recv()
+                except EOFError:
+                    return
+
+                if command is None:
+                    return
+
+                num_commands += 1
+                if not _execute_command_in_worker(
+                    event_writer,
+                    command,
+                    should_retire=lambda: bool(
+                        (max_commands and num_commands >= max_commands)
+                        or (max_memory_mb and _get_peak_memory_mb() >= max_memory_mb)
+                    ),
+                ):
+                    return
+        finally:
+            event_writer.close()
+            command_reader.close()
+
+
+def _execute_command_in_worker(event_writer, command, should_retire):
+    """Executes a single command in a ChildProcessWorker. Returns whether the worker goes on to
+    execute further commands, which it doesn't if ``should_retire()`` once the command is done."""
+
+    check.inst_param(command, "command", ChildProcessCommand)
+
+    with delay_interrupts():
+        pid = os.getpid()
+        event_writer.send(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_writer.send(step_event)
         except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
-            event_queue.put(
+            # The state of the worker is unknown after an error, so it doesn't go on
+            event_writer.send(ChildProcessWorkerRetiringEvent(pid=pid))
+            event_writer.send(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+            return False
+
+        # The parent must know whether the worker is retiring by the time the command is done, so
+        # that it doesn't send the worker another command
+        retiring = should_retire()
+        if retiring:
+            event_writer.send(ChildProcessWorkerRetiringEvent(pid=pid))
+        event_writer.send(ChildProcessDoneEvent(pid=pid))
+        return not retiring
+
+
+_worker_exit_stack = None
+
+
+def get_worker_exit_stack():
+    """Returns the ExitStack of the ChildProcessWorker that the current process is running, or None
+    if it isn't running one.
+
+    Commands that cache state in the worker to reuse it for later commands use this to clean up the
+    state once the worker exits.
+    """
+    return _worker_exit_stack
+
+
+def _get_peak_memory_mb():
+    if IS_WINDOWS:
+        return 0
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
 
 
 TICK = 20.0 * 1.0 / 1000.0
-"""The minimum interval at which to check for child process liveness -- default 20ms."""
+"""The maximum interval for which to block waiting for child process events -- default 20ms."""
 
-PROCESS_DEAD_AND_QUEUE_EMPTY = "PROCESS_DEAD_AND_QUEUE_EMPTY"
-"""Sentinel value."""
+EVENT_BATCH_SIZE = 100
+"""The maximum number of events to read from a child process before giving other child processes a
+turn."""
 
 
-def _poll_for_event(process, event_queue):
-    try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
+class _ChildProcessExecutionEvents(six.with_metaclass(ABCMeta)):
+    """Reads the events that a child process sends over a pipe while it executes a command."""
+
+    def __init__(self, event_reader):
+        self._event_reader = event_reader
+        self._completed_properly = False
+        self._is_done = False
+
+    @property
+    def connection(self):
+        return self._event_reader
+
+    @property
+    def is_done(self):
+        return self._is_done
+
+    def iter_ready_events(self):
+        """Yields up to EVENT_BATCH_SIZE of the events that the child process has sent so far,
+        without blocking.
+
+        Raises ChildProcessCrashException if the child process exits before it completes.
+        """
+        num_events = 0
+        while not self._is_done and num_events < EVENT_BATCH_SIZE and self._event_reader.poll():
+            num_events += 1
+            try:
+                event = self._event_reader.recv()
+            except EOFError:
+                self._is_done = True
+                self._finish()
+                return
+
+            self._handle_event(event)
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                self._completed_properly = True
+                self._is_done = True
+                self._finish()
+
+    def _handle_event(self, event):
+        pass
+
+    @abstractmethod
+    def _finish(self):
+        """Called once the child process has sent its last event, or has gone away."""
+
+
+class ChildProcessCommandExecution(_ChildProcessExecutionEvents):
+    """A ChildProcessCommand executing in a child process.
+
+    The child process sends its events to the parent over a pipe. ``connection`` becomes ready
+    whenever the child has sent events or has exited, so the executions of several commands can be
+    multiplexed by waiting on their connections with ``multiprocessing.connection.wait``.
+    """
+
+    def __init__(self, command):
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        event_reader, event_writer = multiprocessing.Pipe(duplex=False)
+        try:
+            self._process = multiprocessing.Process(
+                target=_execute_command_in_child_process, args=(event_writer, command)
+            )
+            self._process.start()
+        finally:
+            # Only the child holds the writing end open, so the pipe reaches EOF once it exits
+            event_writer.close()
+
+        super(ChildProcessCommandExecution, self).__init__(event_reader)
+
+    def _finish(self):
+        self._process.join()
+        self._event_reader.close()
+
+        if not self._completed_properly:
+            # TODO Figure out what to do about stderr/stdout
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+    def close(self):
+        self._event_reader.close()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands sent to it, one at a time.
+
+    Each command is executed and reports its events the same way as in a child process of its own,
+    but anything the commands load, such as imported modules, is kept for the following commands.
+
+    Args:
+        start_method (Optional[str]): The multiprocessing start method used to start the worker
+            process. (default: spawn)
+        max_commands (Optional[int]): The worker exits once it has executed this many commands.
+        max_memory_mb (Optional[int]): The worker exits once a command it executed leaves its peak
+            memory use (RSS) at or above this many megabytes. Not supported on Windows.
+    """
+
+    def __init__(self, start_method=None, max_commands=None, max_memory_mb=None):
+        check.opt_str_param(start_method, "start_method")
+        check.opt_int_param(max_commands, "max_commands")
+        check.opt_int_param(max_memory_mb, "max_memory_mb")
+
+        context = multiprocessing.get_context(start_method) if start_method else multiprocessing
+        self._term_event = context.Event()
+        command_reader, self._command_writer = context.Pipe(duplex=False)
+        self._event_reader, event_writer = context.Pipe(duplex=False)
+        try:
+            self._process = context.Process(
+                target=_execute_commands_in_worker,
+                args=(command_reader, event_writer, self._term_event, max_commands, max_memory_mb),
+            )
+            self._process.start()
+        finally:
+            command_reader.close()
+            event_writer.close()
+
+        self._execution = None
+        self._retiring = False
+        self._closed = False
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def term_event(self):
+        """Setting this event interrupts the command that the worker is executing."""
+        return self._term_event
+
+    @property
+    def is_available(self):
+        """Whether the worker can execute another command."""
+        return (
+            not self._execution
+            and not self._retiring
+            and not self._closed
+            and self._process.is_alive()
+        )
+
+    @property
+    def is_closed(self):
+        return self._closed
+
+    def execute(self, command):
+        """Starts executing a ChildProcessCommand in the worker.
+
+        Returns:
+            ChildProcessWorkerCommandExecution: The execution of the command, which must be closed
+            before the worker executes another command.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self.is_available, "Worker is not available to execute a command")
+
+        self._command_writer.send(command)
+        self._execution = ChildProcessWorkerCommandExecution(self, self._event_reader)
+        return self._execution
+
+    def _on_retiring(self):
+        self._retiring = True
+
+    def _on_execution_done(self, crashed):
+        if crashed or self._retiring:
+            self._process.join()
+            self._close_pipes()
+
+    def _on_execution_closed(self):
+        self._execution = None
+
+    @property
+    def exitcode(self):
+        return self._process.exitcode
+
+    def close(self):
+        """Stops the worker once it has finished executing its current command, if any."""
+        if self._closed:
+            return
+
+        if self._process.is_alive() and not self._retiring:
             try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+                self._command_writer.send(None)
+            except (OSError, EOFError):
+                pass
+
+        self._process.join()
+        self._close_pipes()
+
+    def _close_pipes(self):
+        self._closed = True
+        self._command_writer.close()
+        self._event_reader.close()
+
+
+class ChildProcessWorkerCommandExecution(_ChildProcessExecutionEvents):
+    """A ChildProcessCommand executing in a ChildProcessWorker. It has the same interface as a
+    ChildProcessCommandExecution."""
+
+    def __init__(self, worker, event_reader):
+        self._worker = check.inst_param(worker, "worker", ChildProcessWorker)
+        super(ChildProcessWorkerCommandExecution, self).__init__(event_reader)
+
+    def _handle_event(self, event):
+        if isinstance(event, ChildProcessWorkerRetiringEvent):
+            self._worker._on_retiring()  # pylint: disable=protected-access
+
+    def _finish(self):
+        self._worker._on_execution_done(  # pylint: disable=protected-access
+            crashed=not self._completed_properly
+        )
+
+        if not self._completed_properly:
+            raise ChildProcessCrashException(exit_code=self._worker.exitcode)
 
-    return None
+    def close(self):
+        self._worker._on_execution_closed()  # pylint: disable=protected-access
+
+
+class ChildProcessWorkerPool:
+    """Executes ChildProcessCommands in long-lived ChildProcessWorkers, starting workers as they are
+    needed. Workers that reach one of their limits are replaced with new workers.
+
+    Args:
+        start_method (Optional[str]): The multiprocessing start method used to start the workers.
+            (default: spawn)
+        preload_modules (Optional[List[str]]): Modules that the forkserver imports before forking
+            the workers, so that the workers start with them already imported. Only supported
+            with the forkserver start method.
+        max_commands_per_worker (Optional[int]): Each worker exits once it has executed this many
+            commands.
+        max_worker_memory_mb (Optional[int]): Each worker exits once its peak memory use reaches
+            this many megabytes.
+    """
+
+    def __init__(
+        self,
+        start_method=None,
+        preload_modules=None,
+        max_commands_per_worker=None,
+        max_worker_memory_mb=None,
+    ):
+        self._start_method = check.opt_str_param(start_method, "start_method")
+        preload_modules = check.opt_list_param(preload_modules, "preload_modules", of_type=str)
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
+
+        if preload_modules:
+            check.invariant(
+                start_method == "forkserver",
+                "preload_modules is only supported with the forkserver start method",
+            )
+            # Only takes effect if the forkserver has not been started yet by this process
+            multiprocessing.get_context("forkserver").set_forkserver_preload(preload_modules)
+
+        self._workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def get_worker(self):
+        """Returns a worker that is available to execute a command, starting a new one if none of
+        the existing workers is available."""
+        for worker in self._workers:
+            if worker.is_available:
+                return worker
+
+        worker = ChildProcessWorker(
+            start_method=self._start_method,
+            max_commands=self._max_commands_per_worker,
+            max_memory_mb=self._max_worker_memory_mb,
+        )
+        # Workers that have exited are no longer needed
+        self._workers = [
+            existing_worker for existing_worker in self._workers if not existing_worker.is_closed
+        ] + [worker]
+        return worker
+
+    def close(self):
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
 
 
 def execute_child_process_command(command):
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; waits for events sent by the child process until the
+    process completes or dies.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -117,6 +490,9 @@ def execute_child_process_command(command):
 
         * The actual values yielded by the child process command
 
+    To multiplex many child processes without polling each of them in turn, use
+    ChildProcessCommandExecution directly and wait on the connections of all of them.
+
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
 
@@ -126,30 +502,13 @@ def execute_child_process_command(command):
 
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing.Queue()
+    execution = ChildProcessCommandExecution(command)
     try:
-        process = multiprocessing.Process(
-            target=_execute_command_in_child_process, args=(event_queue, command)
-        )
-        process.start()
-
-        completed_properly = False
-
-        while not completed_properly:
-            event = _poll_for_event(process, event_queue)
-
-            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-                break
-
-            yield event
-
-            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-                completed_properly = True
-
-        if not completed_properly:
-            # TODO Figure out what to do about stderr/stdout
-            raise ChildProcessCrashException(exit_code=process.exitcode)
+        while not execution.is_done:
+            if not execution.connection.poll(TICK):
+                yield None
+                continue
 
-        process.join()
+            yield from execution.iter_ready_events()
     finally:
-        event_queue.close()
+        execution.close()
@@ -1,5 +1,8 @@
 import os
 import sys
+from collections import namedtuple
+from contextlib import ExitStack
+from multiprocessing import connection as multiprocessing_connection
 
 from dagster import EventMetadataEntry, check
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
@@ -7,22 +10,32 @@
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.gc import (
+    StepOutputReferenceTracker,
+    release_step_outputs,
+    should_gc_step_outputs,
+)
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import Retries
 from dagster.core.executor.base import Executor
 from dagster.core.instance import DagsterInstance
+from dagster.core.system_config.objects import seed_environment_config_cache
+from dagster.serdes import serialize_dagster_namedtuple
 from dagster.seven import multiprocessing
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    TICK,
     ChildProcessCommand,
+    ChildProcessCommandExecution,
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
-    execute_child_process_command,
+    ChildProcessWorkerPool,
+    get_worker_exit_stack,
 )
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
@@ -30,9 +43,20 @@
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
-        self, run_config, pipeline_run, step_key, instance_ref, term_event, recon_pipeline, retries,
+        self,
+        run_config,
+        pipeline_run,
+        step_key,
+        instance_ref,
+        term_event,
+        recon_pipeline,
+        retries,
+        environment_config=None,
     ):
         self.run_config = run_config
+        # the run config as processed by the parent process, so that the child doesn't validate it
+        # again
+        self.environment_config = environment_config
         self.pipeline_run = pipeline_run
         self.step_key = step_key
         self.instance_ref = instance_ref
@@ -41,47 +65,140 @@ def __init__(
         self.retries = retries
 
     def execute(self):
-        pipeline = self.recon_pipeline
-        with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
-
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
-            ).build_subset_plan([self.step_key])
-
-            yield instance.report_engine_event(
-                "Executing step {} in subprocess".format(self.step_key),
-                self.pipeline_run,
-                EngineEventData(
-                    [
-                        EventMetadataEntry.text(str(os.getpid()), "pid"),
-                        EventMetadataEntry.text(self.step_key, "step_key"),
-                    ],
-                    marker_end=DELEGATE_MARKER,
-                ),
-                MultiprocessExecutor,
-                self.step_key,
+        worker_exit_stack = get_worker_exit_stack()
+        if worker_exit_stack is None:
+            with DagsterInstance.from_ref(self.instance_ref) as instance:
+                start_termination_thread(self.term_event)
+                yield from self._execute_step(instance, self._create_execution_plan())
+        else:
+            # Workers are interrupted through the termination event of the worker rather than that
+            # of the step, and only load the instance and the execution plan of the run once
+            yield from self._execute_step(
+                _get_worker_instance(worker_exit_stack, self.instance_ref),
+                _get_worker_execution_plan(self),
             )
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                self.pipeline_run,
-                run_config=self.run_config,
-                retries=self.retries.for_inner_plan(),
-                instance=instance,
+    def _create_execution_plan(self):
+        if self.environment_config is not None:
+            seed_environment_config_cache(
+                self.recon_pipeline.get_definition(), self.environment_config
             )
 
+        return create_execution_plan(
+            pipeline=self.recon_pipeline,
+            run_config=self.run_config,
+            mode=self.pipeline_run.mode,
+            step_keys_to_execute=self.pipeline_run.step_keys_to_execute,
+        )
+
+    def _execute_step(self, instance, execution_plan):
+        execution_plan = execution_plan.build_subset_plan([self.step_key])
+
+        yield instance.report_engine_event(
+            "Executing step {} in subprocess".format(self.step_key),
+            self.pipeline_run,
+            EngineEventData(
+                [
+                    EventMetadataEntry.text(str(os.getpid()), "pid"),
+                    EventMetadataEntry.text(self.step_key, "step_key"),
+                ],
+                marker_end=DELEGATE_MARKER,
+            ),
+            MultiprocessExecutor,
+            self.step_key,
+        )
+
+        yield from execute_plan_iterator(
+            execution_plan,
+            self.pipeline_run,
+            run_config=self.run_config,
+            retries=self.retries.for_inner_plan(),
+            instance=instance,
+        )
+
+
+# The instances and execution plans loaded by a worker process, keyed by the serialized instance
+# ref and by run id respectively. A worker executes the steps of a single run, so these hold one
+# entry each.
+_worker_instances = {}
+_worker_execution_plans = {}
+
+
+def _get_worker_instance(worker_exit_stack, instance_ref):
+    key = serialize_dagster_namedtuple(instance_ref)
+    if key not in _worker_instances:
+        _worker_instances[key] = worker_exit_stack.enter_context(
+            DagsterInstance.from_ref(instance_ref)
+        )
+    return _worker_instances[key]
+
+
+def _get_worker_execution_plan(command):
+    run_id = command.pipeline_run.run_id
+    if run_id not in _worker_execution_plans:
+        _worker_execution_plans.clear()
+        _worker_execution_plans[
+            run_id
+        ] = command._create_execution_plan()  # pylint: disable=protected-access
+    return _worker_execution_plans[run_id]
+
+
+class MultiprocessWorkerPoolConfig(
+    namedtuple(
+        "_MultiprocessWorkerPoolConfig",
+        "start_method preload_modules max_steps_per_worker max_worker_memory_mb",
+    )
+):
+    """How the MultiprocessExecutor runs steps in a pool of long-lived worker processes, rather
+    than in a new process for each step."""
+
+    def __new__(
+        cls,
+        start_method=None,
+        preload_modules=None,
+        max_steps_per_worker=None,
+        max_worker_memory_mb=None,
+    ):
+        return super(MultiprocessWorkerPoolConfig, cls).__new__(
+            cls,
+            start_method=check.opt_str_param(start_method, "start_method", "spawn"),
+            preload_modules=check.opt_list_param(preload_modules, "preload_modules", of_type=str),
+            max_steps_per_worker=check.opt_int_param(max_steps_per_worker, "max_steps_per_worker"),
+            max_worker_memory_mb=check.opt_int_param(max_worker_memory_mb, "max_worker_memory_mb"),
+        )
+
+    @staticmethod
+    def from_config(config):
+        check.dict_param(config, "config")
+        start_method, start_method_config = list(config.get("start_method", {"spawn": {}}).items())[
+            0
+        ]
+        return MultiprocessWorkerPoolConfig(
+            start_method=start_method,
+            preload_modules=(start_method_config or {}).get("preload_modules"),
+            max_steps_per_worker=config.get("max_steps_per_worker"),
+            max_worker_memory_mb=config.get("max_worker_memory_mb"),
+        )
+
+    def create_pool(self):
+        return ChildProcessWorkerPool(
+            start_method=self.start_method,
+            preload_modules=self.preload_modules,
+            max_commands_per_worker=self.max_steps_per_worker,
+            max_worker_memory_mb=self.max_worker_memory_mb,
+        )
+
 
 class MultiprocessExecutor(Executor):
-    def __init__(self, pipeline, retries, max_concurrent=None):
+    def __init__(self, pipeline, retries, max_concurrent=None, worker_pool_config=None):
 
         self.pipeline = check.inst_param(pipeline, "pipeline", ReconstructablePipeline)
         self._retries = check.inst_param(retries, "retries", Retries)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, "max_concurrent")
+        self.worker_pool_config = check.opt_inst_param(
+            worker_pool_config, "worker_pool_config", MultiprocessWorkerPoolConfig
+        )
 
     @property
     def retries(self):
@@ -103,14 +220,22 @@ def execute(self, pipeline_context, execution_plan):
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collect results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
+        # release step outputs as soon as every step that consumes them has succeeded
+        step_output_tracker = StepOutputReferenceTracker(
+            execution_plan, enabled=should_gc_step_outputs(pipeline_context.pipeline_run.tags)
+        )
+
+        with time_execution_scope() as timer_result, ExitStack() as stack:
+            worker_pool = (
+                stack.enter_context(self.worker_pool_config.create_pool())
+                if self.worker_pool_config
+                else None
+            )
             with execution_plan.start(retries=self.retries) as active_execution:
                 active_iters = {}
                 errors = {}
                 term_events = {}
+                connections = {}
                 stopping = False
 
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -139,19 +264,36 @@ def execute(self, pipeline_context, execution_plan):
                             step_context = pipeline_context.for_step(step)
                             term_events[step.key] = multiprocessing.Event()
                             active_iters[step.key] = self.execute_step_out_of_process(
-                                step_context, step, errors, term_events
+                                step_context, step, errors, term_events, connections, worker_pool
                             )
 
+                    # Sleep until any child process sends events or exits. Iterators that haven't
+                    # started their child process yet are always advanced.
+                    ready_connections = set(
+                        multiprocessing_connection.wait(
+                            list(connections.values()),
+                            timeout=0 if len(connections) < len(active_iters) else TICK,
+                        )
+                    )
+
                     # process active iterators
                     empty_iters = []
                     for key, step_iter in active_iters.items():
+                        if key in connections and connections[key] not in ready_connections:
+                            continue
+
                         try:
+                            # drain all the events that are ready for this step
                             event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
+                            while event_or_none is not None:
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
+                                yield from release_step_outputs(
+                                    pipeline_context,
+                                    execution_plan,
+                                    step_output_tracker.handle_event(event_or_none),
+                                )
+                                event_or_none = next(step_iter)
 
                         except ChildProcessCrashException as crash:
                             serializable_error = serializable_error_info_from_exc_info(
@@ -211,29 +353,55 @@ def execute(self, pipeline_context, execution_plan):
             event_specific_data=EngineEventData.multiprocess(os.getpid()),
         )
 
-    def execute_step_out_of_process(self, step_context, step, errors, term_events):
+    def execute_step_out_of_process(
+        self, step_context, step, errors, term_events, connections, worker_pool=None
+    ):
+        worker = worker_pool.get_worker() if worker_pool else None
+        if worker:
+            # A worker is interrupted through its own termination event, since events can only be
+            # shared with a process when it starts
+            if term_events[step.key].is_set():
+                worker.term_event.set()
+            term_events[step.key] = worker.term_event
+
         command = InProcessExecutorChildProcessCommand(
             run_config=step_context.run_config,
             pipeline_run=step_context.pipeline_run,
             step_key=step.key,
             instance_ref=step_context.instance.get_ref(),
-            term_event=term_events[step.key],
+            term_event=None if worker else term_events[step.key],
             recon_pipeline=self.pipeline,
             retries=self.retries,
+            environment_config=step_context.environment_config,
         )
 
         yield DagsterEvent.engine_event(
             step_context,
-            "Launching subprocess for {}".format(step.key),
+            "Launching subprocess for {}".format(step.key)
+            if not worker
+            else "Executing {} in worker process (pid: {})".format(step.key, worker.pid),
             EngineEventData(marker_start=DELEGATE_MARKER),
             step_key=step.key,
         )
 
-        for ret in execute_child_process_command(command):
-            if ret is None or isinstance(ret, DagsterEvent):
-                yield ret
-            elif isinstance(ret, ChildProcessEvent):
-                if isinstance(ret, ChildProcessSystemErrorEvent):
-                    errors[ret.pid] = ret.error_info
-            else:
-                check.failed("Unexpected return value from child process {}".format(type(ret)))
+        execution = worker.execute(command) if worker else ChildProcessCommandExecution(command)
+        connections[step.key] = execution.connection
+        try:
+            while not execution.is_done:
+                for ret in execution.iter_ready_events():
+                    if isinstance(ret, DagsterEvent):
+                        yield ret
+                    elif isinstance(ret, ChildProcessEvent):
+                        if isinstance(ret, ChildProcessSystemErrorEvent):
+                            errors[ret.pid] = ret.error_info
+                    else:
+                        check.failed(
+                            "Unexpected return value from child process {}".format(type(ret))
+                        )
+
+                # Yield control back to the executor until the child process sends more events
+                if not execution.is_done:
+                    yield None
+        finally:
+            del connections[step.key]
+            execution.close()
@@ -123,7 +123,7 @@ def get_external_schedule_execution_data(
 
     @abstractmethod
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time, last_run_key
+        self, instance, repository_handle, name, last_completion_time, last_run_key, timeout=None
     ):
         pass
 
@@ -283,8 +283,9 @@ def get_external_schedule_execution_data(
         )
 
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time, last_run_key
+        self, instance, repository_handle, name, last_completion_time, last_run_key, timeout=None
     ):
+        # the sensor is evaluated in this process, so the evaluation can't be interrupted
         return get_external_sensor_execution(
             self._recon_repo, instance.get_ref(), name, last_completion_time, last_run_key
         )
@@ -427,7 +428,7 @@ def get_external_schedule_execution_data(
         )
 
     def get_external_sensor_execution_data(
-        self, instance, repository_handle, name, last_completion_time, last_run_key
+        self, instance, repository_handle, name, last_completion_time, last_run_key, timeout=None
     ):
         return sync_get_external_sensor_execution_data_grpc(
             self._handle.client,
@@ -436,6 +437,7 @@ def get_external_sensor_execution_data(
             name,
             last_completion_time,
             last_run_key,
+            timeout=timeout,
         )
 
     def get_external_partition_set_execution_param_data(
@@ -245,6 +245,17 @@ def __init__(
 
         self._subscribers = defaultdict(list)
 
+        self._event_log_buffer = None
+        if self._settings.get("event_log_buffer") is not None:
+            from .event_log_buffer import EventLogBuffer
+
+            event_log_buffer_settings = self._settings["event_log_buffer"]
+            self._event_log_buffer = EventLogBuffer(
+                self._event_storage,
+                max_events=event_log_buffer_settings.get("max_events"),
+                max_seconds=event_log_buffer_settings.get("max_seconds"),
+            )
+
     # ctors
 
     @staticmethod
@@ -478,10 +489,13 @@ def optimize_for_dagit(self, statement_timeout):
 
     def reindex(self, print_fn=lambda _: None):
         print_fn("Checking for reindexing...")
+        self._run_storage.reindex(print_fn)
         self._event_storage.reindex(print_fn)
         print_fn("Done.")
 
     def dispose(self):
+        if self._event_log_buffer:
+            self._event_log_buffer.close()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
         self._run_launcher.dispose()
@@ -508,9 +522,7 @@ def get_historical_pipeline(self, snapshot_id):
             if snapshot.lineage_snapshot
             else None
         )
-        return HistoricalPipeline(
-            self._run_storage.get_pipeline_snapshot(snapshot_id), snapshot_id, parent_snapshot
-        )
+        return HistoricalPipeline(snapshot, snapshot_id, parent_snapshot)
 
     def has_historical_pipeline(self, snapshot_id):
         return self._run_storage.has_pipeline_snapshot(snapshot_id)
@@ -519,11 +531,25 @@ def get_execution_plan_snapshot(self, snapshot_id):
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
     def get_run_stats(self, run_id):
+        self.flush_event_log_buffer()
         return self._event_storage.get_stats_for_run(run_id)
 
     def get_run_step_stats(self, run_id, step_keys=None):
+        self.flush_event_log_buffer()
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    def get_runs_stats(self, run_ids):
+        self.flush_event_log_buffer()
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    def get_runs_step_stats(self, run_ids):
+        self.flush_event_log_buffer()
+        return self._event_storage.get_step_stats_for_runs(run_ids)
+
+    def get_runs_asset_keys(self, run_ids):
+        self.flush_event_log_buffer()
+        return self._event_storage.get_asset_keys_for_runs(run_ids)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -594,7 +620,7 @@ def create_run_for_pipeline(
                 )
 
             subsetted_execution_plan = resolve_memoized_execution_plan(
-                full_execution_plan
+                full_execution_plan, instance=self
             )  # TODO: tighter integration with existing step_keys_to_execute functionality
             step_keys_to_execute = subsetted_execution_plan.step_keys_to_execute
         else:
@@ -886,6 +912,9 @@ def get_runs(self, filters=None, cursor=None, limit=None):
     def get_runs_count(self, filters=None):
         return self._run_storage.get_runs_count(filters)
 
+    def get_queued_runs(self, limit=None):
+        return self._run_storage.get_queued_runs(limit)
+
     def get_run_groups(self, filters=None, cursor=None, limit=None):
         return self._run_storage.get_run_groups(filters=filters, cursor=cursor, limit=limit)
 
@@ -899,15 +928,44 @@ def delete_run(self, run_id):
 
     # event storage
 
-    def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+    def logs_after(self, run_id, cursor, limit=None):
+        self.flush_event_log_buffer()
+        return self._event_storage.get_logs_for_run(run_id, cursor=cursor, limit=limit)
+
+    def logs_after_by_log_id(self, run_id, cursor, limit=None):
+        """Returns the logs of a run after the cursor, in order and keyed by their storage id. See
+        :py:meth:`EventLogStorage.get_logs_for_run_by_log_id`."""
+        self.flush_event_log_buffer()
+        return self._event_storage.get_logs_for_run_by_log_id(run_id, cursor=cursor, limit=limit)
 
     def all_logs(self, run_id):
+        self.flush_event_log_buffer()
         return self._event_storage.get_logs_for_run(run_id)
 
+    def iter_logs(self, run_id, cursor=-1, batch_size=None):
+        """Iterate over the logs of a run without loading all of them into memory at once."""
+        from dagster.core.storage.event_log.base import DEFAULT_EVENT_LOG_BATCH_SIZE
+
+        self.flush_event_log_buffer()
+        return self._event_storage.iter_logs_for_run(
+            run_id,
+            cursor=cursor,
+            batch_size=batch_size if batch_size is not None else DEFAULT_EVENT_LOG_BATCH_SIZE,
+        )
+
     def watch_event_logs(self, run_id, cursor, cb):
+        self.flush_event_log_buffer()
         return self._event_storage.watch(run_id, cursor, cb)
 
+    def end_watch_event_logs(self, run_id, cb):
+        return self._event_storage.end_watch(run_id, cb)
+
+    def flush_event_log_buffer(self):
+        """Writes any events buffered by this instance to the event log storage. Only has an
+        effect when ``event_log_buffer`` is set in the instance's ``dagster.yaml``."""
+        if self._event_log_buffer:
+            self._event_log_buffer.flush()
+
     # asset storage
 
     @property
@@ -959,9 +1017,16 @@ def get_logger(self):
     def handle_new_event(self, event):
         run_id = event.run_id
 
-        self._event_storage.store_event(event)
+        is_pipeline_event = event.is_dagster_event and event.dagster_event.is_pipeline_event
+
+        if self._event_log_buffer:
+            # Pipeline lifecycle events flush the buffer, so every event for a run is durable
+            # before the run's status changes
+            self._event_log_buffer.add(event, flush=is_pipeline_event)
+        else:
+            self._event_storage.store_event(event)
 
-        if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+        if is_pipeline_event:
             self._run_storage.handle_run_event(run_id, event.dagster_event)
 
         for sub in self._subscribers[run_id]:
@@ -1,7 +1,7 @@
 import os
 import warnings
 
-from dagster import Bool, check
+from dagster import Bool, Float, Int, check
 from dagster.config import Field, Permissive
 from dagster.config.validate import validate_config
 from dagster.core.errors import DagsterInvalidConfigError
@@ -55,4 +55,11 @@ def dagster_instance_config_schema():
         "run_coordinator": config_field_for_configurable_class(),
         "run_launcher": config_field_for_configurable_class(),
         "telemetry": Field({"enabled": Field(Bool, is_required=False)}),
+        "event_log_buffer": Field(
+            {
+                "max_events": Field(Int, is_required=False),
+                "max_seconds": Field(Float, is_required=False),
+            },
+            is_required=False,
+        ),
     }
@@ -0,0 +1,108 @@
+import logging
+import threading
+
+from dagster import check, seven
+from dagster.core.events.log import EventRecord
+
+DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS = 100
+DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS = 1.0
+
+
+class EventLogBuffer:
+    """Write-behind buffer in front of an event log storage.
+
+    Events are written to the storage in batches via ``EventLogStorage.store_events``, once
+    ``max_events`` events have accumulated, once the oldest buffered event is ``max_seconds`` old,
+    or whenever a flush is explicitly requested. Events are always written in the order in which
+    they were added.
+    """
+
+    def __init__(self, event_storage, max_events=None, max_seconds=None):
+        from dagster.core.storage.event_log import EventLogStorage
+
+        self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
+        self._max_events = check.opt_int_param(
+            max_events, "max_events", DEFAULT_EVENT_LOG_BUFFER_MAX_EVENTS
+        )
+        self._max_seconds = check.opt_numeric_param(
+            max_seconds, "max_seconds", DEFAULT_EVENT_LOG_BUFFER_MAX_SECONDS
+        )
+        check.invariant(self._max_events > 0, "max_events must be greater than 0")
+        check.invariant(self._max_seconds > 0, "max_seconds must be greater than 0")
+
+        # Held while events are written to storage, so that concurrent flushes can't reorder them
+        self._lock = threading.RLock()
+        self._events = []
+        self._oldest_event_time = None
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread = None
+
+    @property
+    def size(self):
+        with self._lock:
+            return len(self._events)
+
+    def add(self, event, flush=False):
+        check.inst_param(event, "event", EventRecord)
+        check.bool_param(flush, "flush")
+
+        with self._lock:
+            if not self._events:
+                self._oldest_event_time = seven.time_fn()
+            self._events.append(event)
+
+            if (
+                flush
+                or len(self._events) >= self._max_events
+                or seven.time_fn() - self._oldest_event_time >= self._max_seconds
+            ):
+                self.flush()
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self):
+        with self._lock:
+            if not self._events:
+                return
+
+            events = self._events
+            self._events = []
+            self._oldest_event_time = None
+            try:
+                self._event_storage.store_events(events)
+            except Exception:  # pylint: disable=broad-except
+                # Keep the events around so that a later flush can retry them
+                self._events = events + self._events
+                self._oldest_event_time = seven.time_fn()
+                raise
+
+    def close(self):
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread or self._shutdown_event.is_set():
+            return
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically, name="event-log-buffer-flush"
+        )
+        self._flush_thread.daemon = True
+        self._flush_thread.start()
+
+    def _flush_periodically(self):
+        while not self._shutdown_event.wait(self._max_seconds / 2):
+            with self._lock:
+                is_due = (
+                    self._events and seven.time_fn() - self._oldest_event_time >= self._max_seconds
+                )
+                if not is_due:
+                    continue
+                try:
+                    self.flush()
+                except Exception:  # pylint: disable=broad-except
+                    logging.exception("Failed to flush buffered events to the event log storage")
@@ -161,7 +161,7 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             ConfigurableClassData("dagster", "DefaultRunLauncher", yaml.dump({}),),
         )
 
-        settings_keys = {"telemetry"}
+        settings_keys = {"telemetry", "event_log_buffer"}
         settings = {key: config_value.get(key) for key in settings_keys}
 
         return InstanceRef(
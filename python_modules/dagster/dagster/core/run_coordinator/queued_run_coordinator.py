@@ -3,8 +3,9 @@
 import weakref
 
 from dagster import DagsterEvent, DagsterEventType, DagsterInstance, check
-from dagster.config import Field
-from dagster.config.source import IntSource
+from dagster.config import Field, Shape
+from dagster.config.config_type import Array
+from dagster.config.source import IntSource, StringSource
 from dagster.core.events.log import DagsterEventRecord
 from dagster.core.host_representation import ExternalPipeline
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
@@ -18,10 +19,20 @@ class QueuedRunCoordinator(RunCoordinator, ConfigurableClass):
     """
     Sends runs to the dequeuer process via the run storage. Requires the external process to be
     alive for runs to be launched.
+
+    Besides ``max_concurrent_runs``, ``tag_concurrency_limits`` can limit how many runs with a given
+    tag key and value may be in progress at once, e.g.
+    ``[{"key": "database", "value": "redshift", "limit": 2}]``.
     """
 
     @experimental
-    def __init__(self, max_concurrent_runs=None, dequeue_interval_seconds=None, inst_data=None):
+    def __init__(
+        self,
+        max_concurrent_runs=None,
+        dequeue_interval_seconds=None,
+        tag_concurrency_limits=None,
+        inst_data=None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._instance_ref = None
         self.max_concurrent_runs = check.opt_int_param(
@@ -30,6 +41,9 @@ def __init__(self, max_concurrent_runs=None, dequeue_interval_seconds=None, inst
         self.dequeue_interval_seconds = check.opt_int_param(
             dequeue_interval_seconds, "dequeue_interval_seconds", 5
         )
+        self.tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
 
     @property
     def inst_data(self):
@@ -40,6 +54,10 @@ def config_type(cls):
         return {
             "max_concurrent_runs": Field(IntSource, is_required=False),
             "dequeue_interval_seconds": Field(IntSource, is_required=False),
+            "tag_concurrency_limits": Field(
+                Array(Shape({"key": StringSource, "value": StringSource, "limit": IntSource})),
+                is_required=False,
+            ),
         }
 
     @classmethod
@@ -48,6 +66,7 @@ def from_config_value(cls, inst_data, config_value):
             inst_data=inst_data,
             max_concurrent_runs=config_value.get("max_concurrent_runs"),
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
+            tag_concurrency_limits=config_value.get("tag_concurrency_limits"),
         )
 
     def initialize(self, instance):
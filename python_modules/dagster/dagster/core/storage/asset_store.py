@@ -90,6 +90,14 @@ def get_asset(self, context):
         keys = tuple(context.get_run_scoped_output_identifier())
         return self.values[keys]
 
+    def rm_output(self, context):
+        keys = tuple(context.get_run_scoped_output_identifier())
+        if keys not in self.values:
+            return False
+
+        del self.values[keys]
+        return True
+
 
 @resource
 def mem_asset_store(_):
@@ -140,6 +148,16 @@ def get_asset(self, context):
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def rm_output(self, context):
+        """Remove the file of an output that will not be loaded again."""
+        filepath = self._get_path(context)
+
+        if not os.path.exists(filepath):
+            return False
+
+        os.unlink(filepath)
+        return True
+
 
 @resource(config_schema={"base_dir": Field(StringSource, default_value=".", is_required=False)})
 @experimental
@@ -308,6 +326,9 @@ def set_asset(self, context, obj):
         with open(filepath, self.write_mode) as write_obj:
             pickle.dump(obj, write_obj, PICKLE_PROTOCOL)
 
+        # the path of the stored version is indexed by the event log storage for memoization
+        return EventMetadataEntry.fspath(os.path.abspath(filepath))
+
     def get_asset(self, context):
         """Unpickle the file and Load it to a data object."""
 
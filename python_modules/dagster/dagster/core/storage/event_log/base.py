@@ -1,18 +1,74 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
+from collections import OrderedDict
 
 import pyrsistent
 import six
+from dagster import check
+from dagster.core.definitions.events import AssetStoreOperationType, PathMetadataEntryData
 from dagster.core.events.log import EventRecord
 from dagster.core.execution.stats import (
     build_run_stats_from_events,
     build_run_step_stats_from_events,
 )
 
+# The number of event log records that are fetched and deserialized at a time when iterating over
+# the logs of a run
+DEFAULT_EVENT_LOG_BATCH_SIZE = 1000
+
 
 class EventLogSequence(pyrsistent.CheckedPVector):
     __type__ = EventRecord
 
 
+def _get_asset_store_operation_data(event, op):
+    if not event.is_dagster_event or not event.dagster_event.is_asset_store_operation:
+        return None
+
+    data = event.dagster_event.event_specific_data
+    return data if data.op == op else None
+
+
+def get_step_output_version_entry(event):
+    """Returns the entry indexed for an event that stored a versioned step output with an asset
+    store, or None for any other event.
+
+    The address of the stored output is the first path reported by the asset store, so outputs
+    that are stored without a path are not indexed.
+
+    Returns:
+        Optional[Dict[str, str]]: The pipeline_name, run_id, step_key, output_name, version and
+            address of the stored output.
+    """
+    data = _get_asset_store_operation_data(event, AssetStoreOperationType.SET_ASSET)
+    if data is None or data.version is None:
+        return None
+
+    address = next(
+        (
+            entry.entry_data.path
+            for entry in data.metadata_entries
+            if isinstance(entry.entry_data, PathMetadataEntryData)
+        ),
+        None,
+    )
+    if address is None:
+        return None
+
+    return dict(
+        pipeline_name=event.pipeline_name or event.dagster_event.pipeline_name,
+        run_id=event.run_id,
+        step_key=data.step_key,
+        output_name=data.output_name,
+        version=data.version,
+        address=address,
+    )
+
+
+def is_step_output_removal(event):
+    """Whether an event removed a step output from the asset store that stored it."""
+    return _get_asset_store_operation_data(event, AssetStoreOperationType.RM_ASSET) is not None
+
+
 class EventLogStorage(six.with_metaclass(ABCMeta)):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -26,14 +82,50 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     """
 
     @abstractmethod
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         """Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. (default: None)
+        """
+
+    def get_logs_for_run_by_log_id(self, run_id, cursor=-1, limit=None):
+        """Get the logs corresponding to a run, in order and keyed by their storage id. Passing
+        ``log_id - 1`` as the cursor returns the logs stored after the log with id ``log_id``.
+        Storages that don't assign ids to the logs key them by their one-indexed position in the
+        run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. (default: None)
         """
+        events = self.get_logs_for_run(run_id, cursor=cursor, limit=limit)
+        return OrderedDict((cursor + 2 + i, event) for i, event in enumerate(events))
+
+    def iter_logs_for_run(self, run_id, cursor=-1, batch_size=DEFAULT_EVENT_LOG_BATCH_SIZE):
+        """Iterate over the logs corresponding to a run, fetching them in batches so that only one
+        batch of logs is held in memory at a time.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be yielded starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be yielded. (default: -1)
+            batch_size (Optional[int]): The number of logs to fetch at a time. (default: 1000)
+        """
+        while True:
+            events = self.get_logs_for_run(run_id, cursor=cursor, limit=batch_size)
+            for event in events:
+                yield event
+
+            if len(events) < batch_size:
+                return
+
+            cursor += len(events)
 
     def get_stats_for_run(self, run_id):
         """Get a summary of events that have ocurred in a run."""
@@ -51,6 +143,56 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_stats_for_runs(self, run_ids):
+        """Get a summary of events that have ocurred in each of several runs.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats for each run, keyed by run id.
+        """
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(self, run_ids):
+        """Get per-step stats for each of several pipeline runs.
+
+        Returns:
+            Dict[str, List[RunStepKeyStatsSnapshot]]: The step stats for each run, keyed by run id.
+        """
+        return {run_id: self.get_step_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_asset_keys_for_runs(self, run_ids):
+        """Get the asset keys materialized by each of several runs, in the order in which the
+        materializations occurred.
+
+        Returns:
+            Dict[str, List[AssetKey]]: The asset keys for each run, keyed by run id.
+        """
+        return {
+            run_id: [
+                event.dagster_event.asset_key
+                for event in self.iter_logs_for_run(run_id)
+                if event.is_dagster_event and event.dagster_event.asset_key
+            ]
+            for run_id in run_ids
+        }
+
+    def get_addresses_for_step_output_versions(self, step_output_versions):
+        """For each given step output, finds whether an output exists with the given version, and
+        returns its address if it does.
+
+        Storages that index the step outputs stored by asset stores should override this. By
+        default no addresses are found, and callers fall back to probing the asset store.
+
+        Args:
+            step_output_versions (Dict[(str, StepOutputHandle), str]):
+                (pipeline name, step output handle) -> version.
+
+        Returns:
+            Dict[(str, StepOutputHandle), Optional[str]]: (pipeline name, step output handle) ->
+                address, for each step output an address if there is one and None otherwise.
+        """
+        check.dict_param(step_output_versions, "step_output_versions", key_type=tuple)
+        return {key: None for key in step_output_versions}
+
     @abstractmethod
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
@@ -60,6 +202,17 @@ def store_event(self, event):
             event (EventRecord): The event to store.
         """
 
+    def store_events(self, events):
+        """Store a batch of events, possibly across several pipeline runs.
+
+        Storages that can write many events in a single round trip should override this.
+
+        Args:
+            events (List[EventRecord]): The events to store, in the order they should be stored.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id):
         """Remove events for a given run id"""
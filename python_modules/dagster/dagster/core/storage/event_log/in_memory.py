@@ -5,7 +5,15 @@
 from dagster.core.events.log import EventRecord
 from dagster.serdes import ConfigurableClass
 
-from .base import AssetAwareEventLogStorage, EventLogSequence, EventLogStorage
+from dagster.core.execution.plan.objects import StepOutputHandle
+
+from .base import (
+    AssetAwareEventLogStorage,
+    EventLogSequence,
+    EventLogStorage,
+    get_step_output_version_entry,
+    is_step_output_removal,
+)
 
 
 class InMemoryEventLogStorage(EventLogStorage, AssetAwareEventLogStorage, ConfigurableClass):
@@ -35,16 +43,19 @@ def config_type(cls):
     def from_config_value(cls, inst_data, config_value):
         return cls(inst_data)
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         check.str_param(run_id, "run_id")
         check.int_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
         check.invariant(
             cursor >= -1,
             "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
         )
 
         cursor = cursor + 1
-        return self._logs[run_id][cursor:]
+        if limit is None:
+            return self._logs[run_id][cursor:]
+        return self._logs[run_id][cursor : cursor + limit]
 
     def store_event(self, event):
         check.inst_param(event, "event", EventRecord)
@@ -169,6 +180,36 @@ def wipe_asset(self, asset_key):
                     updated_records.append(updated_record)
             self._logs[run_id] = updated_records
 
+    def get_addresses_for_step_output_versions(self, step_output_versions):
+        check.dict_param(step_output_versions, "step_output_versions", key_type=tuple)
+
+        # (pipeline name, step output handle, version) -> (run id, address) of the stored output
+        stored = {}
+        for records in self._logs.values():
+            for record in records:
+                entry = get_step_output_version_entry(record)
+                if entry:
+                    handle = StepOutputHandle(entry["step_key"], entry["output_name"])
+                    stored[(entry["pipeline_name"], handle, entry["version"])] = (
+                        entry["run_id"],
+                        entry["address"],
+                    )
+                elif is_step_output_removal(record):
+                    data = record.dagster_event.event_specific_data
+                    handle = StepOutputHandle(data.step_key, data.output_name)
+                    for key in [
+                        key
+                        for key, (run_id, _) in stored.items()
+                        if key[1] == handle and run_id == record.run_id
+                    ]:
+                        del stored[key]
+
+        addresses = {}
+        for (pipeline_name, handle), version in step_output_versions.items():
+            run_and_address = stored.get((pipeline_name, handle, version))
+            addresses[(pipeline_name, handle)] = run_and_address[1] if run_and_address else None
+        return addresses
+
     def has_secondary_index(self, name, run_id=None):
         return False
 
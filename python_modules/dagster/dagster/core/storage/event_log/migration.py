@@ -1,8 +1,17 @@
 import sqlalchemy as db
 from dagster import AssetKey
+from dagster.core.events import DagsterEventType
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.utils import utc_datetime_from_timestamp
 from tqdm import tqdm
 
-from .schema import AssetKeyTable, SqlEventLogStorageTable
+from .schema import (
+    AssetKeyTable,
+    RunStatsTable,
+    SqlEventLogStorageTable,
+    StepOutputVersionsTable,
+    StepStatsTable,
+)
 
 
 def migrate_event_log_data(instance=None):
@@ -54,3 +63,147 @@ def migrate_asset_key_data(event_log_storage, print_fn=lambda _: None):
             except db.exc.IntegrityError:
                 # asset key already present
                 pass
+
+
+def _get_run_ids(event_log_storage):
+    query = (
+        db.select([SqlEventLogStorageTable.c.run_id])
+        .where(SqlEventLogStorageTable.c.run_id != None)
+        .group_by(SqlEventLogStorageTable.c.run_id)
+    )
+    with event_log_storage.connect() as conn:
+        return [run_id for (run_id,) in conn.execute(query).fetchall()]
+
+
+def migrate_run_stats_data(event_log_storage, print_fn=lambda _: None):
+    """
+    Utility method to build the run stats summary table from the data in existing event log
+    records.  Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import AssetAwareSqlEventLogStorage
+
+    # summary tables are only supported by storages backed by a single consolidated database
+    if not isinstance(event_log_storage, AssetAwareSqlEventLogStorage):
+        return
+
+    with event_log_storage.connect() as conn:
+        # databases created before the summary tables were introduced don't have them yet
+        RunStatsTable.create(conn, checkfirst=True)
+
+    print_fn("Querying event logs.")
+    run_ids = _get_run_ids(event_log_storage)
+    print_fn("Found {} runs to index".format(len(run_ids)))
+    for run_id in tqdm(run_ids):
+        stats = event_log_storage._get_stats_for_runs_from_event_log(  # pylint: disable=protected-access
+            [run_id]
+        )[
+            run_id
+        ]
+        with event_log_storage.connect() as conn:
+            conn.execute(
+                RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    RunStatsTable.c.run_id == run_id
+                )
+            )
+            conn.execute(
+                RunStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id,
+                    steps_succeeded=stats.steps_succeeded,
+                    steps_failed=stats.steps_failed,
+                    materializations=stats.materializations,
+                    expectations=stats.expectations,
+                    start_time=utc_datetime_from_timestamp(stats.start_time)
+                    if stats.start_time
+                    else None,
+                    end_time=utc_datetime_from_timestamp(stats.end_time)
+                    if stats.end_time
+                    else None,
+                )
+            )
+
+
+def migrate_step_stats_data(event_log_storage, print_fn=lambda _: None):
+    """
+    Utility method to build the step stats summary table from the data in existing event log
+    records.  Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import AssetAwareSqlEventLogStorage
+
+    # summary tables are only supported by storages backed by a single consolidated database
+    if not isinstance(event_log_storage, AssetAwareSqlEventLogStorage):
+        return
+
+    with event_log_storage.connect() as conn:
+        # databases created before the summary tables were introduced don't have them yet
+        StepStatsTable.create(conn, checkfirst=True)
+
+    print_fn("Querying event logs.")
+    run_ids = _get_run_ids(event_log_storage)
+    print_fn("Found {} runs to index".format(len(run_ids)))
+    for run_id in tqdm(run_ids):
+        step_stats = event_log_storage._get_step_stats_for_runs_from_event_log(  # pylint: disable=protected-access
+            [run_id]
+        )[
+            run_id
+        ]
+        with event_log_storage.connect() as conn:
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
+            if not step_stats:
+                continue
+            conn.execute(
+                StepStatsTable.insert(),  # pylint: disable=no-value-for-parameter
+                [
+                    dict(
+                        run_id=run_id,
+                        step_key=stats.step_key,
+                        status=stats.status.value if stats.status else None,
+                        start_time=utc_datetime_from_timestamp(stats.start_time)
+                        if stats.start_time
+                        else None,
+                        end_time=utc_datetime_from_timestamp(stats.end_time)
+                        if stats.end_time
+                        else None,
+                        attempts=stats.attempts,
+                    )
+                    for stats in step_stats
+                ],
+            )
+
+
+def migrate_step_output_versions_data(event_log_storage, print_fn=lambda _: None):
+    """
+    Utility method to build the step output versions index from the asset store operations in
+    existing event log records.  Takes in event_log_storage, and a print_fn to keep track of
+    progress.
+    """
+    from dagster.core.storage.event_log.sql_event_log import AssetAwareSqlEventLogStorage
+
+    # the index is only supported by storages backed by a single consolidated database
+    if not isinstance(event_log_storage, AssetAwareSqlEventLogStorage):
+        return
+
+    with event_log_storage.connect() as conn:
+        # databases created before the index was introduced don't have it yet
+        StepOutputVersionsTable.create(conn, checkfirst=True)
+        conn.execute(StepOutputVersionsTable.delete())  # pylint: disable=no-value-for-parameter
+
+    query = (
+        db.select([SqlEventLogStorageTable.c.event])
+        .where(
+            SqlEventLogStorageTable.c.dagster_event_type
+            == DagsterEventType.ASSET_STORE_OPERATION.value
+        )
+        .order_by(SqlEventLogStorageTable.c.id.asc())
+    )
+    with event_log_storage.connect() as conn:
+        print_fn("Querying event logs.")
+        rows = conn.execute(query).fetchall()
+        print_fn("Found {} records to index".format(len(rows)))
+        for (json_str,) in tqdm(rows):
+            event_log_storage.store_step_output_versions(
+                conn, [deserialize_json_to_dagster_namedtuple(json_str)]
+            )
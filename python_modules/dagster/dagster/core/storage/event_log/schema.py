@@ -31,6 +31,52 @@
     db.Column("create_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
 )
 
+RunStatsTable = db.Table(
+    "run_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), unique=True),
+    db.Column("steps_succeeded", db.Integer, nullable=False, default=0),
+    db.Column("steps_failed", db.Integer, nullable=False, default=0),
+    db.Column("materializations", db.Integer, nullable=False, default=0),
+    db.Column("expectations", db.Integer, nullable=False, default=0),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+)
+
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.String, nullable=False),
+    db.Column("status", db.String(63)),
+    db.Column("start_time", db.types.TIMESTAMP),
+    db.Column("end_time", db.types.TIMESTAMP),
+    db.Column("attempts", db.Integer),
+    db.UniqueConstraint("run_id", "step_key"),
+)
+
+StepOutputVersionsTable = db.Table(
+    "step_output_versions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("pipeline_name", db.String, nullable=False),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.String, nullable=False),
+    db.Column("output_name", db.String, nullable=False),
+    db.Column("version", db.String, nullable=False),
+    db.Column("address", db.Text, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index("idx_step_key", SqlEventLogStorageTable.c.step_key)
 db.Index("idx_asset_key", SqlEventLogStorageTable.c.asset_key)
+db.Index(
+    "idx_step_output_version",
+    StepOutputVersionsTable.c.pipeline_name,
+    StepOutputVersionsTable.c.step_key,
+    StepOutputVersionsTable.c.output_name,
+    StepOutputVersionsTable.c.version,
+)
@@ -10,26 +10,192 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.stats import RunStepKeyStatsSnapshot, StepEventStatus
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.utils import datetime_as_float, utc_datetime_from_timestamp
 
 from ..pipeline_run import PipelineRunStatsSnapshot
-from .base import AssetAwareEventLogStorage, EventLogStorage
-from .migration import migrate_asset_key_data
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .base import (
+    DEFAULT_EVENT_LOG_BATCH_SIZE,
+    AssetAwareEventLogStorage,
+    EventLogStorage,
+    get_step_output_version_entry,
+    is_step_output_removal,
+)
+from .migration import (
+    migrate_asset_key_data,
+    migrate_run_stats_data,
+    migrate_step_output_versions_data,
+    migrate_step_stats_data,
+)
+from .schema import (
+    AssetKeyTable,
+    RunStatsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepOutputVersionsTable,
+    StepStatsTable,
+)
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"
+SECONDARY_INDEX_RUN_STATS = "run_stats_table"
+SECONDARY_INDEX_STEP_STATS = "step_stats_table"
+SECONDARY_INDEX_STEP_OUTPUT_VERSIONS = "step_output_versions_table"
 
 REINDEX_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: migrate_asset_key_data,
+    SECONDARY_INDEX_RUN_STATS: migrate_run_stats_data,
+    SECONDARY_INDEX_STEP_STATS: migrate_step_stats_data,
+    SECONDARY_INDEX_STEP_OUTPUT_VERSIONS: migrate_step_output_versions_data,
 }
 
+# Bounds the number of bound parameters in the IN clauses of a step output version lookup, to stay
+# under the limits of SQLite
+STEP_OUTPUT_VERSIONS_QUERY_CHUNK_SIZE = 500
+
+RUN_STATS_INDEX_EVENT_TYPES = {
+    DagsterEventType.PIPELINE_START.value,
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_FAILURE.value,
+    DagsterEventType.STEP_MATERIALIZATION.value,
+    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+}
+
+STEP_STATS_INDEX_EVENT_TYPES = {
+    DagsterEventType.STEP_START.value,
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_SKIPPED.value,
+    DagsterEventType.STEP_FAILURE.value,
+    DagsterEventType.STEP_RESTARTED.value,
+}
+
+
+def unique_asset_key_events(events):
+    """Returns the first event for each distinct asset key in a batch of events."""
+    seen = set()
+    asset_key_events = []
+    for event in events:
+        if not event.is_dagster_event or not event.dagster_event.asset_key:
+            continue
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        if asset_key_str not in seen:
+            seen.add(asset_key_str)
+            asset_key_events.append(event)
+    return asset_key_events
+
+
+def _get_run_end_time_expression(run_id):
+    """The end time of a run, as computed from the raw event log: the time of its last success if
+    it succeeded, and otherwise the time of its last failure."""
+
+    def _last_event_time(event_type):
+        return (
+            db.select([db.func.max(SqlEventLogStorageTable.c.timestamp)])
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.dagster_event_type == event_type.value)
+            .as_scalar()
+        )
+
+    return db.func.coalesce(
+        _last_event_time(DagsterEventType.PIPELINE_SUCCESS),
+        _last_event_time(DagsterEventType.PIPELINE_FAILURE),
+    )
+
+
+def _get_run_stats_values(run_id, events):
+    """Folds a batch of events for a single run into the values to insert into, or to update, its
+    row in the run stats table.  The events must already be stored in the event log."""
+    counter_columns = {
+        DagsterEventType.STEP_SUCCESS: "steps_succeeded",
+        DagsterEventType.STEP_FAILURE: "steps_failed",
+        DagsterEventType.STEP_MATERIALIZATION: "materializations",
+        DagsterEventType.STEP_EXPECTATION_RESULT: "expectations",
+    }
+
+    counts = {column: 0 for column in counter_columns.values()}
+    times = {}
+    for event in events:
+        event_type = event.dagster_event.event_type
+        if event_type in counter_columns:
+            counts[counter_columns[event_type]] += 1
+        elif event_type == DagsterEventType.PIPELINE_START:
+            times["start_time"] = utc_datetime_from_timestamp(event.timestamp)
+        else:
+            # a success takes precedence over a failure whatever order they were stored in, so
+            # the end time is read back from the event log rather than taken from the last event
+            times["end_time"] = _get_run_end_time_expression(run_id)
+
+    insert_values = dict(counts, **times)
+    update_values = dict(
+        {column: RunStatsTable.c[column] + count for column, count in counts.items() if count},
+        **times,
+    )
+    return insert_values, update_values
+
+
+def _get_step_stats_values(events):
+    """Folds a batch of events for a single step into the values to insert into, or to update, its
+    row in the step stats table."""
+    start_time = None
+    restarts = 0
+    status = None
+    end_time = None
+    for event in events:
+        event_type = event.dagster_event.event_type
+        timestamp = utc_datetime_from_timestamp(event.timestamp)
+        if event_type == DagsterEventType.STEP_START:
+            start_time = timestamp
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            restarts += 1
+        elif event_type == DagsterEventType.STEP_SUCCESS:
+            status, end_time = StepEventStatus.SUCCESS, timestamp
+        elif event_type == DagsterEventType.STEP_FAILURE:
+            status, end_time = StepEventStatus.FAILURE, timestamp
+        elif event_type == DagsterEventType.STEP_SKIPPED:
+            status, end_time = StepEventStatus.SKIPPED, timestamp
+
+    insert_values = {}
+    update_values = {}
+
+    # the attempt count is the number of restarts, plus one once the step has started
+    if start_time:
+        insert_values.update(start_time=start_time, attempts=restarts + 1)
+        update_values.update(
+            start_time=start_time,
+            attempts=db.case(
+                [
+                    (
+                        StepStatsTable.c.start_time == None,
+                        db.func.coalesce(StepStatsTable.c.attempts, 0) + restarts + 1,
+                    )
+                ],
+                else_=db.func.coalesce(StepStatsTable.c.attempts, 0) + restarts,
+            ),
+        )
+    elif restarts:
+        insert_values.update(attempts=restarts)
+        update_values.update(attempts=db.func.coalesce(StepStatsTable.c.attempts, 0) + restarts)
+
+    if status:
+        insert_values.update(status=status.value, end_time=end_time)
+        update_values.update(status=status.value, end_time=end_time)
+
+    return insert_values, update_values
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
     """
 
+    def __init__(self):
+        # Whether the summary tables exist.  Databases created before they were introduced only get
+        # them once they are migrated or reindexed, and they are never dropped once they exist, so
+        # only a positive result is remembered.
+        self._has_stats_tables = False
+
     @abstractmethod
     def connect(self, run_id=None):
         """Context manager yielding a connection.
@@ -65,6 +231,14 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self.prepare_event_row(event)
+        )
+
+    def prepare_event_row(self, event):
+        """Returns the column values for an event's row in the event log table, so that batches of
+        events can be inserted with a single statement."""
         dagster_event_type = None
         asset_key_str = None
         step_key = event.step_key
@@ -76,8 +250,7 @@ def prepare_insert_event(self, event):
                 check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
                 asset_key_str = event.dagster_event.asset_key.to_string()
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -100,6 +273,108 @@ def store_asset_key(self, conn, event):
         except db.exc.IntegrityError:
             pass
 
+    def has_stats_tables(self, conn):
+        """Whether the run stats and step stats summary tables exist."""
+        if not self._has_stats_tables:
+            self._has_stats_tables = conn.dialect.has_table(
+                conn, RunStatsTable.name
+            ) and conn.dialect.has_table(conn, StepStatsTable.name)
+        return self._has_stats_tables
+
+    def upsert_stats_row(self, conn, table, key_values, insert_values, update_values):
+        """Applies update_values to the summary row identified by key_values, inserting a new row
+        with insert_values if no such row exists yet.  Storages whose dialect supports an atomic
+        upsert should override this."""
+        update_statement = (
+            table.update()  # pylint: disable=no-value-for-parameter
+            .where(db.and_(*[table.c[name] == value for name, value in key_values.items()]))
+            .values(**update_values)
+        )
+        if conn.execute(update_statement).rowcount > 0:
+            return
+
+        try:
+            conn.execute(
+                table.insert().values(  # pylint: disable=no-value-for-parameter
+                    **dict(key_values, **insert_values)
+                )
+            )
+        except db.exc.IntegrityError:
+            # the row was inserted concurrently
+            conn.execute(update_statement)
+
+    def store_stats(self, conn, events):
+        """Incrementally updates the run stats and step stats summary tables for a batch of newly
+        stored events, with a single upsert per run and per step.  Should be called in the
+        transaction that stores the events, so that the summary never drifts from the event log."""
+        check.list_param(events, "events", of_type=EventRecord)
+
+        run_stats_events = defaultdict(list)
+        step_stats_events = defaultdict(list)
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            event_type_value = event.dagster_event.event_type_value
+            if event_type_value in RUN_STATS_INDEX_EVENT_TYPES:
+                run_stats_events[event.run_id].append(event)
+            if event_type_value in STEP_STATS_INDEX_EVENT_TYPES and event.dagster_event.step_key:
+                step_stats_events[(event.run_id, event.dagster_event.step_key)].append(event)
+
+        if not run_stats_events and not step_stats_events:
+            return
+
+        if not self.has_stats_tables(conn):
+            return
+
+        for run_id, run_events in run_stats_events.items():
+            insert_values, update_values = _get_run_stats_values(run_id, run_events)
+            self.upsert_stats_row(
+                conn, RunStatsTable, dict(run_id=run_id), insert_values, update_values
+            )
+
+        for (run_id, step_key), step_events in step_stats_events.items():
+            insert_values, update_values = _get_step_stats_values(step_events)
+            self.upsert_stats_row(
+                conn,
+                StepStatsTable,
+                dict(run_id=run_id, step_key=step_key),
+                insert_values,
+                update_values,
+            )
+
+    def store_step_output_versions(self, conn, events):
+        """Indexes the addresses of the versioned step outputs stored by a batch of newly stored
+        events, and drops the outputs they removed."""
+        check.list_param(events, "events", of_type=EventRecord)
+
+        changes = []
+        for event in events:
+            entry = get_step_output_version_entry(event)
+            if entry:
+                changes.append((entry, None))
+            elif is_step_output_removal(event):
+                changes.append((None, event))
+
+        if not changes:
+            return
+
+        with conn.begin():
+            for entry, removal in changes:
+                if entry:
+                    conn.execute(
+                        StepOutputVersionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                            **entry
+                        )
+                    )
+                else:
+                    data = removal.dagster_event.event_specific_data
+                    conn.execute(
+                        StepOutputVersionsTable.delete()  # pylint: disable=no-value-for-parameter
+                        .where(StepOutputVersionsTable.c.run_id == removal.run_id)
+                        .where(StepOutputVersionsTable.c.step_key == data.step_key)
+                        .where(StepOutputVersionsTable.c.output_name == data.output_name)
+                    )
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -111,49 +386,84 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.connect(run_id) as conn:
-            conn.execute(insert_event_statement)
-            if event.is_dagster_event and event.dagster_event.asset_key:
-                self.store_asset_key(conn, event)
+            with conn.begin():
+                conn.execute(insert_event_statement)
+                if event.is_dagster_event and event.dagster_event.asset_key:
+                    self.store_asset_key(conn, event)
+                self.store_stats(conn, [event])
+                self.store_step_output_versions(conn, [event])
 
-    def get_logs_for_run_by_log_id(self, run_id, cursor=-1):
-        check.str_param(run_id, "run_id")
-        check.int_param(cursor, "cursor")
-        check.invariant(
-            cursor >= -1,
-            "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
-        )
+    def store_events(self, events):
+        """Store a batch of events with a single multi-row insert per run, writing each distinct
+        asset key at most once.
 
-        # cursor starts at 0 & auto-increment column starts at 1 so adjust
-        cursor = cursor + 1
+        Args:
+            events (List[EventRecord]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+
+        events_by_run_id = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
 
+        for run_id, run_events in events_by_run_id.items():
+            with self.connect(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self.prepare_event_row(event) for event in run_events],
+                    )
+                    for event in unique_asset_key_events(run_events):
+                        self.store_asset_key(conn, event)
+                    self.store_stats(conn, run_events)
+                    self.store_step_output_versions(conn, run_events)
+
+    def _get_logs_query(self, run_id, after_id, limit):
         query = (
             db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id > cursor)
+            .where(SqlEventLogStorageTable.c.id > after_id)
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
+        if limit is not None:
+            query = query.limit(limit)
 
-        with self.connect(run_id) as conn:
-            results = conn.execute(query).fetchall()
+        return query
 
-        events = {}
+    def _deserialize_log_rows(self, run_id, rows):
         try:
-            for (record_id, json_str,) in results:
-                events[record_id] = check.inst_param(
+            for (record_id, json_str,) in rows:
+                yield record_id, check.inst_param(
                     deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
                 )
         except (seven.JSONDecodeError, check.CheckError) as err:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
-        return events
+    def get_logs_for_run_by_log_id(self, run_id, cursor=-1, limit=None):
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            cursor >= -1,
+            "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
+        )
+
+        # cursor starts at 0 & auto-increment column starts at 1 so adjust
+        cursor = cursor + 1
+
+        with self.connect(run_id) as conn:
+            results = conn.execute(self._get_logs_query(run_id, cursor, limit)).fetchall()
+
+        return dict(self._deserialize_log_rows(run_id, results))
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         """Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. (default: None)
         """
         check.str_param(run_id, "run_id")
         check.int_param(cursor, "cursor")
@@ -162,58 +472,246 @@ def get_logs_for_run(self, run_id, cursor=-1):
             "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
         )
 
-        events_by_id = self.get_logs_for_run_by_log_id(run_id, cursor)
-        return [event for id, event in sorted(events_by_id.items(), key=lambda x: x[0])]
+        # the query orders the logs by id, so the dict is already in order
+        return list(self.get_logs_for_run_by_log_id(run_id, cursor, limit).values())
+
+    def iter_logs_for_run(self, run_id, cursor=-1, batch_size=DEFAULT_EVENT_LOG_BATCH_SIZE):
+        """Iterate over the logs corresponding to a run, fetching them in batches keyed on the
+        record id so that only one batch of logs is held in memory at a time.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be yielded starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be yielded. (default: -1)
+            batch_size (Optional[int]): The number of logs to fetch at a time. (default: 1000)
+        """
+        check.str_param(run_id, "run_id")
+        check.int_param(cursor, "cursor")
+        check.int_param(batch_size, "batch_size")
+        check.invariant(
+            cursor >= -1,
+            "Don't know what to do with negative cursor {cursor}".format(cursor=cursor),
+        )
+        check.invariant(batch_size > 0, "batch_size must be positive")
+
+        # cursor starts at 0 & auto-increment column starts at 1 so adjust
+        after_id = cursor + 1
+
+        while True:
+            # the connection is released before yielding, so that consumers that are slow to
+            # process the logs don't hold it open
+            with self.connect(run_id) as conn:
+                results = conn.execute(
+                    self._get_logs_query(run_id, after_id, batch_size)
+                ).fetchall()
+
+            for record_id, event in self._deserialize_log_rows(run_id, results):
+                after_id = record_id
+                yield event
+
+            if len(results) < batch_size:
+                return
 
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, "run_id")
+        return self._get_stats_for_runs([run_id])[run_id]
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return self._get_stats_for_runs(run_ids) if run_ids else {}
+
+    def _get_stats_for_runs(self, run_ids):
+        # Storages that shard by run id connect to the shard of the first run, so only query a
+        # single run at a time (see SqliteEventLogStorage)
+        if self.has_secondary_index(SECONDARY_INDEX_RUN_STATS, run_id=run_ids[0]):
+            return self._get_stats_for_runs_from_index(run_ids)
+
+        return self._get_stats_for_runs_from_event_log(run_ids)
+
+    def _get_stats_for_runs_from_index(self, run_ids):
+        query = db.select([RunStatsTable]).where(RunStatsTable.c.run_id.in_(run_ids))
+        with self.connect(run_ids[0]) as conn:
+            rows_by_run_id = {row.run_id: row for row in conn.execute(query).fetchall()}
+
+        stats_by_run_id = {}
+        for run_id in run_ids:
+            row = rows_by_run_id.get(run_id)
+            if not row:
+                stats_by_run_id[run_id] = PipelineRunStatsSnapshot(
+                    run_id=run_id,
+                    steps_succeeded=0,
+                    steps_failed=0,
+                    materializations=0,
+                    expectations=0,
+                    start_time=None,
+                    end_time=None,
+                )
+                continue
+
+            stats_by_run_id[run_id] = PipelineRunStatsSnapshot(
+                run_id=run_id,
+                steps_succeeded=row.steps_succeeded,
+                steps_failed=row.steps_failed,
+                materializations=row.materializations,
+                expectations=row.expectations,
+                start_time=datetime_as_float(row.start_time) if row.start_time else None,
+                end_time=datetime_as_float(row.end_time) if row.end_time else None,
+            )
 
+        return stats_by_run_id
+
+    def _get_stats_for_runs_from_event_log(self, run_ids):
         query = (
             db.select(
                 [
+                    SqlEventLogStorageTable.c.run_id,
                     SqlEventLogStorageTable.c.dagster_event_type,
                     db.func.count().label("n_events_of_type"),
                     db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
                 ]
             )
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .group_by("dagster_event_type")
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .group_by("run_id", "dagster_event_type")
         )
 
-        with self.connect(run_id) as conn:
+        with self.connect(run_ids[0]) as conn:
             results = conn.execute(query).fetchall()
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
-                if dagster_event_type:
-                    counts[dagster_event_type] = n_events_of_type
-                    times[dagster_event_type] = last_event_timestamp
-
-            start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
-            end_time = times.get(
-                DagsterEventType.PIPELINE_SUCCESS.value,
-                times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
-            )
+        results_by_run_id = defaultdict(list)
+        for result in results:
+            results_by_run_id[result.run_id].append(result)
 
-            return PipelineRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                start_time=datetime_as_float(start_time) if start_time else None,
-                end_time=datetime_as_float(end_time) if end_time else None,
-            )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+        stats_by_run_id = {}
+        for run_id in run_ids:
+            try:
+                counts = {}
+                times = {}
+                for result in results_by_run_id[run_id]:
+                    (_, dagster_event_type, n_events_of_type, last_event_timestamp) = result
+                    if dagster_event_type:
+                        counts[dagster_event_type] = n_events_of_type
+                        times[dagster_event_type] = last_event_timestamp
+
+                start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+                end_time = times.get(
+                    DagsterEventType.PIPELINE_SUCCESS.value,
+                    times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
+                )
+
+                stats_by_run_id[run_id] = PipelineRunStatsSnapshot(
+                    run_id=run_id,
+                    steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+                    steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+                    materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
+                    expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+                    start_time=datetime_as_float(start_time) if start_time else None,
+                    end_time=datetime_as_float(end_time) if end_time else None,
+                )
+            except (seven.JSONDecodeError, check.CheckError) as err:
+                six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+        return stats_by_run_id
 
     def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
+        return self._get_step_stats_for_runs([run_id], step_keys)[run_id]
+
+    def get_step_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return self._get_step_stats_for_runs(run_ids) if run_ids else {}
+
+    def _get_step_stats_for_runs(self, run_ids, step_keys=None):
+        # Storages that shard by run id connect to the shard of the first run, so only query a
+        # single run at a time (see SqliteEventLogStorage)
+        if self.has_secondary_index(SECONDARY_INDEX_STEP_STATS, run_id=run_ids[0]):
+            return self._get_step_stats_for_runs_from_index(run_ids, step_keys)
+
+        return self._get_step_stats_for_runs_from_event_log(run_ids, step_keys)
+
+    def _get_step_stats_for_runs_from_index(self, run_ids, step_keys=None):
+        query = (
+            db.select([StepStatsTable])
+            .where(StepStatsTable.c.run_id.in_(run_ids))
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self.connect(run_ids[0]) as conn:
+            rows = conn.execute(query).fetchall()
+
+        # each materialization / expectation result already has its own row in the event log
+        materializations, expectation_results = self._get_step_values_from_event_log(
+            run_ids, step_keys
+        )
+
+        step_stats_by_run_id = {run_id: [] for run_id in run_ids}
+        for row in rows:
+            step_stats_by_run_id[row.run_id].append(
+                RunStepKeyStatsSnapshot(
+                    run_id=row.run_id,
+                    step_key=row.step_key,
+                    status=StepEventStatus(row.status) if row.status else None,
+                    start_time=datetime_as_float(row.start_time) if row.start_time else None,
+                    end_time=datetime_as_float(row.end_time) if row.end_time else None,
+                    materializations=materializations[row.run_id].get(row.step_key),
+                    expectation_results=expectation_results[row.run_id].get(row.step_key),
+                    attempts=row.attempts,
+                )
+            )
+
+        return step_stats_by_run_id
+
+    def _get_step_values_from_event_log(self, run_ids, step_keys=None):
+        """Returns the materializations and the expectation results of the steps of the given runs,
+        each keyed by run id and then by step key."""
+        # run_id -> step_key -> values
+        materializations = defaultdict(lambda: defaultdict(list))
+        expectation_results = defaultdict(lambda: defaultdict(list))
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(SqlEventLogStorageTable.c.step_key != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.STEP_MATERIALIZATION.value,
+                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    ]
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        if step_keys:
+            raw_event_query = raw_event_query.where(
+                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            )
+
+        with self.connect(run_ids[0]) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        for (run_id, json_str) in results:
+            try:
+                event = check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
+                )
+            except (seven.JSONDecodeError, check.CheckError) as err:
+                six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+            if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
+                materializations[run_id][event.step_key].append(
+                    event.dagster_event.event_specific_data.materialization
+                )
+            elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                expectation_results[run_id][event.step_key].append(
+                    event.dagster_event.event_specific_data.expectation_result
+                )
 
+        return materializations, expectation_results
+
+    def _get_step_stats_for_runs_from_event_log(self, run_ids, step_keys=None):
         STEP_STATS_EVENT_TYPES = [
             DagsterEventType.STEP_START.value,
             DagsterEventType.STEP_SUCCESS.value,
@@ -225,13 +723,14 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         by_step_query = (
             db.select(
                 [
+                    SqlEventLogStorageTable.c.run_id,
                     SqlEventLogStorageTable.c.step_key,
                     SqlEventLogStorageTable.c.dagster_event_type,
                     db.func.max(SqlEventLogStorageTable.c.timestamp).label("timestamp"),
                     db.func.count(SqlEventLogStorageTable.c.id).label("count"),
                 ]
             )
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(SqlEventLogStorageTable.c.dagster_event_type.in_(STEP_STATS_EVENT_TYPES))
         )
@@ -240,98 +739,101 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             by_step_query = by_step_query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
 
         by_step_query = by_step_query.group_by(
-            SqlEventLogStorageTable.c.step_key, SqlEventLogStorageTable.c.dagster_event_type,
+            SqlEventLogStorageTable.c.run_id,
+            SqlEventLogStorageTable.c.step_key,
+            SqlEventLogStorageTable.c.dagster_event_type,
         )
 
-        with self.connect(run_id) as conn:
+        with self.connect(run_ids[0]) as conn:
             results = conn.execute(by_step_query).fetchall()
 
-        by_step_key = defaultdict(dict)
+        # run_id -> step_key -> stats
+        by_step_key = defaultdict(lambda: defaultdict(dict))
         for result in results:
-            step_key = result.step_key
+            step_stats = by_step_key[result.run_id][result.step_key]
             if result.dagster_event_type == DagsterEventType.STEP_START.value:
-                by_step_key[step_key]["start_time"] = (
+                step_stats["start_time"] = (
                     datetime_as_float(result.timestamp) if result.timestamp else None
                 )
-                by_step_key[step_key]["attempts"] = by_step_key[step_key].get("attempts", 0) + 1
+                step_stats["attempts"] = step_stats.get("attempts", 0) + 1
             if result.dagster_event_type == DagsterEventType.STEP_RESTARTED.value:
-                by_step_key[step_key]["attempts"] = (
+                step_stats["attempts"] = (
                     # In case we see step retarted events but not a step started event, we want to
                     # only count the restarted events, since the attempt count represents
                     # the number of times we have successfully started runnning the step
-                    by_step_key[step_key].get("attempts", 0)
+                    step_stats.get("attempts", 0)
                     + result.count
                 )
             if result.dagster_event_type == DagsterEventType.STEP_FAILURE.value:
-                by_step_key[step_key]["end_time"] = (
+                step_stats["end_time"] = (
                     datetime_as_float(result.timestamp) if result.timestamp else None
                 )
-                by_step_key[step_key]["status"] = StepEventStatus.FAILURE
+                step_stats["status"] = StepEventStatus.FAILURE
             if result.dagster_event_type == DagsterEventType.STEP_SUCCESS.value:
-                by_step_key[step_key]["end_time"] = (
+                step_stats["end_time"] = (
                     datetime_as_float(result.timestamp) if result.timestamp else None
                 )
-                by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
+                step_stats["status"] = StepEventStatus.SUCCESS
             if result.dagster_event_type == DagsterEventType.STEP_SKIPPED.value:
-                by_step_key[step_key]["end_time"] = (
+                step_stats["end_time"] = (
                     datetime_as_float(result.timestamp) if result.timestamp else None
                 )
-                by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+                step_stats["status"] = StepEventStatus.SKIPPED
 
-        materializations = defaultdict(list)
-        expectation_results = defaultdict(list)
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                    ]
+        materializations, expectation_results = self._get_step_values_from_event_log(
+            run_ids, step_keys
+        )
+
+        return {
+            run_id: [
+                RunStepKeyStatsSnapshot(
+                    run_id=run_id,
+                    step_key=step_key,
+                    status=value.get("status"),
+                    start_time=value.get("start_time"),
+                    end_time=value.get("end_time"),
+                    materializations=materializations[run_id].get(step_key),
+                    expectation_results=expectation_results[run_id].get(step_key),
+                    attempts=value.get("attempts"),
                 )
+                for step_key, value in by_step_key[run_id].items()
+            ]
+            for run_id in run_ids
+        }
+
+    def get_asset_keys_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return {}
+
+        query = (
+            db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.STEP_MATERIALIZATION.value
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
 
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
-
-        with self.connect(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+        # Storages that shard by run id connect to the shard of the first run, so only query a
+        # single run at a time (see SqliteEventLogStorage)
+        with self.connect(run_ids[0]) as conn:
+            results = conn.execute(query).fetchall()
 
-        try:
-            for (json_str,) in results:
+        asset_keys_by_run_id = {run_id: [] for run_id in run_ids}
+        for (run_id, json_str) in results:
+            try:
                 event = check.inst_param(
                     deserialize_json_to_dagster_namedtuple(json_str), "event", EventRecord
                 )
-                if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
-                    materializations[event.step_key].append(
-                        event.dagster_event.event_specific_data.materialization
-                    )
-                elif event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-                    expectation_results[event.step_key].append(
-                        event.dagster_event.event_specific_data.expectation_result
-                    )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+            except (seven.JSONDecodeError, check.CheckError) as err:
+                six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
 
-        return [
-            RunStepKeyStatsSnapshot(
-                run_id=run_id,
-                step_key=step_key,
-                status=value.get("status"),
-                start_time=value.get("start_time"),
-                end_time=value.get("end_time"),
-                materializations=materializations.get(step_key),
-                expectation_results=expectation_results.get(step_key),
-                attempts=value.get("attempts"),
-            )
-            for step_key, value in by_step_key.items()
-        ]
+            if event.dagster_event.asset_key:
+                asset_keys_by_run_id[run_id].append(event.dagster_event.asset_key)
+
+        return asset_keys_by_run_id
 
     def wipe(self):
         """Clears the event log storage."""
@@ -341,6 +843,10 @@ def wipe(self):
         with self.connect() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if self.has_stats_tables(conn):
+                conn.execute(RunStatsTable.delete())  # pylint: disable=no-value-for-parameter
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
+            conn.execute(StepOutputVersionsTable.delete())  # pylint: disable=no-value-for-parameter
 
     def delete_events(self, run_id):
         check.str_param(run_id, "run_id")
@@ -361,6 +867,22 @@ def delete_events(self, run_id):
                 for row in conn.execute(removed_asset_key_query).fetchall()
             ]
             conn.execute(delete_statement)
+            if self.has_stats_tables(conn):
+                conn.execute(
+                    RunStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        RunStatsTable.c.run_id == run_id
+                    )
+                )
+                conn.execute(
+                    StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        StepStatsTable.c.run_id == run_id
+                    )
+                )
+            conn.execute(
+                StepOutputVersionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepOutputVersionsTable.c.run_id == run_id
+                )
+            )
             if len(removed_asset_keys) > 0:
                 keys_to_check = []
                 keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -484,6 +1006,48 @@ def _add_cursor_limit_to_query(self, query, cursor, limit):
         query = query.order_by(SqlEventLogStorageTable.c.timestamp.desc())
         return query
 
+    def get_addresses_for_step_output_versions(self, step_output_versions):
+        check.dict_param(step_output_versions, "step_output_versions", key_type=tuple)
+
+        addresses = {key: None for key in step_output_versions}
+        versions = sorted(
+            set(version for version in step_output_versions.values() if version is not None)
+        )
+        if not versions or not self.has_secondary_index(SECONDARY_INDEX_STEP_OUTPUT_VERSIONS):
+            return addresses
+
+        pipeline_names = sorted(set(pipeline_name for pipeline_name, _ in step_output_versions))
+        rows = []
+        with self.connect() as conn:
+            for i in range(0, len(versions), STEP_OUTPUT_VERSIONS_QUERY_CHUNK_SIZE):
+                query = (
+                    db.select(
+                        [
+                            StepOutputVersionsTable.c.pipeline_name,
+                            StepOutputVersionsTable.c.step_key,
+                            StepOutputVersionsTable.c.output_name,
+                            StepOutputVersionsTable.c.version,
+                            StepOutputVersionsTable.c.address,
+                        ]
+                    )
+                    .where(StepOutputVersionsTable.c.pipeline_name.in_(pipeline_names))
+                    .where(
+                        StepOutputVersionsTable.c.version.in_(
+                            versions[i : i + STEP_OUTPUT_VERSIONS_QUERY_CHUNK_SIZE]
+                        )
+                    )
+                    .order_by(StepOutputVersionsTable.c.id.asc())
+                )
+                rows.extend(conn.execute(query).fetchall())
+
+        # later rows overwrite earlier ones, so each output resolves to its most recent address
+        for pipeline_name, step_key, output_name, version, address in rows:
+            key = (pipeline_name, StepOutputHandle(step_key, output_name))
+            if key in addresses and step_output_versions[key] == version:
+                addresses[key] = address
+
+        return addresses
+
     def has_asset_key(self, asset_key):
         check.inst_param(asset_key, "asset_key", AssetKey)
         if self.has_secondary_index(SECONDARY_INDEX_ASSET_KEY):
@@ -47,6 +47,7 @@ class ConsolidatedSqliteEventLogStorage(AssetAwareSqlEventLogStorage, Configurab
     """
 
     def __init__(self, base_dir, inst_data=None):
+        super(ConsolidatedSqliteEventLogStorage, self).__init__()
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
@@ -58,6 +58,7 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def __init__(self, base_dir, inst_data=None):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database."""
+        super(SqliteEventLogStorage, self).__init__()
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
         mkdir_p(self._base_dir)
 
@@ -138,6 +139,9 @@ def _initdb(self, engine):
                     "table asset_keys already exists" in err_msg
                     or "table secondary_indexes already exists" in err_msg
                     or "table event_logs already exists" in err_msg
+                    or "table run_stats already exists" in err_msg
+                    or "table step_stats already exists" in err_msg
+                    or "table step_output_versions already exists" in err_msg
                     or "database is locked" in err_msg
                     or "table alembic_version already exists" in err_msg
                     or "UNIQUE constraint failed: alembic_version.version_num" in err_msg
@@ -187,6 +191,31 @@ def has_secondary_index(self, name, run_id=None):
     def enable_secondary_index(self, name, run_id=None):
         pass
 
+    def store_stats(self, conn, events):
+        # the summary tables are only read from storages that support secondary indexes
+        pass
+
+    def store_step_output_versions(self, conn, events):
+        # step output versions are looked up across runs, which sharded storages can't query
+        pass
+
+    # Each run is stored in its own database, so runs can't be queried together
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_step_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_asset_keys_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {
+            run_id: super(SqliteEventLogStorage, self).get_asset_keys_for_runs([run_id])[run_id]
+            for run_id in run_ids
+        }
+
     def wipe(self):
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
@@ -1,5 +1,6 @@
 import os
 import pickle
+import shutil
 
 from dagster import check
 from dagster.config import Field
@@ -7,6 +8,10 @@
 from dagster.core.definitions.events import AssetKey, AssetMaterialization, EventMetadataEntry
 from dagster.core.execution.context.system import InputContext, OutputContext
 from dagster.core.storage.object_manager import ObjectManager, object_manager
+from dagster.core.types.marshal import (
+    OutOfBandPickleSerializationStrategy,
+    PickleSerializationStrategy,
+)
 from dagster.utils import PICKLE_PROTOCOL, mkdir_p
 from dagster.utils.backcompat import experimental
 
@@ -109,6 +114,18 @@ def load_input(self, context):
         with open(filepath, self.read_mode) as read_obj:
             return pickle.load(read_obj)
 
+    def rm_output(self, context):
+        """Remove the file of an output that will not be loaded again."""
+        check.inst_param(context, "context", OutputContext)
+
+        filepath = self._get_path(context)
+
+        if not os.path.exists(filepath):
+            return False
+
+        os.unlink(filepath)
+        return True
+
 
 class CustomPathPickledObjectFilesystemObjectManager(ObjectManager):
     """Built-in filesystem asset store that stores and retrieves values using pickling and
@@ -195,3 +212,136 @@ def pipe():
             sample_data()
     """
     return CustomPathPickledObjectFilesystemObjectManager(init_context.resource_config["base_dir"])
+
+
+class TypedFilesystemObjectManager(ObjectManager):
+    """Filesystem object manager that stores each output using the serialization strategy of its
+    dagster type.
+
+    Outputs whose dagster type has a serialization strategy other than the default pickling are
+    stored using that strategy, e.g. Parquet for dagster-pandas dataframe types that declare it.
+    All other outputs are pickled with
+    :py:class:`~dagster.core.types.marshal.OutOfBandPickleSerializationStrategy`, which writes the
+    buffers of values such as numpy arrays to files of their own and memory-maps them on load,
+    rather than copying them in and out of a single pickle.
+
+    Args:
+        base_dir (Optional[str]): base directory where all the step outputs which use this object
+            manager will be stored in.
+    """
+
+    def __init__(self, base_dir=None):
+        self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.default_serialization_strategy = OutOfBandPickleSerializationStrategy()
+
+    def _get_path(self, context):
+        return os.path.join(self.base_dir, *context.get_run_scoped_output_identifier())
+
+    def _get_serialization_strategy(self, context):
+        dagster_type = (
+            context.solid_def.output_def_named(context.name).dagster_type
+            if context.solid_def
+            else None
+        )
+        # Types that don't choose a strategy of their own get a plain PickleSerializationStrategy
+        if dagster_type is None or type(dagster_type.serialization_strategy) is (
+            PickleSerializationStrategy
+        ):
+            return self.default_serialization_strategy
+        return dagster_type.serialization_strategy
+
+    def handle_output(self, context, obj):
+        """Serialize the object to a path constructed from the output's run scoped identifier.
+
+        Returns the path and the number of bytes written as EventMetadataEntries.
+        """
+        check.inst_param(context, "context", OutputContext)
+
+        filepath = self._get_path(context)
+        serialization_strategy = self._get_serialization_strategy(context)
+
+        _rm_path(filepath)
+        mkdir_p(os.path.dirname(filepath))
+
+        serialization_strategy.serialize_to_file(obj, filepath)
+
+        return [
+            EventMetadataEntry.fspath(os.path.abspath(filepath)),
+            EventMetadataEntry.text(serialization_strategy.name, "serialization_strategy"),
+            EventMetadataEntry.int(_get_path_size(filepath), "bytes", "Bytes written"),
+        ]
+
+    def load_input(self, context):
+        """Deserialize the object with the same serialization strategy it was stored with."""
+        check.inst_param(context, "context", InputContext)
+
+        return self._get_serialization_strategy(context.upstream_output).deserialize_from_file(
+            self._get_path(context.upstream_output)
+        )
+
+    def rm_output(self, context):
+        """Remove the files of an output that will not be loaded again."""
+        check.inst_param(context, "context", OutputContext)
+
+        filepath = self._get_path(context)
+
+        if not os.path.exists(filepath):
+            return False
+
+        _rm_path(filepath)
+        return True
+
+
+@object_manager(
+    config_schema={"base_dir": Field(StringSource, default_value=".", is_required=False)}
+)
+@experimental
+def typed_fs_object_manager(init_context):
+    """Filesystem object manager that picks how to serialize each output based on its dagster type.
+
+    Like :py:func:`fs_object_manager`, it stores step outputs in run scoped paths under a base
+    directory. Outputs whose dagster type declares a ``serialization_strategy`` are stored using
+    it. All other outputs are pickled with pickle protocol 5, writing large buffers such as those of
+    numpy arrays and pandas frames to separate files that are memory-mapped back on load, so that
+    they are not copied in and out of a single pickle.
+
+    The number of bytes written for each output is reported as metadata of its store operation,
+    along with the time that the operation took.
+
+    Example usage:
+
+    .. code-block:: python
+
+        @solid
+        def solid_a(context):
+            return np.zeros(10 ** 9)
+
+        @solid
+        def solid_b(context, arr):
+            return arr[:5]
+
+        @pipeline(
+            mode_defs=[ModeDefinition(resource_defs={"asset_store": typed_fs_object_manager})]
+        )
+        def pipe():
+            solid_b(solid_a())
+    """
+    return TypedFilesystemObjectManager(init_context.resource_config["base_dir"])
+
+
+def _rm_path(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.unlink(path)
+
+
+def _get_path_size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    return sum(
+        os.path.getsize(os.path.join(dirpath, filename))
+        for dirpath, _, filenames in os.walk(path)
+        for filename in filenames
+    )
@@ -31,6 +31,15 @@ def has_intermediate(self, context, step_output_handle):
     def copy_intermediate_from_run(self, context, run_id, step_output_handle):
         pass
 
+    def rm_intermediate(self, context, step_output_handle):
+        """Remove the intermediate for a step output once no step will read it again.
+
+        Storages that can't remove intermediates keep them.
+
+        Returns:
+            Optional[ObjectStoreOperation]: The remove operation, if the intermediate was removed.
+        """
+
     @abstractproperty
     def is_persistent(self):
         pass
@@ -4,12 +4,13 @@
 from collections import defaultdict
 from contextlib import contextmanager
 
-from dagster import StringSource, check
+from dagster import Field, Float, StringSource, check
 from dagster.core.execution.compute_logs import mirror_stream_to_file
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
 from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 from .compute_log_manager import (
@@ -29,10 +30,15 @@
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
     """Stores copies of stdout & stderr for each compute step locally on disk.
+
+    Subscriptions to the logs are notified of new output by the operating system's file system
+    events (e.g. inotify). Set ``polling_timeout`` to poll the files for changes instead, e.g. when
+    ``base_dir`` is on a network file system that doesn't support file system events.
     """
 
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, polling_timeout=None, inst_data=None):
         self._base_dir = base_dir
+        self._polling_timeout = check.opt_numeric_param(polling_timeout, "polling_timeout")
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -54,7 +60,7 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {"base_dir": StringSource, "polling_timeout": Field(Float, is_required=False)}
 
     @staticmethod
     def from_config_value(inst_data, config_value):
@@ -76,6 +82,10 @@ def _get_local_path(self, run_id, key, extension):
             filename = "{}.{}".format(hashlib.md5(key.encode("utf-8")).hexdigest(), extension)
         return os.path.join(self._run_directory(run_id), filename)
 
+    @property
+    def polling_timeout(self):
+        return self._polling_timeout
+
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
@@ -133,8 +143,11 @@ def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
         self._watchers = {}
-        self._observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
-        self._observer.start()
+        self._observer = None
+        self._polling_observer = None
+        if manager.polling_timeout is None:
+            self._observer = Observer()
+            self._observer.start()
 
     def _key(self, run_id, key):
         return "{}:{}".format(run_id, key)
@@ -151,8 +164,8 @@ def remove_all_subscriptions(self, run_id, key):
             subscription.complete()
 
     def watch(self, run_id, key):
-        key = self._key(run_id, key)
-        if key in self._watchers:
+        watch_key = self._key(run_id, key)
+        if watch_key in self._watchers:
             return
 
         update_paths = [
@@ -163,10 +176,30 @@ def watch(self, run_id, key):
         directory = os.path.dirname(self._manager.get_local_path(run_id, key, ComputeIOType.STDERR))
 
         ensure_dir(directory)
-        self._watchers[key] = self._observer.schedule(
-            LocalComputeLogFilesystemEventHandler(self, run_id, key, update_paths, complete_paths),
-            str(directory),
+        handler = LocalComputeLogFilesystemEventHandler(
+            self, run_id, key, update_paths, complete_paths
         )
+        if self._observer:
+            try:
+                self._watchers[watch_key] = (
+                    self._observer,
+                    self._observer.schedule(handler, str(directory)),
+                )
+                return
+            except OSError:
+                # e.g. the limit on the number of inotify watches was reached
+                pass
+
+        observer = self._get_polling_observer()
+        self._watchers[watch_key] = (observer, observer.schedule(handler, str(directory)))
+
+    def _get_polling_observer(self):
+        if not self._polling_observer:
+            self._polling_observer = PollingObserver(
+                timeout=self._manager.polling_timeout or WATCHDOG_POLLING_TIMEOUT
+            )
+            self._polling_observer.start()
+        return self._polling_observer
 
     def notify_subscriptions(self, run_id, key):
         key = self._key(run_id, key)
@@ -176,11 +209,15 @@ def notify_subscriptions(self, run_id, key):
     def unwatch(self, run_id, key, handler):
         key = self._key(run_id, key)
         if key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[key])
+            observer, watch = self._watchers[key]
+            observer.remove_handler_for_watch(handler, watch)
         del self._watchers[key]
 
     def dispose(self):
-        self._observer.stop()
+        if self._observer:
+            self._observer.stop()
+        if self._polling_observer:
+            self._polling_observer.stop()
 
 
 class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
@@ -197,6 +234,9 @@ def on_created(self, event):
         if event.src_path in self.complete_paths:
             self.manager.remove_all_subscriptions(self.run_id, self.key)
             self.manager.unwatch(self.run_id, self.key, self)
+        elif event.src_path in self.update_paths:
+            # a file created and written to between two polls is only reported as created
+            self.manager.notify_subscriptions(self.run_id, self.key)
 
     def on_modified(self, event):
         if event.src_path in self.update_paths:
@@ -50,6 +50,18 @@ class ObjectManager(InputManager, OutputManager):
     object.
     """
 
+    def rm_output(self, context):
+        """Optionally implement this method to remove a stored output once no step in the run will
+        load it again. It's called for runs tagged with ``dagster/gc_step_outputs``.
+
+        Args:
+            context (OutputContext): The context of the step output that produced the object.
+
+        Returns:
+            bool: True if the object was removed, False if it was kept.
+        """
+        return False
+
 
 def object_manager(
     config_schema=None,
@@ -126,7 +126,11 @@ def set_object(self, key, obj, serialization_strategy=DEFAULT_SERIALIZATION_STRA
 
         if os.path.exists(key):
             logging.warning("Removing existing path {path}".format(path=key))
-            os.unlink(key)
+            # Some serialization strategies write a directory rather than a single file
+            if os.path.isdir(key):
+                shutil.rmtree(key)
+            else:
+                os.unlink(key)
 
         # Ensure path exists
         mkdir_p(os.path.dirname(key))
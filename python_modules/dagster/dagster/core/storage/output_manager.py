@@ -60,6 +60,11 @@ def handle_output(self, context, obj):
         Args:
             context (OutputContext): The context of the step output that produces this object.
             obj (Any): The data object to be handled.
+
+        Returns:
+            Optional[Union[AssetMaterialization, EventMetadataEntry, List[...]]]: Materializations
+            of the handled object, and EventMetadataEntries to attach to the store operation
+            event, e.g. the number of bytes written.
         """
 
 
@@ -1,6 +1,20 @@
 from abc import ABCMeta, abstractmethod
 
 import six
+from dagster.core.storage.tags import PRIORITY_TAG
+
+from ..pipeline_run import PipelineRunStatus, PipelineRunsFilter
+
+
+def get_run_priority(priority_tag_value):
+    """Runs without a priority tag, or with a non-integer one, have the default priority of 0."""
+    if priority_tag_value is None:
+        return 0
+
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
 
 
 class RunStorage(six.with_metaclass(ABCMeta)):
@@ -65,6 +79,24 @@ def get_runs_count(self, filters=None):
             int: The number of runs that match the given filters.
         """
 
+    def get_queued_runs(self, limit=None):
+        """Return the queued runs in the order in which they should be launched: highest priority
+        first, and in the order in which they were created within a priority.
+
+        Args:
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRun]
+        """
+        # Reversed for fifo ordering
+        runs = self.get_runs(filters=PipelineRunsFilter(statuses=[PipelineRunStatus.QUEUED]))[::-1]
+        # sorted is stable, so fifo is maintained
+        runs = sorted(
+            runs, key=lambda run: get_run_priority(run.tags.get(PRIORITY_TAG)), reverse=True
+        )
+        return runs[:limit] if limit else runs
+
     @abstractmethod
     def get_run_group(self, run_id):
         """Get the run group to which a given run belongs.
@@ -244,6 +276,9 @@ def dispose(self):
     def optimize_for_dagit(self, statement_timeout):
         """Allows for optimizing database connection / use in the context of a long lived dagit process"""
 
+    def reindex(self, print_fn=lambda _: None, force=False):
+        """Call this method to build any indexes over the stored runs that are missing."""
+
     # Daemon Heartbeat Storage
     #
     # Holds heartbeats from the Dagster Daemon so that other system components can alert when it's not
@@ -57,4 +57,6 @@
     db.Column("info", db.String),
 )
 
-db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value)
+db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, RunTagsTable.c.run_id)
+db.Index("idx_run_status", RunsTable.c.status, RunsTable.c.id)
+db.Index("idx_run_pipeline_name", RunsTable.c.pipeline_name, RunsTable.c.id)
@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+
+from dagster import check
+
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SNAPSHOT_CACHE_MAX_ENTRIES = 256
+
+
+class SnapshotCache:
+    """Bounded, size-aware LRU cache of deserialized snapshots, keyed by snapshot id.
+
+    Snapshot ids are hashes of the snapshot contents, so a cached snapshot never goes stale. Each
+    entry is weighed by the size of its serialized form; least recently used entries are evicted
+    once either ``max_bytes`` or ``max_entries`` is exceeded. Snapshots larger than ``max_bytes``
+    are never cached.
+    """
+
+    def __init__(self, max_bytes=None, max_entries=None):
+        self._max_bytes = check.opt_int_param(
+            max_bytes, "max_bytes", DEFAULT_SNAPSHOT_CACHE_MAX_BYTES
+        )
+        self._max_entries = check.opt_int_param(
+            max_entries, "max_entries", DEFAULT_SNAPSHOT_CACHE_MAX_ENTRIES
+        )
+        check.invariant(self._max_bytes > 0, "max_bytes must be greater than 0")
+        check.invariant(self._max_entries > 0, "max_entries must be greater than 0")
+
+        self._lock = threading.Lock()
+        # snapshot_id -> (snapshot, size), ordered from least to most recently used
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def size_bytes(self):
+        return self._size_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, snapshot_id):
+        with self._lock:
+            return snapshot_id in self._entries
+
+    def get(self, snapshot_id):
+        """Returns the cached snapshot with the given id, or None if it is not cached."""
+        check.str_param(snapshot_id, "snapshot_id")
+
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def put(self, snapshot_id, snapshot, size):
+        check.str_param(snapshot_id, "snapshot_id")
+        check.not_none_param(snapshot, "snapshot")
+        check.int_param(size, "size")
+
+        if size > self._max_bytes:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(snapshot_id, None)
+            if existing is not None:
+                self._size_bytes -= existing[1]
+
+            self._entries[snapshot_id] = (snapshot, size)
+            self._size_bytes += size
+
+            while self._size_bytes > self._max_bytes or len(self._entries) > self._max_entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
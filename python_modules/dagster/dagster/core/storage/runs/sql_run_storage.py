@@ -16,15 +16,16 @@
     create_execution_plan_snapshot_id,
     create_pipeline_snapshot_id,
 )
-from dagster.core.storage.tags import ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import PRIORITY_TAG, ROOT_RUN_ID_TAG
 from dagster.daemon.types import DaemonHeartbeat, DaemonType
 from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
 from dagster.seven import JSONDecodeError
 from dagster.utils import merge_dicts
 
 from ..pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
-from .base import RunStorage
+from .base import RunStorage, get_run_priority
 from .schema import DaemonHeartbeatsTable, RunTagsTable, RunsTable, SnapshotsTable
+from .snapshot_cache import SnapshotCache
 
 
 class SnapshotType(Enum):
@@ -32,10 +33,14 @@ class SnapshotType(Enum):
     EXECUTION_PLAN = "EXECUTION_PLAN"
 
 
-class SqlRunStorage(RunStorage):  # pylint: disable=no-init
+class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages
     """
 
+    def __init__(self):
+        # Deserialized snapshots read from or written to this storage
+        self._snapshot_cache = SnapshotCache()
+
     @abstractmethod
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -46,6 +51,33 @@ def upgrade(self):
         out-of-date instance of the storage up to date.
         """
 
+    def reindex(self, print_fn=lambda _: None, force=False):
+        """Builds the indexes declared on the runs and run tags tables that are missing or out of
+        date, e.g. in databases created before they were introduced."""
+        with self.connect() as conn:
+            inspector = db.inspect(conn)
+            for table in [RunsTable, RunTagsTable]:
+                existing_indexes = {
+                    index["name"]: index["column_names"]
+                    for index in inspector.get_indexes(table.name)
+                }
+                for index in sorted(table.indexes, key=lambda index: index.name):
+                    column_names = [column.name for column in index.columns]
+                    if existing_indexes.get(index.name) == column_names and not force:
+                        print_fn("Skipping already built index: {}".format(index.name))
+                        continue
+
+                    print_fn("Building index: {}".format(index.name))
+                    if index.name in existing_indexes:
+                        index.drop(conn)
+                    index.create(conn)
+                    print_fn("Finished building index: {}".format(index.name))
+
+    @property
+    def snapshot_cache(self):
+        """SnapshotCache: Deserialized snapshots read from or written to this storage."""
+        return self._snapshot_cache
+
     def fetchall(self, query):
         with self.connect() as conn:
             result_proxy = conn.execute(query)
@@ -150,8 +182,16 @@ def _add_cursor_limit_to_query(self, query, cursor, limit):
         query = query.order_by(RunsTable.c.id.desc())
         return query
 
-    def _add_filters_to_query(self, query, filters):
+    def _add_filters_to_query(self, query, filters, correlate_tags=True):
+        """Adds the filters to a query over the runs table.
+
+        Tag filters are matched with a subquery per tag, which the run tags index answers without
+        joining or grouping the runs. Correlated EXISTS subqueries suit queries that read the
+        newest matching runs; uncorrelated IN subqueries suit queries that read every matching run,
+        e.g. counts.
+        """
         check.inst_param(filters, "filters", PipelineRunsFilter)
+        check.bool_param(correlate_tags, "correlate_tags")
 
         if filters.run_ids:
             query = query.where(RunsTable.c.run_id.in_(filters.run_ids))
@@ -164,18 +204,16 @@ def _add_filters_to_query(self, query, filters):
                 RunsTable.c.status.in_([status.value for status in filters.statuses])
             )
 
-        if filters.tags:
-            query = query.where(
-                db.or_(
-                    *(
-                        db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
-                        for key, value in filters.tags.items()
-                    )
+        for key, value in filters.tags.items():
+            is_tag = db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
+            if correlate_tags:
+                query = query.where(
+                    db.exists().where(db.and_(RunTagsTable.c.run_id == RunsTable.c.run_id, is_tag))
+                )
+            else:
+                query = query.where(
+                    RunsTable.c.run_id.in_(db.select([RunTagsTable.c.run_id]).where(is_tag))
                 )
-            ).group_by(RunsTable.c.run_body, RunsTable.c.id)
-
-            if len(filters.tags) > 0:
-                query = query.having(db.func.count(RunsTable.c.run_id) == len(filters.tags))
 
         if filters.snapshot_id:
             query = query.where(RunsTable.c.snapshot_id == filters.snapshot_id)
@@ -195,14 +233,7 @@ def _runs_query(self, filters=None, cursor=None, limit=None, columns=None):
             columns = ["run_body"]
 
         base_query_columns = [getattr(RunsTable.c, column) for column in columns]
-
-        # If we have a tags filter, then we need to select from a joined table
-        if filters.tags:
-            base_query = db.select(base_query_columns).select_from(
-                RunsTable.join(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id)
-            )
-        else:
-            base_query = db.select(base_query_columns).select_from(RunsTable)
+        base_query = db.select(base_query_columns).select_from(RunsTable)
 
         query = self._add_filters_to_query(base_query, filters)
         query = self._add_cursor_limit_to_query(query, cursor, limit)
@@ -216,17 +247,82 @@ def get_runs(self, filters=None, cursor=None, limit=None):
         return self._rows_to_runs(rows)
 
     def get_runs_count(self, filters=None):
-        subquery = self._runs_query(filters=filters).alias("subquery")
-
-        # We use an alias here because Postgres requires subqueries to be
-        # aliased.
-        subquery = subquery.alias("subquery")
+        filters = check.opt_inst_param(
+            filters, "filters", PipelineRunsFilter, default=PipelineRunsFilter()
+        )
 
-        query = db.select([db.func.count()]).select_from(subquery)
+        query = self._add_filters_to_query(
+            db.select([db.func.count()]).select_from(RunsTable), filters, correlate_tags=False
+        )
         rows = self.fetchall(query)
         count = rows[0][0]
         return count
 
+    def get_queued_runs(self, limit=None):
+        check.opt_int_param(limit, "limit")
+
+        is_queued = RunsTable.c.status == PipelineRunStatus.QUEUED.value
+        is_priority_tag = RunTagsTable.c.key == PRIORITY_TAG
+        runs_with_tags = RunsTable.join(RunTagsTable, RunTagsTable.c.run_id == RunsTable.c.run_id)
+
+        # Priority tag values are parsed here rather than cast in the query, so that malformed
+        # values get the default priority on every database
+        priority_tag_values = self.fetchall(
+            db.select([RunTagsTable.c.value])
+            .distinct()
+            .select_from(runs_with_tags)
+            .where(db.and_(is_queued, is_priority_tag))
+        )
+        values_by_priority = defaultdict(list)
+        for (value,) in priority_tag_values:
+            values_by_priority[get_run_priority(value)].append(value)
+        non_default_values = [
+            value
+            for priority, values in values_by_priority.items()
+            if priority != 0
+            for value in values
+        ]
+
+        # Each priority is fetched with its own query in creation order, so that every query can be
+        # answered from the run status and run tag indexes without sorting all the queued runs
+        runs = []
+        for priority in sorted(set(values_by_priority.keys()) | {0}, reverse=True):
+            if limit and len(runs) >= limit:
+                break
+
+            if priority == 0:
+                query = db.select([RunsTable.c.run_body]).where(is_queued)
+                if non_default_values:
+                    query = query.where(
+                        RunsTable.c.run_id.notin_(
+                            db.select([RunTagsTable.c.run_id]).where(
+                                db.and_(
+                                    is_priority_tag, RunTagsTable.c.value.in_(non_default_values)
+                                )
+                            )
+                        )
+                    )
+            else:
+                query = (
+                    db.select([RunsTable.c.run_body])
+                    .select_from(runs_with_tags)
+                    .where(
+                        db.and_(
+                            is_queued,
+                            is_priority_tag,
+                            RunTagsTable.c.value.in_(values_by_priority[priority]),
+                        )
+                    )
+                )
+
+            query = query.order_by(RunsTable.c.id.asc())
+            if limit:
+                query = query.limit(limit - len(runs))
+
+            runs.extend(self._rows_to_runs(self.fetchall(query)))
+
+        return runs
+
     def get_run_by_id(self, run_id):
         """Get a run by its id.
 
@@ -482,7 +578,7 @@ def get_pipeline_snapshot(self, pipeline_snapshot_id):
 
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id):
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
-        return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
+        return self._has_snapshot_id(execution_plan_snapshot_id)
 
     def add_execution_plan_snapshot(self, execution_plan_snapshot):
         check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
@@ -502,16 +598,22 @@ def _add_snapshot(self, snapshot_id, snapshot_obj, snapshot_type):
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        serialized_snapshot = serialize_dagster_namedtuple(snapshot_obj).encode()
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_dagster_namedtuple(snapshot_obj).encode()),
+                snapshot_body=zlib.compress(serialized_snapshot),
                 snapshot_type=snapshot_type.value,
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
+
+        self._snapshot_cache.put(snapshot_id, snapshot_obj, len(serialized_snapshot))
+        return snapshot_id
 
     def _has_snapshot_id(self, snapshot_id):
+        if snapshot_id in self._snapshot_cache:
+            return True
+
         query = db.select([SnapshotsTable.c.snapshot_id]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
@@ -521,13 +623,27 @@ def _has_snapshot_id(self, snapshot_id):
         return bool(row)
 
     def _get_snapshot(self, snapshot_id):
+        snapshot = self._snapshot_cache.get(snapshot_id)
+        if snapshot is not None:
+            return snapshot
+
         query = db.select([SnapshotsTable.c.snapshot_body]).where(
             SnapshotsTable.c.snapshot_id == snapshot_id
         )
 
         row = self.fetchone(query)
+        if not row:
+            return None
 
-        return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
+        decoded_str = _defensively_decode_snapshot_body(logging, row)
+        snapshot = (
+            _defensively_deserialize_snapshot(logging, decoded_str)
+            if decoded_str is not None
+            else None
+        )
+        if snapshot is not None:
+            self._snapshot_cache.put(snapshot_id, snapshot, len(decoded_str))
+        return snapshot
 
     # Daemon heartbeats
 
@@ -580,6 +696,8 @@ def wipe(self):
             conn.execute(SnapshotsTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(DaemonHeartbeatsTable.delete())  # pylint: disable=no-value-for-parameter
 
+        self._snapshot_cache.clear()
+
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
 
@@ -589,27 +707,39 @@ def defensively_unpack_pipeline_snapshot_query(logger, row):
     # row proxy and don't want to instance check on an internal
     # implementation detail
 
-    def _warn(msg):
-        logger.warning("get-pipeline-snapshot: {msg}".format(msg=msg))
+    decoded_str = _defensively_decode_snapshot_body(logger, row)
+    return (
+        _defensively_deserialize_snapshot(logger, decoded_str) if decoded_str is not None else None
+    )
 
+
+def _warn_snapshot_unpack(logger, msg):
+    logger.warning("{query_id}: {msg}".format(query_id=GET_PIPELINE_SNAPSHOT_QUERY_ID, msg=msg))
+
+
+def _defensively_decode_snapshot_body(logger, row):
     if not isinstance(row[0], six.binary_type):
-        _warn("First entry in row is not a binary type.")
+        _warn_snapshot_unpack(logger, "First entry in row is not a binary type.")
         return None
 
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
-        _warn("Could not decompress bytes stored in snapshot table.")
+        _warn_snapshot_unpack(logger, "Could not decompress bytes stored in snapshot table.")
         return None
 
     try:
-        decoded_str = uncompressed_bytes.decode()
+        return uncompressed_bytes.decode()
     except UnicodeDecodeError:
-        _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
+        _warn_snapshot_unpack(
+            logger, "Could not unicode decode decompressed bytes stored in snapshot table."
+        )
         return None
 
+
+def _defensively_deserialize_snapshot(logger, decoded_str):
     try:
         return deserialize_json_to_dagster_namedtuple(decoded_str)
     except JSONDecodeError:
-        _warn("Could not parse json in snapshot table.")
+        _warn_snapshot_unpack(logger, "Could not parse json in snapshot table.")
         return None
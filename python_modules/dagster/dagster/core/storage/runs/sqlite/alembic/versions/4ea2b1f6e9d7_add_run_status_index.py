@@ -0,0 +1,37 @@
+"""add run status index
+
+Revision ID: 4ea2b1f6e9d7
+Revises: 224640159acf
+Create Date: 2026-10-18 20:41:07.126483
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "4ea2b1f6e9d7"
+down_revision = "224640159acf"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if not "idx_run_status" in indices:
+            op.create_index("idx_run_status", "runs", ["status", "id"], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if "idx_run_status" in indices:
+            op.drop_index("idx_run_status", "runs")
@@ -0,0 +1,50 @@
+"""add run pipeline name and run tags run id indexes
+
+Revision ID: 7cba9eeaaf1d
+Revises: 4ea2b1f6e9d7
+Create Date: 2026-10-18 21:32:44.518230
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "7cba9eeaaf1d"
+down_revision = "4ea2b1f6e9d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if not "idx_run_pipeline_name" in indices:
+            op.create_index("idx_run_pipeline_name", "runs", ["pipeline_name", "id"], unique=False)
+
+    if "run_tags" in has_tables:
+        indices = {x.get("name"): x.get("column_names") for x in inspector.get_indexes("run_tags")}
+        if indices.get("idx_run_tags") != ["key", "value", "run_id"]:
+            if "idx_run_tags" in indices:
+                op.drop_index("idx_run_tags", "run_tags")
+            op.create_index("idx_run_tags", "run_tags", ["key", "value", "run_id"], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if "idx_run_pipeline_name" in indices:
+            op.drop_index("idx_run_pipeline_name", "runs")
+
+    if "run_tags" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("run_tags")]
+        if "idx_run_tags" in indices:
+            op.drop_index("idx_run_tags", "run_tags")
+            op.create_index("idx_run_tags", "run_tags", ["key", "value"], unique=False)
@@ -46,6 +46,7 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
     """
 
     def __init__(self, conn_string, inst_data=None):
+        super(SqliteRunStorage, self).__init__()
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
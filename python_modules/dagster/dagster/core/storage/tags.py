@@ -37,6 +37,8 @@
 
 PRIORITY_TAG = "{prefix}priority".format(prefix=SYSTEM_TAG_PREFIX)
 
+GC_STEP_OUTPUTS_TAG = "{prefix}gc_step_outputs".format(prefix=SYSTEM_TAG_PREFIX)
+
 
 class TagType(Enum):
     # Custom tag provided by a user
@@ -1,8 +1,14 @@
 """System-provided config objects and constructors."""
+import copy
+import hashlib
+import itertools
+import os
+import threading
 import warnings
-from collections import namedtuple
+import weakref
+from collections import OrderedDict, namedtuple
 
-from dagster import check
+from dagster import check, seven
 from dagster.core.definitions.pipeline import PipelineDefinition
 from dagster.core.definitions.run_config_schema import create_environment_type
 from dagster.core.errors import DagsterInvalidConfigError
@@ -107,18 +113,35 @@ def build(pipeline_def, run_config=None, mode=None):
         """This method validates a given run config against the pipeline config schema. If
         successful, we instantiate an EnvironmentConfig object.
 
+        Processed configs are cached for each pipeline definition, so building the same run
+        config for the same pipeline and mode again skips validation. Each build returns its own
+        copy of the processed config. Pipelines whose config goes through user-provided functions,
+        i.e. composite config mappings or definitions ``configured`` with a function, are never
+        cached, since those functions may depend on more than the run config.
+
         In case the run_config is invalid, this method raises a DagsterInvalidConfigError
         """
-        from dagster.config.validate import process_config
-        from dagster.core.definitions.executor import ExecutorDefinition
-        from dagster.core.definitions.intermediate_storage import IntermediateStorageDefinition
-        from .composite_descent import composite_descent
-
         check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
         run_config = check.opt_dict_param(run_config, "run_config")
         check.opt_str_param(mode, "mode")
 
         mode = mode or pipeline_def.get_default_mode_name()
+
+        cached = _environment_config_cache.get(pipeline_def, mode, run_config)
+        if cached is not None:
+            return cached
+
+        environment_config = EnvironmentConfig._build(pipeline_def, run_config, mode)
+        _environment_config_cache.put(pipeline_def, environment_config)
+        return environment_config
+
+    @staticmethod
+    def _build(pipeline_def, run_config, mode):
+        from dagster.config.validate import process_config
+        from dagster.core.definitions.executor import ExecutorDefinition
+        from dagster.core.definitions.intermediate_storage import IntermediateStorageDefinition
+        from .composite_descent import composite_descent
+
         environment_type = create_environment_type(pipeline_def, mode)
 
         config_evr = process_config(
@@ -178,6 +201,182 @@ def intermediate_storage_def_for_mode(self, mode_definition):
         )
 
 
+# The number of processed run configs that are cached for each pipeline definition
+ENVIRONMENT_CONFIG_CACHE_MAX_ENTRIES = 16
+
+
+def _get_env_var_names(config_value):
+    """Returns the names of the environment variables that a config value reads from, through
+    ``{"env": ...}`` entries for source config types."""
+    if isinstance(config_value, dict):
+        if len(config_value) == 1 and isinstance(config_value.get("env"), str):
+            return [config_value["env"]]
+        return [name for value in config_value.values() for name in _get_env_var_names(value)]
+    if isinstance(config_value, list):
+        return [name for value in config_value for name in _get_env_var_names(value)]
+    return []
+
+
+def _hash_run_config(run_config):
+    """Returns a hash of the contents of a run config and of the environment variables it reads
+    from, or None if it can't be serialized."""
+    env_var_names = sorted(set(_get_env_var_names(run_config)))
+    try:
+        serialized = seven.json.dumps(
+            [run_config, [(name, os.getenv(name)) for name in env_var_names]]
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def _invokes_config_fn(definition):
+    """Whether processing the config of a definition calls a user-provided function."""
+    from dagster.core.definitions.definition_config_schema import ConfiguredDefinitionConfigSchema
+    from dagster.core.definitions.graph import GraphDefinition
+
+    if isinstance(definition, GraphDefinition) and definition.has_config_mapping:
+        return True
+
+    config_schema = definition.config_schema
+    while isinstance(config_schema, ConfiguredDefinitionConfigSchema):
+        if config_schema.has_config_fn:
+            return True
+        config_schema = config_schema.parent_def.config_schema
+
+    return False
+
+
+def _is_environment_config_cacheable(pipeline_def, mode):
+    mode_def = pipeline_def.get_mode_definition(mode)
+    definitions = itertools.chain(
+        pipeline_def.all_solid_defs,
+        mode_def.resource_defs.values(),
+        mode_def.loggers.values(),
+        mode_def.executor_defs,
+        mode_def.intermediate_storage_defs,
+    )
+    return not any(_invokes_config_fn(definition) for definition in definitions)
+
+
+def _copy_environment_config(environment_config):
+    """Returns a deep copy of an EnvironmentConfig, or None if it can't be copied."""
+    try:
+        return copy.deepcopy(environment_config)
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+class EnvironmentConfigCache:
+    """Bounded LRU cache of the EnvironmentConfigs built for each pipeline definition, keyed by
+    mode and by a hash of the contents of the run config.
+
+    Pipeline definitions are immutable, so within a process a definition stands in for its
+    pipeline snapshot id, which is much more expensive to compute than the config is to look up.
+    Entries are dropped along with their pipeline definition.
+
+    The cache holds and hands out copies, so that callers mutating their config can't affect later
+    builds. Only the config of pipelines that don't call user-provided config functions is cached.
+    """
+
+    def __init__(self, max_entries=None):
+        self._max_entries = check.opt_int_param(
+            max_entries, "max_entries", ENVIRONMENT_CONFIG_CACHE_MAX_ENTRIES
+        )
+        check.invariant(self._max_entries > 0, "max_entries must be greater than 0")
+
+        self._lock = threading.Lock()
+        # pipeline_def -> (mode, run config hash) -> EnvironmentConfig, ordered from least to most
+        # recently used
+        self._entries = weakref.WeakKeyDictionary()
+        # pipeline_def -> mode -> whether its config can be cached
+        self._cacheable_modes = weakref.WeakKeyDictionary()
+
+    def _is_cacheable(self, pipeline_def, mode):
+        with self._lock:
+            cacheable_modes = self._cacheable_modes.get(pipeline_def)
+            if cacheable_modes is not None and mode in cacheable_modes:
+                return cacheable_modes[mode]
+
+        cacheable = _is_environment_config_cacheable(pipeline_def, mode)
+        with self._lock:
+            self._cacheable_modes.setdefault(pipeline_def, {})[mode] = cacheable
+        return cacheable
+
+    def get(self, pipeline_def, mode, run_config):
+        """Returns a copy of the cached EnvironmentConfig for a run config, or None if it is not
+        cached."""
+        if not self._is_cacheable(pipeline_def, mode):
+            return None
+
+        run_config_hash = _hash_run_config(run_config)
+        if run_config_hash is None:
+            return None
+
+        with self._lock:
+            pipeline_entries = self._entries.get(pipeline_def)
+            if not pipeline_entries:
+                return None
+
+            environment_config = pipeline_entries.get((mode, run_config_hash))
+            if environment_config is None:
+                return None
+
+            pipeline_entries.move_to_end((mode, run_config_hash))
+
+        # the cached config may have been built from an equal, but distinct, run config dict
+        return _copy_environment_config(environment_config)._replace(
+            original_config_dict=run_config
+        )
+
+    def put(self, pipeline_def, environment_config):
+        check.inst_param(environment_config, "environment_config", EnvironmentConfig)
+
+        if not self._is_cacheable(pipeline_def, environment_config.mode):
+            return
+
+        run_config_hash = _hash_run_config(environment_config.original_config_dict)
+        if run_config_hash is None:
+            return
+
+        # the caller keeps, and may mutate, the config it passed in
+        environment_config = _copy_environment_config(environment_config)
+        if environment_config is None:
+            return
+
+        with self._lock:
+            pipeline_entries = self._entries.get(pipeline_def)
+            if pipeline_entries is None:
+                pipeline_entries = OrderedDict()
+                self._entries[pipeline_def] = pipeline_entries
+
+            pipeline_entries[(environment_config.mode, run_config_hash)] = environment_config
+            pipeline_entries.move_to_end((environment_config.mode, run_config_hash))
+            while len(pipeline_entries) > self._max_entries:
+                pipeline_entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._cacheable_modes.clear()
+
+
+_environment_config_cache = EnvironmentConfigCache()
+
+
+def seed_environment_config_cache(pipeline_def, environment_config):
+    """Caches an EnvironmentConfig that was built elsewhere, e.g. by the parent of an executor
+    child process, so that building its run config for the pipeline skips validation."""
+    check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
+    check.inst_param(environment_config, "environment_config", EnvironmentConfig)
+
+    _environment_config_cache.put(pipeline_def, environment_config)
+
+
+def clear_environment_config_cache():
+    _environment_config_cache.clear()
+
+
 def run_config_storage_field_backcompat(run_config):
     """This method will be removed after "storage" is removed in run config.
 
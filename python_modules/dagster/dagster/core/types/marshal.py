@@ -1,10 +1,12 @@
+import mmap
+import os
 import pickle
 import sys
 from abc import ABCMeta, abstractmethod
 
 import six
 from dagster import check
-from dagster.utils import PICKLE_PROTOCOL
+from dagster.utils import PICKLE_PROTOCOL, mkdir_p
 
 
 class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
@@ -70,3 +72,78 @@ def serialize(self, value, write_file_obj):
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+class OutOfBandPickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    """Pickles values with pickle protocol 5, writing the large buffers that support out-of-band
+    pickling (e.g. those of numpy arrays and pandas frames) to files of their own.
+
+    Values are serialized to a directory rather than a single file. The buffers are memory-mapped
+    back on load rather than read, so they are neither copied into the pickle stream on write nor
+    read into memory until they are used.
+
+    On Python versions without pickle protocol 5 (< 3.8), values are pickled in-band to the same
+    directory layout.
+    """
+
+    PICKLE_FILE_NAME = "object.pickle"
+    BUFFER_FILE_PREFIX = "buffer_"
+
+    def __init__(self, name="out_of_band_pickle"):
+        super(OutOfBandPickleSerializationStrategy, self).__init__(name)
+
+    @property
+    def protocol(self):
+        return max(pickle.HIGHEST_PROTOCOL, PICKLE_PROTOCOL)
+
+    @property
+    def supports_out_of_band_buffers(self):
+        return self.protocol >= 5
+
+    def serialize(self, value, write_file_obj):
+        pickle.dump(value, write_file_obj, self.protocol)
+
+    def deserialize(self, read_file_obj):
+        return pickle.load(read_file_obj)
+
+    def serialize_to_file(self, value, write_path):
+        check.str_param(write_path, "write_path")
+
+        mkdir_p(write_path)
+
+        buffers = []
+        with open(os.path.join(write_path, self.PICKLE_FILE_NAME), self.write_mode) as write_obj:
+            if self.supports_out_of_band_buffers:
+                pickle.dump(value, write_obj, self.protocol, buffer_callback=buffers.append)
+            else:
+                self.serialize(value, write_obj)
+
+        for i, buffer in enumerate(buffers):
+            with open(self._buffer_path(write_path, i), self.write_mode) as write_obj:
+                write_obj.write(buffer.raw())
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, "read_path")
+
+        buffers = []
+        while os.path.exists(self._buffer_path(read_path, len(buffers))):
+            buffers.append(_mmap_file(self._buffer_path(read_path, len(buffers))))
+
+        with open(os.path.join(read_path, self.PICKLE_FILE_NAME), self.read_mode) as read_obj:
+            if self.supports_out_of_band_buffers:
+                return pickle.load(read_obj, buffers=buffers)
+            return self.deserialize(read_obj)
+
+    def _buffer_path(self, path, index):
+        return os.path.join(
+            path, "{prefix}{index}".format(prefix=self.BUFFER_FILE_PREFIX, index=index)
+        )
+
+
+def _mmap_file(path):
+    with open(path, "rb") as read_obj:
+        if os.fstat(read_obj.fileno()).st_size == 0:
+            # Empty files can't be memory-mapped
+            return bytearray()
+        # Copy-on-write, so that the loaded values are writable without modifying the file
+        return mmap.mmap(read_obj.fileno(), 0, access=mmap.ACCESS_COPY)
@@ -12,9 +12,19 @@
 @click.command(
     name="run", help="Run any daemons configured on the DagsterInstance.",
 )
-def run_command():
+@click.option(
+    "--iteration-wait-seconds",
+    type=click.FLOAT,
+    default=1.0,
+    show_default=True,
+    help="How long a daemon iteration may block the other daemons before it is left running "
+    "in the background.",
+)
+def run_command(iteration_wait_seconds):
     with DagsterInstance.get() as instance:
-        controller = DagsterDaemonController(instance)
+        controller = DagsterDaemonController(
+            instance, iteration_wait_seconds=iteration_wait_seconds
+        )
 
         while True:
             curr_time = pendulum.now("UTC")
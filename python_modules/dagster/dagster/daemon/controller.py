@@ -1,5 +1,7 @@
 import datetime
+import threading
 import uuid
+from concurrent.futures import Future, wait
 
 import pendulum
 from dagster import check
@@ -19,9 +21,44 @@ def _sorted_quoted(strings):
     return "[" + ", ".join(["'{}'".format(s) for s in sorted(list(strings))]) + "]"
 
 
+def _start_iteration_thread(daemon):
+    # Iterations run on daemon threads so that a hung iteration can't keep the process from
+    # exiting when it is interrupted
+    future = Future()
+
+    def _run_iteration():
+        try:
+            daemon.run_iteration()
+        except BaseException as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+
+    thread = threading.Thread(
+        target=_run_iteration, name="dagster-daemon-{}".format(daemon.daemon_type().value)
+    )
+    thread.daemon = True
+    thread.start()
+    return future
+
+
 class DagsterDaemonController:
-    def __init__(self, instance):
+    """Runs the daemons configured on an instance, each on its own thread.
+
+    Args:
+        instance (DagsterInstance): The instance whose daemons should be run.
+        iteration_wait_seconds (Optional[float]): How long ``run_iteration`` waits for the daemon
+            iterations it starts to finish. Iterations that are still running after this long
+            carry on in the background without blocking the other daemons, and the daemon is
+            skipped until its iteration finishes. If None, ``run_iteration`` waits for all of
+            them to finish.
+    """
+
+    def __init__(self, instance, iteration_wait_seconds=None):
         self._instance = instance
+        self._iteration_wait_seconds = check.opt_numeric_param(
+            iteration_wait_seconds, "iteration_wait_seconds"
+        )
 
         self._daemon_uuid = str(uuid.uuid4())
 
@@ -49,6 +86,7 @@ def __init__(self, instance):
 
         if isinstance(instance.run_coordinator, QueuedRunCoordinator):
             max_concurrent_runs = instance.run_coordinator.max_concurrent_runs
+            tag_concurrency_limits = instance.run_coordinator.tag_concurrency_limits
             self._add_daemon(
                 QueuedRunCoordinatorDaemon(
                     instance,
@@ -56,6 +94,7 @@ def __init__(self, instance):
                         instance, QueuedRunCoordinatorDaemon.daemon_type()
                     ),
                     max_concurrent_runs=max_concurrent_runs,
+                    tag_concurrency_limits=tag_concurrency_limits,
                 )
             )
 
@@ -70,6 +109,9 @@ def __init__(self, instance):
             )
         )
 
+        # at most one iteration of each daemon is in flight at a time
+        self._iteration_futures = {}
+
     def _add_daemon(self, daemon):
         self._daemons[daemon.daemon_type()] = daemon
 
@@ -81,13 +123,49 @@ def daemons(self):
         return list(self._daemons.values())
 
     def run_iteration(self, curr_time):
+        """Starts an iteration of each daemon whose interval has elapsed, each on its own thread,
+        and waits up to ``iteration_wait_seconds`` for the started iterations to finish.
+
+        Each daemon heartbeats when its iteration starts, so a daemon that hangs stops
+        heartbeating and is reported as unhealthy by ``get_daemon_status`` without affecting the
+        heartbeats of the other daemons.
+        """
+        self._check_finished_iterations()
+
+        started = []
         for daemon in self.daemons:
+            if daemon.daemon_type() in self._iteration_futures:
+                # the previous iteration is still running
+                continue
+
             if (not daemon.last_iteration_time) or (
                 (curr_time - daemon.last_iteration_time).total_seconds() >= daemon.interval_seconds
             ):
                 daemon.last_iteration_time = curr_time
                 self._add_heartbeat(daemon)
-                daemon.run_iteration()
+                self._iteration_futures[daemon.daemon_type()] = _start_iteration_thread(daemon)
+                started.append(daemon.daemon_type())
+
+        if started:
+            wait(
+                [self._iteration_futures[daemon_type] for daemon_type in started],
+                timeout=self._iteration_wait_seconds,
+            )
+
+        self._check_finished_iterations()
+
+    def _check_finished_iterations(self):
+        for daemon_type, future in list(self._iteration_futures.items()):
+            if not future.done():
+                continue
+
+            del self._iteration_futures[daemon_type]
+            # re-raise any error from the daemon iteration
+            future.result()
+
+    def is_iteration_in_progress(self, daemon_type):
+        check.inst_param(daemon_type, "daemon_type", DaemonType)
+        return daemon_type in self._iteration_futures
 
     def _add_heartbeat(self, daemon):
         """
@@ -1,20 +1,25 @@
 import logging
 import time
+from contextlib import ExitStack
 
 from dagster import DagsterEvent, DagsterEventType, check
 from dagster.core.events.log import DagsterEventRecord
+from dagster.core.host_representation import RepositoryLocation, RepositoryLocationHandle
 from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
-from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.daemon.daemon import DagsterDaemon
 from dagster.daemon.types import DaemonType
 from dagster.utils.backcompat import experimental
-from dagster.utils.external import external_pipeline_from_run
+from dagster.utils.external import external_pipeline_from_location
 
 IN_PROGRESS_STATUSES = [
     PipelineRunStatus.NOT_STARTED,
     PipelineRunStatus.STARTED,
 ]
 
+# When tag concurrency limits hold back the runs at the front of the queue, runs further down the
+# queue may still be launched. This bounds how far down the queue each iteration looks.
+TAG_LIMITED_QUEUED_RUNS_FETCH_LIMIT = 1000
+
 
 class QueuedRunCoordinatorDaemon(DagsterDaemon):
     """
@@ -23,9 +28,14 @@ class QueuedRunCoordinatorDaemon(DagsterDaemon):
     """
 
     @experimental
-    def __init__(self, instance, interval_seconds, max_concurrent_runs):
+    def __init__(
+        self, instance, interval_seconds, max_concurrent_runs, tag_concurrency_limits=None
+    ):
         super(QueuedRunCoordinatorDaemon, self).__init__(instance, interval_seconds)
         self._max_concurrent_runs = check.int_param(max_concurrent_runs, "max_concurrent_runs")
+        self._tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
 
     @classmethod
     def daemon_type(cls):
@@ -44,17 +54,38 @@ def run_iteration(self):
             )
             return
 
-        queued_runs = self._get_queued_runs()
+        queued_runs = self._get_queued_runs(max_runs_to_launch)
 
         if not queued_runs:
             self._logger.info("Poll returned no queued runs.")
         else:
             self._logger.info("Retrieved {} queued runs.".format(len(queued_runs)))
 
-        sorted_runs = self._priority_sort(queued_runs)
+        tag_limits_in_progress = self._count_in_progress_runs_by_tag_limit()
+
+        # Runs from the same repository location share a single handle to it
+        with ExitStack() as stack:
+            repo_locations = {}
+            num_launched = 0
+
+            for run in queued_runs:
+                if num_launched >= max_runs_to_launch:
+                    break
+
+                run_tag_limit_indices = [
+                    index
+                    for index, tag_limit in enumerate(self._tag_concurrency_limits)
+                    if run.tags.get(tag_limit["key"]) == tag_limit["value"]
+                ]
+                if any(
+                    tag_limits_in_progress[index] >= self._tag_concurrency_limits[index]["limit"]
+                    for index in run_tag_limit_indices
+                ):
+                    continue
+
+                repo_location = self._get_repo_location(stack, repo_locations, run)
+                external_pipeline = external_pipeline_from_location(repo_location, run)
 
-        for run in sorted_runs[:max_runs_to_launch]:
-            with external_pipeline_from_run(run) as external_pipeline:
                 enqueued_event = DagsterEvent(
                     event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
                     pipeline_name=run.pipeline_name,
@@ -73,26 +104,41 @@ def run_iteration(self):
 
                 self._instance.launch_run(run.run_id, external_pipeline)
 
-    def _get_queued_runs(self):
-        queued_runs_filter = PipelineRunsFilter(statuses=[PipelineRunStatus.QUEUED])
+                num_launched += 1
+                for index in run_tag_limit_indices:
+                    tag_limits_in_progress[index] += 1
 
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = self._instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+    def _get_queued_runs(self, max_runs_to_launch):
+        limit = (
+            max(max_runs_to_launch, TAG_LIMITED_QUEUED_RUNS_FETCH_LIMIT)
+            if self._tag_concurrency_limits
+            else max_runs_to_launch
+        )
+        return self._instance.get_queued_runs(limit=limit)
 
     def _count_in_progress_runs(self):
         return self._instance.get_runs_count(
             filters=PipelineRunsFilter(statuses=IN_PROGRESS_STATUSES)
         )
 
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+    def _count_in_progress_runs_by_tag_limit(self):
+        # List[int], the number of in progress runs for each of the tag concurrency limits
+        return [
+            self._instance.get_runs_count(
+                filters=PipelineRunsFilter(
+                    statuses=IN_PROGRESS_STATUSES, tags={tag_limit["key"]: tag_limit["value"]},
+                )
+            )
+            for tag_limit in self._tag_concurrency_limits
+        ]
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _get_repo_location(self, stack, repo_locations, run):
+        location_origin = (
+            run.external_pipeline_origin.external_repository_origin.repository_location_origin
+        )
+        if location_origin not in repo_locations:
+            repo_location_handle = stack.enter_context(
+                RepositoryLocationHandle.create_from_repository_location_origin(location_origin)
+            )
+            repo_locations[location_origin] = RepositoryLocation.from_handle(repo_location_handle)
+        return repo_locations[location_origin]
@@ -1,7 +1,9 @@
 import os
 import subprocess
 import sys
+import threading
 import warnings
+from collections import namedtuple
 from contextlib import contextmanager
 
 import grpc
@@ -32,6 +34,109 @@
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
+# Options for the long-lived channels that are shared by every client talking to the same server
+# address. Keepalive pings let us notice a dead connection instead of hanging on it - the interval
+# matches the minimum ping interval that gRPC servers accept by default.
+GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 300000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 0),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# Upper bounds (in milliseconds) of the buckets used for the per-method latency histograms
+GRPC_CALL_LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, float("inf")]
+
+_channel_lock = threading.Lock()
+_channels = {}
+
+_stats_lock = threading.Lock()
+_call_stats = {}
+
+
+class GrpcCallStats(namedtuple("_GrpcCallStats", "count total_ms max_ms buckets")):
+    """Latency counters for a single gRPC method, as observed by DagsterGrpcClient.
+
+    ``buckets`` maps the upper bound of each bucket in GRPC_CALL_LATENCY_BUCKETS_MS (in
+    milliseconds) to the number of calls that completed within it.
+    """
+
+    def with_call(self, elapsed_ms):
+        bucket = next(bound for bound in GRPC_CALL_LATENCY_BUCKETS_MS if elapsed_ms <= bound)
+        buckets = dict(self.buckets)
+        buckets[bucket] += 1
+        return GrpcCallStats(
+            count=self.count + 1,
+            total_ms=self.total_ms + elapsed_ms,
+            max_ms=max(self.max_ms, elapsed_ms),
+            buckets=buckets,
+        )
+
+    @staticmethod
+    def empty():
+        return GrpcCallStats(
+            count=0,
+            total_ms=0.0,
+            max_ms=0.0,
+            buckets={bound: 0 for bound in GRPC_CALL_LATENCY_BUCKETS_MS},
+        )
+
+
+def get_grpc_client_call_stats():
+    """Returns a dict of gRPC method name to GrpcCallStats for calls made from this process."""
+    with _stats_lock:
+        return dict(_call_stats)
+
+
+def reset_grpc_client_call_stats():
+    with _stats_lock:
+        _call_stats.clear()
+
+
+@contextmanager
+def _record_call_latency(method):
+    start_time = seven.time_fn()
+    try:
+        yield
+    finally:
+        elapsed_ms = (seven.time_fn() - start_time) * 1000
+        with _stats_lock:
+            _call_stats[method] = _call_stats.get(method, GrpcCallStats.empty()).with_call(
+                elapsed_ms
+            )
+
+
+def _get_shared_channel(server_address):
+    # gRPC channels can't be used across a fork, so channels are keyed by the pid that created them
+    key = (os.getpid(), server_address)
+    with _channel_lock:
+        channel = _channels.get(key)
+        if channel is None:
+            channel = grpc.insecure_channel(server_address, options=GRPC_CHANNEL_OPTIONS)
+            _channels[key] = channel
+        return channel
+
+
+def _discard_shared_channel(server_address, channel=None):
+    """Stops sharing the channel for a server address, so that the next call creates a new one, and
+    returns the discarded channel. If a channel is passed in, it is only discarded if it is still
+    the one in use for the address.
+
+    The channel isn't closed here, since other threads may still have calls in flight on it - it is
+    released once the last of them is done with it.
+    """
+    key = (os.getpid(), server_address)
+    with _channel_lock:
+        current = _channels.get(key)
+        if current is None or (channel is not None and current is not channel):
+            return None
+        del _channels[key]
+    return current
+
+
+def _is_connection_error(error):
+    return isinstance(error, grpc.Call) and error.code() == grpc.StatusCode.UNAVAILABLE
+
 
 def client_heartbeat_thread(client, shutdown_event):
     while True:
@@ -68,17 +173,34 @@ def __init__(self, port=None, socket=None, host="localhost"):
             self._server_address = "unix:" + os.path.abspath(socket)
 
     def _query(self, method, request_type, timeout=None, **kwargs):
-        with grpc.insecure_channel(self._server_address) as channel:
-            stub = DagsterApiStub(channel)
-            response = getattr(stub, method)(request_type(**kwargs), timeout=timeout)
-        # TODO need error handling here
-        return response
+        channel = _get_shared_channel(self._server_address)
+        stub = DagsterApiStub(channel)
+        with _record_call_latency(method):
+            try:
+                return getattr(stub, method)(request_type(**kwargs), timeout=timeout)
+            except grpc.RpcError as e:
+                if _is_connection_error(e):
+                    _discard_shared_channel(self._server_address, channel)
+                raise
 
     def _streaming_query(self, method, request_type, **kwargs):
-        with grpc.insecure_channel(self._server_address) as channel:
-            stub = DagsterApiStub(channel)
-            response_stream = getattr(stub, method)(request_type(**kwargs))
-            yield from response_stream
+        channel = _get_shared_channel(self._server_address)
+        stub = DagsterApiStub(channel)
+        with _record_call_latency(method):
+            try:
+                yield from getattr(stub, method)(request_type(**kwargs))
+            except grpc.RpcError as e:
+                if _is_connection_error(e):
+                    _discard_shared_channel(self._server_address, channel)
+                raise
+
+    def close_channel(self):
+        """Closes the channel shared by all clients of this server address in this process. This
+        cancels any calls still in flight on it, so should only be called once the server has shut
+        down."""
+        channel = _discard_shared_channel(self._server_address)
+        if channel is not None:
+            channel.close()
 
     def ping(self, echo):
         check.str_param(echo, "echo")
@@ -223,6 +345,21 @@ def external_repository(self, external_repository_origin):
 
         return deserialize_json_to_dagster_namedtuple(res.serialized_external_repository_data)
 
+    def external_repository_hash(self, external_repository_origin):
+        check.inst_param(
+            external_repository_origin, "external_repository_origin", ExternalRepositoryOrigin,
+        )
+
+        res = self._query(
+            "ExternalRepositoryHash",
+            api_pb2.ExternalRepositoryRequest,
+            serialized_repository_python_origin=serialize_dagster_namedtuple(
+                external_repository_origin
+            ),
+        )
+
+        return res.external_repository_hash
+
     def streaming_external_repository(self, external_repository_origin):
         for res in self._streaming_query(
             "StreamingExternalRepository",
@@ -256,14 +393,16 @@ def external_schedule_execution(self, external_schedule_execution_args):
             res.serialized_external_schedule_execution_data_or_external_schedule_execution_error
         )
 
-    def external_sensor_execution(self, sensor_execution_args):
+    def external_sensor_execution(self, sensor_execution_args, timeout=None):
         check.inst_param(
             sensor_execution_args, "sensor_execution_args", SensorExecutionArgs,
         )
+        check.opt_numeric_param(timeout, "timeout")
 
         res = self._query(
             "ExternalSensorExecution",
             api_pb2.ExternalSensorExecutionRequest,
+            timeout=timeout,
             serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
                 sensor_execution_args
             ),
@@ -275,6 +414,8 @@ def external_sensor_execution(self, sensor_execution_args):
 
     def shutdown_server(self, timeout=15):
         res = self._query("ShutdownServer", api_pb2.Empty, timeout=timeout)
+        # The server is going away, so later calls to this address shouldn't share its channel
+        _discard_shared_channel(self._server_address)
         return deserialize_json_to_dagster_namedtuple(res.serialized_shutdown_server_result)
 
     def cancel_execution(self, cancel_execution_request):
@@ -336,12 +477,15 @@ def get_current_image(self):
         return deserialize_json_to_dagster_namedtuple(res.serialized_current_image)
 
     def health_check_query(self):
+        channel = _get_shared_channel(self._server_address)
         try:
-            with grpc.insecure_channel(self._server_address) as channel:
+            with _record_call_latency("HealthCheck"):
                 response = HealthStub(channel).Check(
                     health_pb2.HealthCheckRequest(service="DagsterApi")
                 )
         except grpc.RpcError as e:
+            if _is_connection_error(e):
+                _discard_shared_channel(self._server_address, channel)
             print(e)  # pylint: disable=print-call
             return health_pb2.HealthCheckResponse.UNKNOWN  # pylint: disable=no-member
 
@@ -368,6 +512,8 @@ def cleanup_server(self):
                 except grpc._channel._InactiveRpcError:  # pylint: disable=protected-access
                     pass
             self._server_process = None
+            # The server is going away, so there is no reason to keep its channel around
+            self.close_channel()
 
     def __enter__(self):
         return self
@@ -1,3 +1,5 @@
+import hashlib
+import logging
 import math
 import os
 import queue
@@ -15,7 +17,11 @@
     ReconstructableRepository,
     repository_def_from_target_def,
 )
-from dagster.core.host_representation import ExternalPipelineOrigin, ExternalRepositoryOrigin
+from dagster.core.host_representation import (
+    ExternalPipelineOrigin,
+    ExternalRepositoryOrigin,
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+)
 from dagster.core.host_representation.external_data import external_repository_data_from_def
 from dagster.core.instance import DagsterInstance
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
@@ -178,6 +184,8 @@ def __init__(
     ):
         super(DagsterApiServer, self).__init__()
 
+        self._logger = logging.getLogger("dagster.grpc.server")
+
         check.bool_param(heartbeat, "heartbeat")
         check.int_param(heartbeat_timeout, "heartbeat_timeout")
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
@@ -208,8 +216,27 @@ def __init__(
         self._repository_symbols_and_code_pointers = LazyRepositorySymbolsAndCodePointers(
             loadable_target_origin
         )
+
+        # The code loaded by a server process never changes, so the serialized snapshot of each
+        # repository (and a hash of its contents) only needs to be computed once.
+        # Dict[str, (str, str)]
+        self._serialized_external_repository_data_by_name = {}
+        # Dict[str, threading.Lock], so that computing the snapshot of one repository doesn't hold
+        # up requests for the others
+        self._serialized_external_repository_data_locks = {}
+        self._serialized_external_repository_data_lock = threading.Lock()
+
         if not lazy_load_user_code:
             self._repository_symbols_and_code_pointers.load()
+            # Serializing large repositories can take a while, so it happens in the background to
+            # avoid holding up the server start (and the client's startup timeout) - requests that
+            # arrive first compute the snapshot they need themselves
+            self.__preload_thread = threading.Thread(
+                target=self._preload_serialized_external_repository_data,
+                name="grpc-server-preload",
+            )
+            self.__preload_thread.daemon = True
+            self.__preload_thread.start()
 
         self.__last_heartbeat_time = time.time()
         if heartbeat:
@@ -440,15 +467,70 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _preload_serialized_external_repository_data(self):
+        code_pointers_by_repo_name = (
+            self._repository_symbols_and_code_pointers.code_pointers_by_repo_name
+        )
+        if not code_pointers_by_repo_name:
+            return
+
+        # the repositories are all loaded from this server's target
+        repository_location_origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            self._loadable_target_origin
+        )
+        for repository_name in code_pointers_by_repo_name:
+            try:
+                self._get_serialized_external_repository_data_and_hash(
+                    ExternalRepositoryOrigin(repository_location_origin, repository_name)
+                )
+            except Exception:  # pylint: disable=broad-except
+                # Errors loading a repository definition are also surfaced when it is requested
+                self._logger.warning(
+                    'Error preloading the snapshot of repository "{repository_name}"'.format(
+                        repository_name=repository_name
+                    ),
+                    exc_info=True,
+                )
+
+    def _get_serialized_external_repository_data_and_hash(self, external_repository_origin):
+        repository_name = external_repository_origin.repository_name
+        with self._serialized_external_repository_data_lock:
+            repository_lock = self._serialized_external_repository_data_locks.setdefault(
+                repository_name, threading.Lock()
+            )
+
+        with repository_lock:
+            if repository_name not in self._serialized_external_repository_data_by_name:
+                recon_repo = self._recon_repository_from_origin(external_repository_origin)
+                serialized_external_repository_data = serialize_dagster_namedtuple(
+                    external_repository_data_from_def(recon_repo.get_definition())
+                )
+                self._serialized_external_repository_data_by_name[repository_name] = (
+                    serialized_external_repository_data,
+                    hashlib.sha1(serialized_external_repository_data.encode("utf-8")).hexdigest(),
+                )
+
+            return self._serialized_external_repository_data_by_name[repository_name]
+
+    def _get_repository_origin_from_request(self, request):
         repository_origin = deserialize_json_to_dagster_namedtuple(
             request.serialized_repository_python_origin
         )
 
-        check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
-        recon_repo = self._recon_repository_from_origin(repository_origin)
-        return serialize_dagster_namedtuple(
-            external_repository_data_from_def(recon_repo.get_definition())
+        return check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+
+    def _get_serialized_external_repository_data(self, request):
+        serialized_data, _hash = self._get_serialized_external_repository_data_and_hash(
+            self._get_repository_origin_from_request(request)
+        )
+        return serialized_data
+
+    def ExternalRepositoryHash(self, request, _context):
+        _data, external_repository_hash = self._get_serialized_external_repository_data_and_hash(
+            self._get_repository_origin_from_request(request)
+        )
+        return api_pb2.ExternalRepositoryHashReply(
+            external_repository_hash=external_repository_hash
         )
 
     def ExternalRepository(self, request, _context):
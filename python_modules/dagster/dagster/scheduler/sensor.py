@@ -1,6 +1,9 @@
 import os
 import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 
 import pendulum
 from dagster import check
@@ -27,6 +30,9 @@
 RECORDED_TICK_STATES = [JobTickStatus.SUCCESS, JobTickStatus.FAILURE]
 FULFILLED_TICK_STATES = [JobTickStatus.SKIPPED, JobTickStatus.SUCCESS]
 
+DEFAULT_MAX_SENSOR_WORKERS = 8
+DEFAULT_SENSOR_TIMEOUT_SECONDS = 60
+
 
 class SensorLaunchContext:
     def __init__(self, job_state, tick, instance, logger):
@@ -96,8 +102,23 @@ def _check_for_debug_crash(debug_crash_flags, key):
     raise Exception("Process didn't terminate after sending crash signal")
 
 
-def execute_sensor_iteration(instance, logger, debug_crash_flags=None):
+def execute_sensor_iteration(
+    instance, logger, debug_crash_flags=None, max_workers=None, sensor_timeout_seconds=None
+):
+    """Evaluates every running sensor once.
+
+    Each repository location is loaded once per iteration and shared by all of its sensors. The
+    sensors are evaluated concurrently on up to ``max_workers`` threads, and a sensor evaluation
+    that takes longer than ``sensor_timeout_seconds`` fails its tick instead of holding on to its
+    thread.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
+    max_workers = check.opt_int_param(max_workers, "max_workers", DEFAULT_MAX_SENSOR_WORKERS)
+    sensor_timeout_seconds = check.opt_numeric_param(
+        sensor_timeout_seconds, "sensor_timeout_seconds", DEFAULT_SENSOR_TIMEOUT_SECONDS
+    )
+    check.invariant(max_workers > 0, "max_workers must be greater than 0")
+
     sensor_jobs = [
         s
         for s in instance.all_stored_job_state(job_type=JobType.SENSOR)
@@ -112,61 +133,118 @@ def execute_sensor_iteration(instance, logger, debug_crash_flags=None):
         )
     )
 
+    sensor_jobs_by_location_origin = OrderedDict()
     for job_state in sensor_jobs:
-        sensor_debug_crash_flags = (
-            debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None
-        )
-        try:
-            with RepositoryLocationHandle.create_from_repository_location_origin(
-                job_state.origin.external_repository_origin.repository_location_origin
-            ) as repo_location_handle:
+        location_origin = job_state.origin.external_repository_origin.repository_location_origin
+        sensor_jobs_by_location_origin.setdefault(location_origin, []).append(job_state)
+
+    with ExitStack() as stack:
+        sensor_evaluations = []
+        for location_origin, location_sensor_jobs in sensor_jobs_by_location_origin.items():
+            try:
+                repo_location_handle = stack.enter_context(
+                    RepositoryLocationHandle.create_from_repository_location_origin(location_origin)
+                )
                 repo_location = RepositoryLocation.from_handle(repo_location_handle)
                 repo_dict = repo_location.get_repositories()
-                check.invariant(
-                    len(repo_dict) == 1,
-                    "Reconstructed repository location should have exactly one repository",
+            except Exception:  # pylint: disable=broad-except
+                error_info = serializable_error_info_from_exc_info(sys.exc_info()).to_string()
+                for job_state in location_sensor_jobs:
+                    logger.error(
+                        "Sensor failed for {sensor_name} : {error_info}".format(
+                            sensor_name=job_state.job_name, error_info=error_info,
+                        )
+                    )
+                continue
+
+            for job_state in location_sensor_jobs:
+                external_repo = repo_dict.get(
+                    job_state.origin.external_repository_origin.repository_name
                 )
-                external_repo = next(iter(repo_dict.values()))
-                if not external_repo.has_external_job(job_state.job_name):
+                if not external_repo or not external_repo.has_external_job(job_state.job_name):
                     continue
+                sensor_evaluations.append((job_state, repo_location, external_repo))
+
+        if max_workers == 1 or debug_crash_flags:
+            # Crash signals are only delivered deterministically on the calling thread
+            for job_state, repo_location, external_repo in sensor_evaluations:
+                _execute_sensor_job(
+                    instance,
+                    logger,
+                    repo_location,
+                    external_repo,
+                    job_state,
+                    sensor_timeout_seconds,
+                    debug_crash_flags,
+                )
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sensor-evaluation"
+        ) as executor:
+            for job_state, repo_location, external_repo in sensor_evaluations:
+                executor.submit(
+                    _execute_sensor_job,
+                    instance,
+                    logger,
+                    repo_location,
+                    external_repo,
+                    job_state,
+                    sensor_timeout_seconds,
+                )
 
-                now = pendulum.now()
-                latest_tick = instance.get_latest_job_tick(job_state.job_origin_id)
-                if not latest_tick or latest_tick.status in RECORDED_TICK_STATES:
-                    tick = instance.create_job_tick(
-                        JobTickData(
-                            job_origin_id=job_state.job_origin_id,
-                            job_name=job_state.job_name,
-                            job_type=JobType.SENSOR,
-                            status=JobTickStatus.STARTED,
-                            timestamp=now.timestamp(),
-                        )
-                    )
-                else:
-                    tick = latest_tick.with_status(JobTickStatus.STARTED, timestamp=now.timestamp())
-                    instance.update_job_tick(tick)
-
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
-
-                external_sensor = external_repo.get_external_sensor(job_state.job_name)
-                with SensorLaunchContext(job_state, tick, instance, logger) as tick_context:
-                    _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                    _evaluate_sensor(
-                        tick_context,
-                        instance,
-                        repo_location,
-                        external_repo,
-                        external_sensor,
-                        job_state,
-                        sensor_debug_crash_flags,
-                    )
-        except Exception:  # pylint: disable=broad-except
-            logger.error(
-                "Sensor failed for {sensor_name} : {error_info}".format(
-                    sensor_name=job_state.job_name,
-                    error_info=serializable_error_info_from_exc_info(sys.exc_info()).to_string(),
+
+def _execute_sensor_job(
+    instance,
+    logger,
+    repo_location,
+    external_repo,
+    job_state,
+    sensor_timeout_seconds,
+    debug_crash_flags=None,
+):
+    sensor_debug_crash_flags = (
+        debug_crash_flags.get(job_state.job_name) if debug_crash_flags else None
+    )
+    try:
+        now = pendulum.now()
+        latest_tick = instance.get_latest_job_tick(job_state.job_origin_id)
+        if not latest_tick or latest_tick.status in RECORDED_TICK_STATES:
+            tick = instance.create_job_tick(
+                JobTickData(
+                    job_origin_id=job_state.job_origin_id,
+                    job_name=job_state.job_name,
+                    job_type=JobType.SENSOR,
+                    status=JobTickStatus.STARTED,
+                    timestamp=now.timestamp(),
                 )
             )
+        else:
+            tick = latest_tick.with_status(JobTickStatus.STARTED, timestamp=now.timestamp())
+            instance.update_job_tick(tick)
+
+        _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        external_sensor = external_repo.get_external_sensor(job_state.job_name)
+        with SensorLaunchContext(job_state, tick, instance, logger) as tick_context:
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            _evaluate_sensor(
+                tick_context,
+                instance,
+                repo_location,
+                external_repo,
+                external_sensor,
+                job_state,
+                sensor_timeout_seconds,
+                sensor_debug_crash_flags,
+            )
+    except Exception:  # pylint: disable=broad-except
+        logger.error(
+            "Sensor failed for {sensor_name} : {error_info}".format(
+                sensor_name=job_state.job_name,
+                error_info=serializable_error_info_from_exc_info(sys.exc_info()).to_string(),
+            )
+        )
 
 
 def _evaluate_sensor(
@@ -176,6 +254,7 @@ def _evaluate_sensor(
     external_repo,
     external_sensor,
     job_state,
+    sensor_timeout_seconds=None,
     sensor_debug_crash_flags=None,
 ):
     sensor_runtime_data = repo_location.get_external_sensor_execution_data(
@@ -184,6 +263,7 @@ def _evaluate_sensor(
         external_sensor.name,
         job_state.job_specific_data.last_tick_timestamp if job_state.job_specific_data else None,
         job_state.job_specific_data.last_run_key if job_state.job_specific_data else None,
+        timeout=sensor_timeout_seconds,
     )
     if isinstance(sensor_runtime_data, ExternalSensorExecutionErrorData):
         context.logger.error(
@@ -25,11 +25,30 @@
 from dagster import check, seven
 from dagster.utils import compose
 
+try:
+    import orjson  # pylint: disable=import-error
+except ImportError:
+    orjson = None
+
 _WHITELIST_MAP = {
     "types": {"tuple": {}, "enum": {}},
     "persistence": {},
 }
 
+# Values of these exact types are passed through as-is when packing and unpacking. Subclasses (e.g.
+# str-valued Enums) are deliberately excluded so that they take the slow path.
+_PASSTHROUGH_TYPES = frozenset([str, int, float, bool, type(None)])
+
+# Constructor argument names of whitelisted namedtuple classes, cached per class since computing
+# them via seven.get_args is expensive
+_TUPLE_ARGS_CACHE = {}
+
+# orjson silently loses precision on integers that don't fit in 64 bits, so payloads containing
+# long runs of digits are left to the stdlib parser. Mapping every digit to "0" and searching for a
+# run of zeros is much faster than the equivalent regex.
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+_LONG_DIGIT_RUN = "0" * 19
+
 
 def create_snapshot_id(snapshot):
     json_rep = serialize_dagster_namedtuple(snapshot)
@@ -73,6 +92,27 @@ def from_storage_dict(cls, storage_dict):
         return default_from_storage_dict(cls, storage_dict)
 
 
+def _get_args_for_class(klass):
+    args = _TUPLE_ARGS_CACHE.get(klass)
+    if args is None:
+        args = frozenset(seven.get_args(klass))
+        _TUPLE_ARGS_CACHE[klass] = args
+    return args
+
+
+def _loads(json_str):
+    """Parses a JSON string, using orjson when it is installed.  Payloads that orjson can't parse
+    to exactly the same value as the stdlib parser (e.g. NaN, very large integers, raw control
+    characters) fall back to the stdlib parser."""
+    if orjson is not None and _LONG_DIGIT_RUN not in json_str.translate(_DIGITS_TO_ZERO):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+
+    return seven.json.loads(json_str)
+
+
 def _check_serdes_tuple_class_invariants(klass):
     check.invariant(sys.version_info.major >= 3, "This function can only be run in python 3")
 
@@ -153,6 +193,7 @@ def __whitelist_for_serdes(klass):
             if sys.version_info.major >= 3:
                 _check_serdes_tuple_class_invariants(klass)
             whitelist_map["types"]["tuple"][klass.__name__] = klass
+            _get_args_for_class(klass)
         else:
             check.failed("Can not whitelist class {klass} for serdes".format(klass=klass))
 
@@ -179,25 +220,25 @@ def pack_value(val):
 
 
 def _pack_value(val, whitelist_map):
+    if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return val
     if isinstance(val, list):
         return [_pack_value(i, whitelist_map) for i in val]
     if isinstance(val, tuple):
         klass_name = val.__class__.__name__
-        check.invariant(
-            klass_name in whitelist_map["types"]["tuple"],
-            "Can only serialize whitelisted namedtuples, received tuple {}".format(val),
-        )
+        if klass_name not in whitelist_map["types"]["tuple"]:
+            check.failed(
+                "Can only serialize whitelisted namedtuples, received tuple {}".format(val)
+            )
         if klass_name in whitelist_map["persistence"]:
             return val.to_storage_value()
-        base_dict = {key: _pack_value(value, whitelist_map) for key, value in val._asdict().items()}
+        base_dict = {key: _pack_value(value, whitelist_map) for key, value in zip(val._fields, val)}
         base_dict["__class__"] = klass_name
         return base_dict
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
-        check.invariant(
-            klass_name in whitelist_map["types"]["enum"],
-            "Can only serialize whitelisted Enums, received {}".format(klass_name),
-        )
+        if klass_name not in whitelist_map["types"]["enum"]:
+            check.failed("Can only serialize whitelisted Enums, received {}".format(klass_name))
         return {"__enum__": str(val)}
     if isinstance(val, set):
         return {"__set__": [_pack_value(item, whitelist_map) for item in val]}
@@ -218,9 +259,7 @@ def serialize_value(val):
 
 
 def deserialize_value(val):
-    return _unpack_value(
-        seven.json.loads(check.str_param(val, "val")), whitelist_map=_WHITELIST_MAP,
-    )
+    return _unpack_value(_loads(check.str_param(val, "val")), whitelist_map=_WHITELIST_MAP,)
 
 
 def serialize_dagster_namedtuple(nt, **json_kwargs):
@@ -234,6 +273,8 @@ def unpack_value(val):
 
 
 def _unpack_value(val, whitelist_map):
+    if type(val) in _PASSTHROUGH_TYPES:  # pylint: disable=unidiomatic-typecheck
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, whitelist_map) for i in val]
     if isinstance(val, dict) and val.get("__class__"):
@@ -257,9 +298,7 @@ def _unpack_value(val, whitelist_map):
         # Naively implements backwards compatibility by filtering arguments that aren't present in
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
-        # The call to seven.get_args turns out to be pretty expensive -- we should probably turn
-        # to, e.g., manually managing the deprecated keys on the serdes constructor.
-        args_for_class = seven.get_args(klass)
+        args_for_class = _get_args_for_class(klass)
         filtered_val = {k: v for k, v in unpacked_val.items() if k in args_for_class}
         return klass(**filtered_val)
     if isinstance(val, dict) and val.get("__enum__"):
@@ -289,11 +328,11 @@ def deserialize_json_to_dagster_namedtuple(json_str):
 
 
 def _deserialize_json_to_dagster_namedtuple(json_str, whitelist_map):
-    return _unpack_value(seven.json.loads(json_str), whitelist_map=whitelist_map)
+    return _unpack_value(_loads(json_str), whitelist_map=whitelist_map)
 
 
 def default_to_storage_value(value, whitelist_map):
-    base_dict = {key: _pack_value(value, whitelist_map) for key, value in value._asdict().items()}
+    base_dict = {key: _pack_value(val, whitelist_map) for key, val in zip(value._fields, value)}
     base_dict["__class__"] = value.__class__.__name__
     return base_dict
 
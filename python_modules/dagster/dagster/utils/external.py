@@ -22,25 +22,27 @@ def external_pipeline_from_run(pipeline_run):
         external_pipeline_origin.external_repository_origin.repository_location_origin
     ) as repo_location_handle:
         repo_location = RepositoryLocation.from_handle(repo_location_handle)
+        yield external_pipeline_from_location(repo_location, pipeline_run)
 
-        repo_dict = repo_location.get_repositories()
-        check.invariant(
-            len(repo_dict) == 1,
-            "Reconstructed repository location should have exactly one repository",
-        )
-        external_repo = next(iter(repo_dict.values()))
-
-        pipeline_selector = PipelineSelector(
-            location_name=repo_location.name,
-            repository_name=external_repo.name,
-            pipeline_name=pipeline_run.pipeline_name,
-            solid_selection=pipeline_run.solid_selection,
-        )
-
-        subset_pipeline_result = repo_location.get_subset_external_pipeline_result(
-            pipeline_selector
-        )
-        external_pipeline = ExternalPipeline(
-            subset_pipeline_result.external_pipeline_data, external_repo.handle,
-        )
-        yield external_pipeline
+
+def external_pipeline_from_location(repo_location, pipeline_run):
+    """Loads the pipeline for a run from an already-loaded repository location, so that the
+    location can be shared by several runs."""
+    check.inst_param(repo_location, "repo_location", RepositoryLocation)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+
+    repo_dict = repo_location.get_repositories()
+    check.invariant(
+        len(repo_dict) == 1, "Reconstructed repository location should have exactly one repository",
+    )
+    external_repo = next(iter(repo_dict.values()))
+
+    pipeline_selector = PipelineSelector(
+        location_name=repo_location.name,
+        repository_name=external_repo.name,
+        pipeline_name=pipeline_run.pipeline_name,
+        solid_selection=pipeline_run.solid_selection,
+    )
+
+    subset_pipeline_result = repo_location.get_subset_external_pipeline_result(pipeline_selector)
+    return ExternalPipeline(subset_pipeline_result.external_pipeline_data, external_repo.handle,)
@@ -1,8 +1,10 @@
 import re
 import sys
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import grpc
+import mock
 import pytest
 from dagster import lambda_solid, pipeline, repository
 from dagster.api.snapshot_repository import (
@@ -11,6 +13,7 @@
 )
 from dagster.core.host_representation import (
     ExternalRepository,
+    ExternalRepositoryOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster.core.host_representation.handle import RepositoryLocationHandle
@@ -47,6 +50,55 @@ def test_streaming_external_repositories_api_grpc():
         assert external_repository.name == "bar_repo"
 
 
+def test_external_repository_hash_grpc():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        api_client = repository_location_handle.client
+        origin = ExternalRepositoryOrigin(repository_location_handle.origin, "bar_repo")
+
+        external_repository_hash = api_client.external_repository_hash(origin)
+        assert external_repository_hash
+        assert api_client.external_repository_hash(origin) == external_repository_hash
+
+
+def test_streaming_external_repositories_skips_unchanged_fetch():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        api_client = repository_location_handle.client
+        first_repos = sync_get_streaming_external_repositories_grpc(
+            api_client, repository_location_handle
+        )
+
+        with mock.patch.object(
+            api_client,
+            "streaming_external_repository",
+            wraps=api_client.streaming_external_repository,
+        ) as streaming_external_repository:
+            second_repos = sync_get_streaming_external_repositories_grpc(
+                api_client, repository_location_handle
+            )
+            assert streaming_external_repository.call_count == 0
+
+        assert second_repos[0].external_repository_data is first_repos[0].external_repository_data
+
+
+def test_streaming_external_repositories_cache_size():
+    with get_bar_repo_grpc_repository_location_handle() as repository_location_handle:
+        api_client = repository_location_handle.client
+
+        with mock.patch(
+            "dagster.api.snapshot_repository._external_repository_data_cache", OrderedDict()
+        ), mock.patch(
+            "dagster.api.snapshot_repository.EXTERNAL_REPOSITORY_DATA_CACHE_SIZE", 0
+        ), mock.patch.object(
+            api_client,
+            "streaming_external_repository",
+            wraps=api_client.streaming_external_repository,
+        ) as streaming_external_repository:
+            sync_get_streaming_external_repositories_grpc(api_client, repository_location_handle)
+            sync_get_streaming_external_repositories_grpc(api_client, repository_location_handle)
+            # nothing is kept once the cache is full, so each call fetches the repository again
+            assert streaming_external_repository.call_count == 2
+
+
 @lambda_solid
 def do_something():
     return 1
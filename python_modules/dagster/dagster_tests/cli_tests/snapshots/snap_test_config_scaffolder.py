@@ -12,7 +12,15 @@
             'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'max_concurrent': 0,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0,
+                    'start_method': {'forkserver': {'preload_modules': []}, 'spawn': {}},
+                },
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
@@ -30,7 +38,15 @@
             'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'max_concurrent': 0,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0,
+                    'start_method': {'forkserver': {'preload_modules': []}, 'spawn': {}},
+                },
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
@@ -48,7 +64,15 @@
             'config': {'marker_to_close': '', 'retries': {'disabled': {}, 'enabled': {}}}
         },
         'multiprocess': {
-            'config': {'max_concurrent': 0, 'retries': {'disabled': {}, 'enabled': {}}}
+            'config': {
+                'max_concurrent': 0,
+                'retries': {'disabled': {}, 'enabled': {}},
+                'worker_pool': {
+                    'max_steps_per_worker': 0,
+                    'max_worker_memory_mb': 0,
+                    'start_method': {'forkserver': {'preload_modules': []}, 'spawn': {}},
+                },
+            }
         },
     },
     'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
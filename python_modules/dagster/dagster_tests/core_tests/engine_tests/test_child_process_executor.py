@@ -1,14 +1,18 @@
 import os
 import time
+from multiprocessing import connection as multiprocessing_connection
 
 import pytest
 from dagster.core.executor.child_process_executor import (
     ChildProcessCommand,
+    ChildProcessCommandExecution,
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster.utils import segfault
@@ -98,6 +102,118 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_multiplex_child_process_executions():
+    executions = {
+        a_str: ChildProcessCommandExecution(DoubleAStringChildProcessCommand(a_str))
+        for a_str in ["a", "b", "c"]
+    }
+    executions["crashy"] = ChildProcessCommandExecution(CrashyCommand())
+
+    results = {}
+    crashes = {}
+    while executions:
+        ready = multiprocessing_connection.wait(
+            [execution.connection for execution in executions.values()]
+        )
+        for key, execution in list(executions.items()):
+            if execution.connection not in ready:
+                continue
+
+            try:
+                for event in execution.iter_ready_events():
+                    if not isinstance(event, ChildProcessEvent):
+                        results[key] = event
+            except ChildProcessCrashException as crash:
+                crashes[key] = crash.exit_code
+
+            if execution.is_done:
+                del executions[key]
+
+    assert results == {"a": "aa", "b": "bb", "c": "cc"}
+    assert crashes == {"crashy": 1}
+
+
+class PidCommand(ChildProcessCommand):  # pylint: disable=no-init
+    def execute(self):
+        yield os.getpid()
+
+
+def _execute_in_worker(worker, command):
+    execution = worker.execute(command)
+    results = []
+    try:
+        while not execution.is_done:
+            execution.connection.poll(None)
+            results.extend(
+                event
+                for event in execution.iter_ready_events()
+                if not isinstance(event, ChildProcessEvent)
+            )
+    finally:
+        execution.close()
+    return results
+
+
+def test_worker_executes_many_commands():
+    worker = ChildProcessWorker()
+    try:
+        assert _execute_in_worker(worker, DoubleAStringChildProcessCommand("a")) == ["aa"]
+        assert _execute_in_worker(worker, DoubleAStringChildProcessCommand("b")) == ["bb"]
+        assert _execute_in_worker(worker, PidCommand()) == [worker.pid]
+        assert worker.is_available
+    finally:
+        worker.close()
+    assert worker.is_closed
+
+
+def test_worker_max_commands():
+    worker = ChildProcessWorker(max_commands=2)
+    try:
+        assert _execute_in_worker(worker, PidCommand()) == [worker.pid]
+        assert worker.is_available
+        assert _execute_in_worker(worker, PidCommand()) == [worker.pid]
+        assert not worker.is_available
+        assert worker.is_closed
+    finally:
+        worker.close()
+
+
+def test_worker_retires_after_error():
+    worker = ChildProcessWorker()
+    try:
+        execution = worker.execute(ThrowAnErrorCommand())
+        events = []
+        while not execution.is_done:
+            execution.connection.poll(None)
+            events.extend(execution.iter_ready_events())
+        execution.close()
+
+        assert isinstance(events[-1], ChildProcessSystemErrorEvent)
+        assert not worker.is_available
+    finally:
+        worker.close()
+
+
+def test_worker_crash():
+    worker = ChildProcessWorker()
+    try:
+        with pytest.raises(ChildProcessCrashException) as exc:
+            _execute_in_worker(worker, CrashyCommand())
+        assert exc.value.exit_code == 1
+        assert not worker.is_available
+    finally:
+        worker.close()
+
+
+def test_worker_pool_replaces_retired_workers():
+    with ChildProcessWorkerPool(max_commands_per_worker=2) as pool:
+        pids = [_execute_in_worker(pool.get_worker(), PidCommand())[0] for _ in range(4)]
+
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[0] != pids[2]
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
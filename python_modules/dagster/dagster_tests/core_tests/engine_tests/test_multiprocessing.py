@@ -31,6 +31,35 @@ def test_diamond_simple_execution():
     assert result.result_for_solid("adder").output_value() == 11
 
 
+def test_diamond_multi_execution_worker_pool():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "intermediate_storage": {"filesystem": {}},
+                "execution": {
+                    "multiprocess": {
+                        "config": {"max_concurrent": 2, "worker_pool": {"max_steps_per_worker": 2}}
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        step_pids = {
+            entry.entry_data.text
+            for event in result.event_list
+            if event.is_engine_event
+            and event.engine_event_data.marker_end == "multiprocess_subprocess_init"
+            for entry in event.engine_event_data.metadata_entries
+            if entry.label == "pid"
+        }
+        # 4 steps in workers that each execute at most 2 of them
+        assert 2 <= len(step_pids) <= 4
+
+
 def compute_event(result, solid_name):
     return result.result_for_solid(solid_name).compute_step_events[0]
 
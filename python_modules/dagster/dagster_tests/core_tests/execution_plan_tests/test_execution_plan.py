@@ -1,5 +1,5 @@
 import pytest
-from dagster import DagsterInstance, check, pipeline, solid
+from dagster import DagsterInstance, InputDefinition, List, check, pipeline, solid
 from dagster.core.errors import (
     DagsterIncompleteExecutionPlanError,
     DagsterInvalidConfigError,
@@ -341,3 +341,36 @@ def test_lost_steps():
                 steps_to_abandon = active_execution.get_steps_to_abandon()
 
             assert active_execution.is_complete
+
+
+def test_active_execution_wide_plan():
+    @solid
+    def emit(_):
+        return 1
+
+    @solid(input_defs=[InputDefinition("num")])
+    def passthrough(_, num):
+        return num
+
+    @solid(input_defs=[InputDefinition("nums", List[int])])
+    def collect(_, nums):
+        return nums
+
+    @pipeline
+    def wide():
+        num = emit()
+        collect([passthrough.alias("passthrough_{}".format(i))(num) for i in range(200)])
+
+    plan = create_execution_plan(wide)
+    with plan.start(retries=Retries(RetryMode.DISABLED)) as active_execution:
+        executed = []
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute(limit=1)
+            assert len(steps) == 1
+            executed.append(steps[0].key)
+            active_execution.mark_success(steps[0].key)
+
+    # steps that become executable together are vended in plan order
+    assert executed == list(plan.execution_deps().keys())
+    assert executed[0] == "emit.compute"
+    assert executed[-1] == "collect.compute"
@@ -0,0 +1,265 @@
+import os
+
+from dagster import (
+    DagsterEventType,
+    InputDefinition,
+    ModeDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    reconstructable,
+    seven,
+)
+from dagster.core.definitions.events import AssetStoreOperationType, ObjectStoreOperationType
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.gc import StepOutputReferenceTracker, should_gc_step_outputs
+from dagster.core.execution.plan.objects import StepFailureData, StepOutputHandle, StepSuccessData
+from dagster.core.storage.fs_object_manager import fs_object_manager
+from dagster.core.storage.tags import GC_STEP_OUTPUTS_TAG, MEMOIZED_RUN_TAG
+from dagster.core.test_utils import instance_for_test
+
+GC_TAGS = {GC_STEP_OUTPUTS_TAG: "true"}
+
+
+def define_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(input_defs=[InputDefinition("left"), InputDefinition("right")])
+    def adder(left, right):
+        return left + right
+
+    @pipeline
+    def diamond_pipeline():
+        two = return_two()
+        adder(left=add_three(two), right=mult_three(two))
+
+    return diamond_pipeline
+
+
+def _success_event(step_key):
+    return DagsterEvent(
+        event_type_value=DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name="diamond_pipeline",
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+    )
+
+
+def _failure_event(step_key):
+    return DagsterEvent(
+        event_type_value=DagsterEventType.STEP_FAILURE.value,
+        pipeline_name="diamond_pipeline",
+        step_key=step_key,
+        event_specific_data=StepFailureData(error=None, user_failure_data=None),
+    )
+
+
+def _rm_events(result):
+    return [
+        event
+        for event in result.event_list
+        if (
+            event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+            and event.event_specific_data.op == ObjectStoreOperationType.RM_OBJECT.value
+        )
+        or (
+            event.is_asset_store_operation
+            and event.event_specific_data.op == AssetStoreOperationType.RM_ASSET
+        )
+    ]
+
+
+def test_should_gc_step_outputs():
+    assert should_gc_step_outputs(GC_TAGS)
+    assert not should_gc_step_outputs(None)
+    assert not should_gc_step_outputs({})
+    assert not should_gc_step_outputs({GC_STEP_OUTPUTS_TAG: "false"})
+    assert not should_gc_step_outputs(dict(GC_TAGS, **{MEMOIZED_RUN_TAG: "true"}))
+
+
+def test_reference_tracker():
+    tracker = StepOutputReferenceTracker(create_execution_plan(define_diamond_pipeline()))
+
+    assert tracker.handle_event(_success_event("return_two.compute")) == []
+    assert tracker.handle_event(_success_event("add_three.compute")) == []
+    assert tracker.handle_event(_success_event("mult_three.compute")) == [
+        StepOutputHandle("return_two.compute")
+    ]
+    assert tracker.handle_event(_success_event("adder.compute")) == [
+        StepOutputHandle("add_three.compute"),
+        StepOutputHandle("mult_three.compute"),
+    ]
+
+
+def test_reference_tracker_failed_consumer():
+    tracker = StepOutputReferenceTracker(create_execution_plan(define_diamond_pipeline()))
+
+    assert tracker.handle_event(_success_event("return_two.compute")) == []
+    assert tracker.handle_event(_failure_event("add_three.compute")) == []
+    # the failed step will need the output of return_two to be re-executed
+    assert tracker.handle_event(_success_event("mult_three.compute")) == []
+
+
+def test_reference_tracker_subset():
+    tracker = StepOutputReferenceTracker(
+        create_execution_plan(
+            define_diamond_pipeline(),
+            step_keys_to_execute=["return_two.compute", "add_three.compute"],
+        )
+    )
+
+    assert tracker.handle_event(_success_event("return_two.compute")) == []
+    # mult_three also consumes the output of return_two, but isn't executed in this run
+    assert tracker.handle_event(_success_event("add_three.compute")) == []
+
+
+def test_reference_tracker_disabled():
+    tracker = StepOutputReferenceTracker(
+        create_execution_plan(define_diamond_pipeline()), enabled=False
+    )
+
+    for step_key in [
+        "return_two.compute",
+        "add_three.compute",
+        "mult_three.compute",
+        "adder.compute",
+    ]:
+        assert tracker.handle_event(_success_event(step_key)) == []
+
+
+def _set_object_addresses(result):
+    return {
+        event.step_key: event.event_specific_data.address
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.op == ObjectStoreOperationType.SET_OBJECT.value
+    }
+
+
+def test_gc_intermediates():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            define_diamond_pipeline(),
+            run_config={"intermediate_storage": {"filesystem": {}}},
+            instance=instance,
+            tags=GC_TAGS,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        addresses = _set_object_addresses(result)
+        assert sorted(event.step_key for event in _rm_events(result)) == [
+            "add_three.compute",
+            "mult_three.compute",
+            "return_two.compute",
+        ]
+        for step_key in ["return_two.compute", "add_three.compute", "mult_three.compute"]:
+            assert not os.path.exists(addresses[step_key])
+        assert os.path.exists(addresses["adder.compute"])
+
+
+def test_no_gc_without_tag():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            define_diamond_pipeline(),
+            run_config={"intermediate_storage": {"filesystem": {}}},
+            instance=instance,
+        )
+        assert result.success
+        assert not _rm_events(result)
+        for address in _set_object_addresses(result).values():
+            assert os.path.exists(address)
+
+
+def test_gc_intermediates_multiprocess():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(define_diamond_pipeline),
+            run_config={
+                "intermediate_storage": {"filesystem": {}},
+                "execution": {"multiprocess": {}},
+            },
+            instance=instance,
+            tags=GC_TAGS,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        addresses = _set_object_addresses(result)
+        assert len(_rm_events(result)) == 3
+        for step_key in ["return_two.compute", "add_three.compute", "mult_three.compute"]:
+            assert not os.path.exists(addresses[step_key])
+        assert os.path.exists(addresses["adder.compute"])
+
+
+def test_gc_keeps_inputs_of_failed_step():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def fail(num):
+        raise Exception("failed with {}".format(num))
+
+    @pipeline
+    def failing_pipeline():
+        fail(return_one())
+
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            failing_pipeline,
+            run_config={"intermediate_storage": {"filesystem": {}}},
+            instance=instance,
+            tags=GC_TAGS,
+            raise_on_error=False,
+        )
+        assert not result.success
+        assert not _rm_events(result)
+        assert os.path.exists(_set_object_addresses(result)["return_one.compute"])
+
+
+def test_gc_object_manager():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition("num")])
+    def add_one(num):
+        return num + 1
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+
+        @pipeline(
+            mode_defs=[
+                ModeDefinition(
+                    resource_defs={
+                        "asset_store": fs_object_manager.configured({"base_dir": tmpdir_path})
+                    }
+                )
+            ]
+        )
+        def asset_pipeline():
+            add_one(return_one())
+
+        result = execute_pipeline(asset_pipeline, tags=GC_TAGS)
+        assert result.success
+
+        rm_events = _rm_events(result)
+        assert len(rm_events) == 1
+        assert rm_events[0].event_specific_data.step_key == "return_one.compute"
+
+        assert not os.path.exists(
+            os.path.join(tmpdir_path, result.run_id, "return_one.compute", "result")
+        )
+        assert os.path.exists(os.path.join(tmpdir_path, result.run_id, "add_one.compute", "result"))
@@ -91,7 +91,10 @@ def write_a_file_pipeline():
 
 
 @pytest.mark.skipif(seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize(
+    "executor_config", [{"max_concurrent": 4}, {"max_concurrent": 4, "worker_pool": {}}]
+)
+def test_interrupt_multiproc(executor_config):
     with seven.TemporaryDirectory() as tempdir:
         with instance_for_test_tempdir(tempdir) as instance:
 
@@ -117,7 +120,7 @@ def test_interrupt_multiproc():
                             "write_3": {"config": {"tempfile": file_3}},
                             "write_4": {"config": {"tempfile": file_4}},
                         },
-                        "execution": {"multiprocess": {"config": {"max_concurrent": 4}}},
+                        "execution": {"multiprocess": {"config": executor_config}},
                         "intermediate_storage": {"filesystem": {}},
                     },
                     instance=instance,
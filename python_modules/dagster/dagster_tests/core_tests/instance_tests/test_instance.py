@@ -180,3 +180,32 @@ def test_dagster_home_not_dir():
             ),
         ):
             _dagster_home()
+
+
+def test_event_log_buffer():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    with instance_for_test(
+        overrides={"event_log_buffer": {"max_events": 1000, "max_seconds": 60.0}}
+    ) as instance:
+        result = execute_pipeline(noop_pipeline, instance=instance)
+        assert result.success
+
+        # the pipeline success event flushes everything before the run status changes
+        run = instance.get_run_by_id(result.run_id)
+        assert run.is_success
+        event_storage = instance._event_storage  # pylint: disable=protected-access
+        assert len(event_storage.get_logs_for_run(result.run_id)) == len(result.event_list)
+
+        instance.report_engine_event("buffered", run)
+        assert len(event_storage.get_logs_for_run(result.run_id)) == len(result.event_list)
+
+        # reads through the instance see buffered events
+        assert len(instance.all_logs(result.run_id)) == len(result.event_list) + 1
+        assert len(event_storage.get_logs_for_run(result.run_id)) == len(result.event_list) + 1
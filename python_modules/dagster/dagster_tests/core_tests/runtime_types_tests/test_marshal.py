@@ -1,4 +1,12 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+import os
+import pickle
+
+from dagster import seven
+from dagster.core.storage.object_store import FilesystemObjectStore
+from dagster.core.types.marshal import (
+    OutOfBandPickleSerializationStrategy,
+    PickleSerializationStrategy,
+)
 from dagster.utils import safe_tempfile_path
 
 
@@ -7,3 +15,30 @@ def test_serialization_strategy():
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file("foo", tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == "foo"
+
+
+def test_out_of_band_serialization_strategy():
+    serialization_strategy = OutOfBandPickleSerializationStrategy()
+    value = {"foo": "bar", "buffers": [bytearray(b"abc"), bytearray()]}
+    if pickle.HIGHEST_PROTOCOL >= 5:
+        value["buffers"] = [pickle.PickleBuffer(buf) for buf in value["buffers"]]
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        path = os.path.join(tmpdir_path, "value")
+        serialization_strategy.serialize_to_file(value, path)
+        assert os.path.isdir(path)
+
+        loaded = serialization_strategy.deserialize_from_file(path)
+        assert loaded["foo"] == "bar"
+        assert [bytes(buf) for buf in loaded["buffers"]] == [b"abc", b""]
+
+
+def test_filesystem_object_store_overwrites_directory():
+    object_store = FilesystemObjectStore()
+    serialization_strategy = OutOfBandPickleSerializationStrategy()
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        key = os.path.join(tmpdir_path, "value")
+        object_store.set_object(key, "foo", serialization_strategy)
+        object_store.set_object(key, "bar", serialization_strategy)
+        assert object_store.get_object(key, serialization_strategy) == ("bar", key)
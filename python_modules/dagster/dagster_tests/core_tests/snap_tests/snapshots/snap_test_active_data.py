@@ -90,6 +90,21 @@
                 "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
               ]
             },
+            "Array.String": {
+              "__class__": "ConfigTypeSnap",
+              "description": "List of Array.String",
+              "enum_values": null,
+              "fields": null,
+              "given_name": null,
+              "key": "Array.String",
+              "kind": {
+                "__enum__": "ConfigTypeKind.ARRAY"
+              },
+              "scalar_kind": null,
+              "type_param_keys": [
+                "String"
+              ]
+            },
             "Bool": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -231,7 +246,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+            "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -252,11 +267,11 @@
                   "description": null,
                   "is_required": false,
                   "name": "multiprocess",
-                  "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+                  "type_key": "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7"
                 }
               ],
               "given_name": null,
-              "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+              "key": "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2",
               "kind": {
                 "__enum__": "ConfigTypeKind.SELECTOR"
               },
@@ -304,6 +319,38 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "forkserver",
+                  "type_key": "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "spawn",
+                  "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -564,6 +611,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "preload_modules",
+                  "type_key": "Array.String"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -610,6 +680,29 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -633,6 +726,47 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "0",
+                  "description": null,
+                  "is_required": false,
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Shape.abb0ff97d3bd7b568f164575af444946669ff964"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -656,7 +790,30 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.6811763b21837fa90300427f32281dcf8566e1b1": {
+            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "outputs",
+                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.6b4355f44d2d4868e4f344c48876425af034c266": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -668,7 +825,7 @@
                   "description": null,
                   "is_required": false,
                   "name": "execution",
-                  "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+                  "type_key": "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
@@ -717,30 +874,7 @@
                 }
               ],
               "given_name": null,
-              "key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": null,
-                  "is_required": false,
-                  "name": "outputs",
-                  "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+              "key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -802,32 +936,41 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+            "Shape.abb0ff97d3bd7b568f164575af444946669ff964": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "0",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "max_concurrent",
+                  "name": "max_steps_per_worker",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": null,
+                  "is_required": false,
+                  "name": "max_worker_memory_mb",
                   "type_key": "Int"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_value_as_json_str": "{\\"spawn\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "start_method",
+                  "type_key": "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77"
                 }
               ],
               "given_name": null,
-              "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+              "key": "Shape.abb0ff97d3bd7b568f164575af444946669ff964",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -916,29 +1059,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
-                }
-              ],
-              "given_name": null,
-              "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "String": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -1088,7 +1208,7 @@
                 "name": "asset_store"
               }
             ],
-            "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+            "root_config_key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266"
           },
           {
             "__class__": "ModeDefSnap",
@@ -1118,7 +1238,7 @@
                 "name": "asset_store"
               }
             ],
-            "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+            "root_config_key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266"
           }
         ],
         "name": "a_pipeline",
@@ -1225,6 +1345,21 @@
             "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
           ]
         },
+        "Array.String": {
+          "__class__": "ConfigTypeSnap",
+          "description": "List of Array.String",
+          "enum_values": null,
+          "fields": null,
+          "given_name": null,
+          "key": "Array.String",
+          "kind": {
+            "__enum__": "ConfigTypeKind.ARRAY"
+          },
+          "scalar_kind": null,
+          "type_param_keys": [
+            "String"
+          ]
+        },
         "Bool": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -1366,7 +1501,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975": {
+        "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1387,11 +1522,11 @@
               "description": null,
               "is_required": false,
               "name": "multiprocess",
-              "type_key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e"
+              "type_key": "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7"
             }
           ],
           "given_name": null,
-          "key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975",
+          "key": "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2",
           "kind": {
             "__enum__": "ConfigTypeKind.SELECTOR"
           },
@@ -1439,6 +1574,38 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "forkserver",
+              "type_key": "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "spawn",
+              "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1699,6 +1866,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "preload_modules",
+              "type_key": "Array.String"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.2848f3e0ac3f82ea041ab9a4c09ccd039edcbd6a",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1745,6 +1935,29 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.434516d206fb5ee6e6f6245b4d7c52b9e8cf2bc7",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1768,6 +1981,47 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
+        "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "0",
+              "description": null,
+              "is_required": false,
+              "name": "max_concurrent",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "retries",
+              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Shape.abb0ff97d3bd7b568f164575af444946669ff964"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.5075ed4cf89b318e78054d4adeee34b1c92eb268",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Shape.5a712cc73cd18a717376d6ed2fd442949644d5bb": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -1791,7 +2045,30 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.6811763b21837fa90300427f32281dcf8566e1b1": {
+        "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "outputs",
+              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.6b4355f44d2d4868e4f344c48876425af034c266": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -1803,7 +2080,7 @@
               "description": null,
               "is_required": false,
               "name": "execution",
-              "type_key": "Selector.4d63da53a40bb42f96aad27d25ec8a9656d40975"
+              "type_key": "Selector.1e4f0da18a3b2d25b9e5dfa4c6e8b221100d18a2"
             },
             {
               "__class__": "ConfigFieldSnap",
@@ -1852,30 +2129,7 @@
             }
           ],
           "given_name": null,
-          "key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
-              "description": null,
-              "is_required": false,
-              "name": "outputs",
-              "type_key": "Array.Shape.41de0e2d7b75524510155d0bdab8723c6feced3b"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.681fbe3d20630c62adc35f0362593dc0623c6cf2",
+          "key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -1937,32 +2191,41 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023": {
+        "Shape.abb0ff97d3bd7b568f164575af444946669ff964": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "0",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "max_concurrent",
+              "name": "max_steps_per_worker",
+              "type_key": "Int"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "max_worker_memory_mb",
               "type_key": "Int"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"enabled\\": {}}",
+              "default_value_as_json_str": "{\\"spawn\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "retries",
-              "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+              "name": "start_method",
+              "type_key": "Selector.bc8b932ff86ccff9fd0a517a06c1a7840c16be77"
             }
           ],
           "given_name": null,
-          "key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023",
+          "key": "Shape.abb0ff97d3bd7b568f164575af444946669ff964",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -2051,29 +2314,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.a476f98f7c4e324d4b665af722d1f2cd7f99b023"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.fff3afcfe0467fefa4b97fb8f72911aeb0e8fe4e",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "String": {
           "__class__": "ConfigTypeSnap",
           "description": "",
@@ -2223,7 +2463,7 @@
             "name": "asset_store"
           }
         ],
-        "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+        "root_config_key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266"
       },
       {
         "__class__": "ModeDefSnap",
@@ -2253,7 +2493,7 @@
             "name": "asset_store"
           }
         ],
-        "root_config_key": "Shape.6811763b21837fa90300427f32281dcf8566e1b1"
+        "root_config_key": "Shape.6b4355f44d2d4868e4f344c48876425af034c266"
       }
     ],
     "name": "a_pipeline",
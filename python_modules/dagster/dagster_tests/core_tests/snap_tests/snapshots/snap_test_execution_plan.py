@@ -9,7 +9,7 @@
 snapshots['test_create_noop_execution_plan 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "1c2b11984311606d105ccf19239e31d825bd5ba7",
+  "pipeline_snapshot_id": "cbe7bff22b4f31bb8906a4a111266512402b364e",
   "step_keys_to_execute": [
     "noop_solid.compute"
   ],
@@ -37,7 +37,7 @@
 snapshots['test_create_execution_plan_with_dep 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "af05e14a8928208d6363b28f80cc83fdfbea77f0",
+  "pipeline_snapshot_id": "a051f2b73e36624bda1a761d1fb8eaafdbcd4c8f",
   "step_keys_to_execute": [
     "solid_one.compute",
     "solid_two.compute"
@@ -96,7 +96,7 @@
 snapshots['test_create_with_composite 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "739dfb75e745ab7cfb5783b98894084e1472576d",
+  "pipeline_snapshot_id": "6f6572cbdd45dc70cc8cc25ee5c6501a7d18fbee",
   "step_keys_to_execute": [
     "comp_1.return_one.compute",
     "comp_1.add_one.compute",
@@ -247,7 +247,7 @@
 snapshots['test_create_noop_execution_plan_with_tags 1'] = '''{
   "__class__": "ExecutionPlanSnapshot",
   "artifacts_persisted": false,
-  "pipeline_snapshot_id": "7d0ade1cd11078c1295e2f39be57eeb800e69de8",
+  "pipeline_snapshot_id": "cac29f0abf6fa34265d7025db97bdb019596b9fb",
   "step_keys_to_execute": [
     "noop_solid.compute"
   ],
@@ -7,9 +7,11 @@
 import pytest
 import sqlalchemy
 from dagster import seven
-from dagster.core.definitions import AssetMaterialization, ExpectationResult
+from dagster.core.definitions import AssetKey, AssetMaterialization, ExpectationResult
+from dagster.core.definitions.events import AssetStoreOperationType, EventMetadataEntry
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import (
+    AssetStoreOperationData,
     DagsterEvent,
     DagsterEventType,
     EngineEventData,
@@ -17,7 +19,7 @@
     StepMaterializationData,
 )
 from dagster.core.events.log import DagsterEventRecord
-from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
+from dagster.core.execution.plan.objects import StepFailureData, StepOutputHandle, StepSuccessData
 from dagster.core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
@@ -25,6 +27,7 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.schema import RunStatsTable, StepStatsTable
 from dagster.core.storage.sql import create_engine
 from dagster.seven import multiprocessing
 
@@ -208,6 +211,85 @@ def evt(name):
         assert len(storage.get_logs_for_run("foo", 1)) == 1
         assert len(storage.get_logs_for_run("foo", 2)) == 0
 
+        assert [log.message for log in storage.get_logs_for_run("foo", limit=2)] == [
+            "Message_0",
+            "Message_1",
+        ]
+        assert [log.message for log in storage.get_logs_for_run("foo", 0, limit=1)] == ["Message_1"]
+        assert [log.message for log in storage.get_logs_for_run("foo", 1, limit=5)] == ["Message_2"]
+
+
+@event_storage_test
+def test_event_log_storage_iter_logs(event_storage_factory_cm_fn):
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            "debug",
+            "",
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        for i in range(5):
+            storage.store_event(evt("Message_{}".format(i), "foo"))
+        for i in range(5):
+            storage.store_event(evt("Other_{}".format(i), "bar"))
+
+        messages = ["Message_{}".format(i) for i in range(5)]
+        for batch_size in [1, 2, 5, 10]:
+            assert [
+                log.message for log in storage.iter_logs_for_run("foo", batch_size=batch_size)
+            ] == messages
+
+        assert [log.message for log in storage.iter_logs_for_run("foo", 2, batch_size=2)] == [
+            "Message_3",
+            "Message_4",
+        ]
+        assert list(storage.iter_logs_for_run("baz")) == []
+
+
+@event_storage_test
+def test_event_log_storage_get_logs_by_log_id(event_storage_factory_cm_fn):
+    def evt(name, run_id):
+        return DagsterEventRecord(
+            None,
+            name,
+            "debug",
+            "",
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                "nonce",
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    with event_storage_factory_cm_fn() as storage:
+        # the ids of storages that are shared by several runs are interleaved across the runs
+        for i in range(5):
+            storage.store_event(evt("Message_{}".format(i), "foo"))
+            storage.store_event(evt("Other_{}".format(i), "bar"))
+
+        cursor = -1
+        pages = []
+        while True:
+            logs_by_id = storage.get_logs_for_run_by_log_id("foo", cursor, limit=2)
+            if not logs_by_id:
+                break
+            assert list(logs_by_id.keys()) == sorted(logs_by_id.keys())
+            pages.append([log.message for log in logs_by_id.values()])
+            cursor = list(logs_by_id.keys())[-1] - 1
+
+        assert pages == [["Message_0", "Message_1"], ["Message_2", "Message_3"], ["Message_4"]]
+
 
 @event_storage_test
 def test_event_log_delete(event_storage_factory_cm_fn):
@@ -348,6 +430,55 @@ def test_event_log_step_stats(event_storage_factory_cm_fn):
         assert len(d_stats.expectation_results) == 2
 
 
+@event_storage_test
+def test_event_log_stats_for_runs(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        storage.store_events(_stats_records(run_id="foo"))
+        storage.store_events(_stats_records(run_id="bar")[:4])
+        run_ids = ["foo", "bar", "empty"]
+
+        assert storage.get_stats_for_runs([]) == {}
+        assert storage.get_stats_for_runs(run_ids) == {
+            run_id: storage.get_stats_for_run(run_id) for run_id in run_ids
+        }
+
+        step_stats = storage.get_step_stats_for_runs(run_ids)
+        assert set(step_stats.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert sorted(step_stats[run_id]) == sorted(storage.get_step_stats_for_run(run_id))
+        assert step_stats["empty"] == []
+
+        assert storage.get_asset_keys_for_runs(run_ids) == {
+            "foo": [AssetKey("mat_1"), AssetKey("mat_2"), AssetKey("mat_3")],
+            "bar": [],
+            "empty": [],
+        }
+
+
+@event_storage_test
+def test_event_log_storage_store_events_batch(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        foo_records = _stats_records(run_id="foo")
+        bar_records = _stats_records(run_id="bar")
+        storage.store_events(foo_records + bar_records)
+
+        for run_id, records in [("foo", foo_records), ("bar", bar_records)]:
+            assert storage.get_logs_for_run(run_id) == records
+            assert len(storage.get_step_stats_for_run(run_id)) == 4
+
+        if storage.is_asset_aware:
+            # each asset key is materialized in both runs but is only stored once
+            asset_keys = storage.get_all_asset_keys()
+            assert sorted(asset_key.to_string() for asset_key in asset_keys) == [
+                '["mat_1"]',
+                '["mat_2"]',
+                '["mat_3"]',
+            ]
+
+        storage.store_events([])
+        assert len(storage.get_logs_for_run("foo")) == len(foo_records)
+
+
 def _stats_records(run_id):
     now = time.time()
     return [
@@ -452,3 +583,295 @@ def test_secondary_index():
         assert storage.has_secondary_index("B")
         assert "A" in storage._secondary_index_cache  # pylint: disable=protected-access
         assert "B" in storage._secondary_index_cache  # pylint: disable=protected-access
+
+
+def test_stats_secondary_index():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+
+        def _assert_stats_match_event_log(run_id):
+            # pylint: disable=protected-access
+            assert (
+                storage.get_stats_for_run(run_id)
+                == storage._get_stats_for_runs_from_event_log([run_id])[run_id]
+            )
+            assert sorted(storage.get_step_stats_for_run(run_id)) == sorted(
+                storage._get_step_stats_for_runs_from_event_log([run_id])[run_id]
+            )
+            assert (
+                storage.get_step_stats_for_run(run_id, step_keys=["D"])
+                == storage._get_step_stats_for_runs_from_event_log([run_id], step_keys=["D"])[
+                    run_id
+                ]
+            )
+
+        now = time.time()
+        storage.store_event(_event_record("foo", None, now - 400, DagsterEventType.PIPELINE_START))
+        for record in _stats_records(run_id="foo"):
+            storage.store_event(record)
+
+        storage.reindex()
+        assert storage.has_secondary_index("run_stats_table")
+        assert storage.has_secondary_index("step_stats_table")
+
+        stats = storage.get_stats_for_run("foo")
+        assert stats.steps_succeeded == 2
+        assert stats.steps_failed == 1
+        assert stats.materializations == 3
+        assert stats.expectations == 2
+        _assert_stats_match_event_log("foo")
+
+        # events stored after the index is enabled update the summary tables incrementally
+        storage.store_events(
+            [
+                _event_record("foo", "B", now + 1, DagsterEventType.STEP_RESTARTED),
+                _event_record("foo", "B", now + 2, DagsterEventType.STEP_START),
+                _event_record(
+                    "foo",
+                    "B",
+                    now + 3,
+                    DagsterEventType.STEP_SUCCESS,
+                    StepSuccessData(duration_ms=1000.0),
+                ),
+                _event_record("foo", None, now + 4, DagsterEventType.PIPELINE_SUCCESS),
+            ]
+        )
+        # as in the raw event log stats, a success takes precedence over a later failure
+        storage.store_event(_event_record("foo", None, now + 5, DagsterEventType.PIPELINE_FAILURE))
+        for record in _stats_records(run_id="bar"):
+            storage.store_event(record)
+
+        b_stats = storage.get_step_stats_for_run("foo", step_keys=["B"])[0]
+        assert b_stats.status.value == "SUCCESS"
+        assert b_stats.attempts == 2
+        assert storage.get_stats_for_run("foo").end_time == pytest.approx(now + 4)
+        _assert_stats_match_event_log("foo")
+        _assert_stats_match_event_log("bar")
+
+        storage.delete_events("foo")
+        assert storage.get_step_stats_for_run("foo") == []
+        assert storage.get_stats_for_run("foo").steps_succeeded == 0
+        _assert_stats_match_event_log("bar")
+
+
+def test_stats_tables_migration():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+        # simulate a database created before the summary tables were introduced
+        with storage.connect() as conn:
+            conn.execute("DROP TABLE run_stats")
+            conn.execute("DROP TABLE step_stats")
+            conn.execute("UPDATE alembic_version SET version_num = 'c34498c29964'")
+
+        for record in _stats_records(run_id="foo"):
+            storage.store_event(record)
+        assert storage.get_stats_for_run("foo").steps_succeeded == 2
+
+        with storage.connect() as conn:
+            assert not storage.has_stats_tables(conn)
+
+        storage.upgrade()
+        with storage.connect() as conn:
+            assert set(SqlEventLogStorageMetadata.tables).issubset(
+                set(sqlalchemy.inspect(conn).get_table_names())
+            )
+            # tables created by a migration are picked up right away
+            assert storage.has_stats_tables(conn)
+
+        for record in _stats_records(run_id="bar"):
+            storage.store_event(record)
+        query = sqlalchemy.select([RunStatsTable.c.steps_succeeded]).where(
+            RunStatsTable.c.run_id == "bar"
+        )
+        with storage.connect() as conn:
+            assert conn.execute(query).fetchall() == [(2,)]
+
+        storage.reindex()
+        for run_id in ["foo", "bar"]:
+            stats = storage.get_stats_for_run(run_id)
+            assert stats.steps_succeeded == 2
+            assert stats.steps_failed == 1
+
+
+def test_stats_written_with_events():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+        storage.reindex()
+
+        def _fail_store_stats(conn, events):
+            raise Exception("failed to store stats")
+
+        original_store_stats = storage.store_stats
+        storage.store_stats = _fail_store_stats
+        with pytest.raises(Exception, match="failed to store stats"):
+            storage.store_events(_stats_records(run_id="foo"))
+
+        # the events are rolled back along with their stats
+        assert storage.get_logs_for_run("foo") == []
+
+        storage.store_stats = original_store_stats
+        storage.store_events(_stats_records(run_id="foo"))
+        assert storage.get_stats_for_run("foo").steps_succeeded == 2
+
+
+class _NoRowsResult(object):
+    rowcount = 0
+
+
+class _ConcurrentInsertConnection(object):
+    """Wraps a connection so that the first update statement matches no rows, as though the row it
+    targets was inserted by another writer right after the update ran."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._skipped_update = False
+
+    def execute(self, statement, *args, **kwargs):
+        if not self._skipped_update and isinstance(statement, sqlalchemy.sql.expression.Update):
+            self._skipped_update = True
+            return _NoRowsResult()
+        return self._conn.execute(statement, *args, **kwargs)
+
+
+def test_stats_concurrent_insert():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+        storage.reindex()
+        storage.store_event(_event_record("foo", "A", time.time(), DagsterEventType.STEP_START))
+
+        with storage.connect() as conn:
+            with conn.begin():
+                # the insert violates the unique constraint and falls back to an update, without
+                # aborting the rest of the transaction
+                storage.upsert_stats_row(
+                    _ConcurrentInsertConnection(conn),
+                    StepStatsTable,
+                    dict(run_id="foo", step_key="A"),
+                    dict(status="SUCCESS", attempts=1),
+                    dict(status="SUCCESS"),
+                )
+                storage.upsert_stats_row(
+                    conn,
+                    StepStatsTable,
+                    dict(run_id="foo", step_key="B"),
+                    dict(attempts=1),
+                    dict(attempts=StepStatsTable.c.attempts + 1),
+                )
+
+        step_stats = {
+            step_stats.step_key: step_stats for step_stats in storage.get_step_stats_for_run("foo")
+        }
+        assert step_stats["A"].status.value == "SUCCESS"
+        assert step_stats["A"].attempts == 1
+        assert "B" in step_stats
+
+
+def _asset_store_operation_record(run_id, step_key, op, version=None, path=None):
+    return _event_record(
+        run_id,
+        step_key,
+        time.time(),
+        DagsterEventType.ASSET_STORE_OPERATION,
+        AssetStoreOperationData(
+            op=op,
+            step_key=step_key,
+            output_name="result",
+            asset_store_key="asset_store",
+            metadata_entries=[EventMetadataEntry.fspath(path)] if path else None,
+            version=version,
+        ),
+    )
+
+
+def _store_versioned_outputs(storage):
+    storage.store_events(
+        [
+            _asset_store_operation_record(
+                "foo", "A", AssetStoreOperationType.SET_ASSET, "a1", "/foo/A"
+            ),
+            # outputs stored without a version or a path can't be looked up
+            _asset_store_operation_record(
+                "foo", "B", AssetStoreOperationType.SET_ASSET, None, "/B"
+            ),
+            _asset_store_operation_record("foo", "C", AssetStoreOperationType.SET_ASSET, "c1"),
+        ]
+    )
+    storage.store_event(
+        _asset_store_operation_record("bar", "A", AssetStoreOperationType.SET_ASSET, "a1", "/bar/A")
+    )
+    storage.store_event(
+        _asset_store_operation_record("bar", "D", AssetStoreOperationType.SET_ASSET, "d1", "/bar/D")
+    )
+
+
+def _lookup_versions(storage, versions_by_step_key):
+    addresses = storage.get_addresses_for_step_output_versions(
+        {
+            ("pipeline_name", StepOutputHandle(step_key, "result")): version
+            for step_key, version in versions_by_step_key.items()
+        }
+    )
+    return {handle.step_key: address for (_, handle), address in addresses.items()}
+
+
+def test_step_output_versions_secondary_index():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+        _store_versioned_outputs(storage)
+
+        # the index is only read once it's been built
+        assert _lookup_versions(storage, {"A": "a1"}) == {"A": None}
+        storage.reindex()
+        assert storage.has_secondary_index("step_output_versions_table")
+
+        assert _lookup_versions(storage, {"A": "a1", "B": "b1", "C": "c1", "D": "d1"}) == {
+            "A": "/bar/A",
+            "B": None,
+            "C": None,
+            "D": "/bar/D",
+        }
+        assert _lookup_versions(storage, {"A": "a2", "D": "d1"}) == {"A": None, "D": "/bar/D"}
+        assert storage.get_addresses_for_step_output_versions(
+            {("other_pipeline", StepOutputHandle("A", "result")): "a1"}
+        ) == {("other_pipeline", StepOutputHandle("A", "result")): None}
+
+        # removed outputs are dropped from the index
+        storage.store_event(
+            _asset_store_operation_record("bar", "A", AssetStoreOperationType.RM_ASSET)
+        )
+        assert _lookup_versions(storage, {"A": "a1"}) == {"A": "/foo/A"}
+
+        storage.delete_events("bar")
+        assert _lookup_versions(storage, {"A": "a1", "D": "d1"}) == {"A": "/foo/A", "D": None}
+
+        storage.wipe()
+        assert _lookup_versions(storage, {"A": "a1"}) == {"A": None}
+
+
+def test_step_output_versions_table_migration():
+    with create_consolidated_sqlite_run_event_log_storage() as storage:
+        # simulate a database created before the step output versions table was introduced
+        with storage.connect() as conn:
+            conn.execute("DROP TABLE step_output_versions")
+            conn.execute("UPDATE alembic_version SET version_num = 'bf17b753352d'")
+            assert not conn.dialect.has_table(conn, "step_output_versions")
+
+        storage.upgrade()
+        with storage.connect() as conn:
+            assert conn.dialect.has_table(conn, "step_output_versions")
+            indexes = sqlalchemy.inspect(conn).get_indexes("step_output_versions")
+            assert "idx_step_output_version" in [index["name"] for index in indexes]
+
+        # the migrated table backs the index once it has been built
+        _store_versioned_outputs(storage)
+        storage.reindex()
+        assert _lookup_versions(storage, {"A": "a1", "D": "d1"}) == {"A": "/bar/A", "D": "/bar/D"}
+
+
+@event_storage_test
+def test_event_log_get_addresses_for_step_output_versions(event_storage_factory_cm_fn):
+    with event_storage_factory_cm_fn() as storage:
+        _store_versioned_outputs(storage)
+        storage.reindex()
+
+        addresses = _lookup_versions(storage, {"A": "a1", "C": "c1", "D": "d1"})
+        if isinstance(storage, SqliteEventLogStorage):
+            # runs sharded across databases can't be looked up together
+            assert addresses == {"A": None, "C": None, "D": None}
+        else:
+            assert addresses == {"A": "/bar/A", "C": None, "D": "/bar/D"}
@@ -1,9 +1,12 @@
 import os
 import pickle
+import sys
+
+import pytest
 
 from dagster import ModeDefinition, execute_pipeline, pipeline, seven, solid
 from dagster.core.definitions.events import AssetStoreOperationType
-from dagster.core.storage.fs_object_manager import fs_object_manager
+from dagster.core.storage.fs_object_manager import fs_object_manager, typed_fs_object_manager
 
 
 def define_pipeline(object_manager):
@@ -61,3 +64,48 @@ def test_fs_object_manager():
         assert os.path.isfile(filepath_b)
         with open(filepath_b, "rb") as read_obj:
             assert pickle.load(read_obj) == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="Pickle protocol 5 requires Python 3.8")
+def test_typed_fs_object_manager():
+    @solid
+    def solid_a(_context):
+        # Pickles to a single out-of-band buffer
+        return pickle.PickleBuffer(bytearray(b"a" * 1000))
+
+    @solid
+    def solid_b(_context, buf):
+        return bytes(buf)
+
+    @pipeline(
+        mode_defs=[ModeDefinition("local", resource_defs={"asset_store": typed_fs_object_manager})]
+    )
+    def asset_pipeline():
+        solid_b(solid_a())
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        result = execute_pipeline(
+            asset_pipeline,
+            run_config={"resources": {"asset_store": {"config": {"base_dir": tmpdir_path}}}},
+        )
+        assert result.success
+        assert result.result_for_solid("solid_b").output_value() == b"a" * 1000
+
+        path_a = os.path.join(tmpdir_path, result.run_id, "solid_a.compute", "result")
+        assert os.path.isdir(path_a)
+        with open(os.path.join(path_a, "buffer_0"), "rb") as read_obj:
+            assert read_obj.read() == b"a" * 1000
+
+        set_asset_event = next(
+            evt
+            for evt in result.event_list
+            if evt.is_asset_store_operation
+            and evt.event_specific_data.op == AssetStoreOperationType.SET_ASSET
+        )
+        metadata = {
+            entry.label: entry.entry_data
+            for entry in set_asset_event.event_specific_data.metadata_entries
+        }
+        assert metadata["bytes"].value >= 1000
+        assert metadata["serialization_strategy"].text == "out_of_band_pickle"
+        assert "duration_ms" in metadata
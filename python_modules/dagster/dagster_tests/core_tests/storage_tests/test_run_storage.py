@@ -1,8 +1,11 @@
 from contextlib import contextmanager
 
 import pytest
-from dagster import seven
+import sqlalchemy as db
+from dagster import PipelineDefinition, seven
+from dagster.core.snap import create_pipeline_snapshot_id
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster.core.storage.runs.snapshot_cache import SnapshotCache
 from dagster_tests.core_tests.storage_tests.utils.run_storage import TestRunStorage
 
 
@@ -28,6 +31,53 @@ def run_storage(self, request):
         with request.param() as s:
             yield s
 
+    def test_snapshot_cache(self, storage):
+        pipeline_snapshot = PipelineDefinition(
+            name="some_pipeline", solid_defs=[]
+        ).get_pipeline_snapshot()
+        pipeline_snapshot_id = create_pipeline_snapshot_id(pipeline_snapshot)
+
+        storage.add_pipeline_snapshot(pipeline_snapshot)
+        assert pipeline_snapshot_id in storage.snapshot_cache
+
+        # reads are served from the cache
+        storage.snapshot_cache.clear()
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) == pipeline_snapshot
+        assert storage.snapshot_cache.misses == 1
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is storage.get_pipeline_snapshot(
+            pipeline_snapshot_id
+        )
+        assert storage.snapshot_cache.hits == 2
+        assert storage.has_pipeline_snapshot(pipeline_snapshot_id)
+
+        storage.wipe()
+        assert not len(storage.snapshot_cache)
+        assert not storage.has_pipeline_snapshot(pipeline_snapshot_id)
+        assert storage.get_pipeline_snapshot(pipeline_snapshot_id) is None
+
+    def test_reindex(self, storage):
+        def _indexes():
+            with storage.connect() as conn:
+                inspector = db.inspect(conn)
+                return {
+                    index["name"]: index["column_names"]
+                    for table_name in ["runs", "run_tags"]
+                    for index in inspector.get_indexes(table_name)
+                }
+
+        with storage.connect() as conn:
+            conn.execute("DROP INDEX idx_run_pipeline_name")
+            conn.execute("DROP INDEX idx_run_tags")
+            conn.execute("CREATE INDEX idx_run_tags ON run_tags (key, value)")
+
+        messages = []
+        storage.reindex(messages.append)
+
+        assert _indexes()["idx_run_pipeline_name"] == ["pipeline_name", "id"]
+        assert _indexes()["idx_run_tags"] == ["key", "value", "run_id"]
+        assert "Building index: idx_run_tags" in messages
+        assert "Skipping already built index: idx_run_status" in messages
+
 
 class TestInMemoryImplementation(TestRunStorage):
     __test__ = True
@@ -36,3 +86,33 @@ class TestInMemoryImplementation(TestRunStorage):
     def run_storage(self, request):
         with request.param() as s:
             yield s
+
+
+def test_snapshot_cache_eviction():
+    cache = SnapshotCache(max_bytes=100, max_entries=3)
+
+    cache.put("a", "snapshot_a", 40)
+    cache.put("b", "snapshot_b", 40)
+    assert cache.get("a") == "snapshot_a"
+
+    # over max_bytes, so the least recently used entry is evicted
+    cache.put("c", "snapshot_c", 40)
+    assert "b" not in cache
+    assert cache.size_bytes == 80
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # over max_entries
+    cache.put("d", "snapshot_d", 1)
+    cache.put("e", "snapshot_e", 1)
+    assert "a" not in cache
+    assert len(cache) == 3
+
+    # too large to ever be cached
+    cache.put("f", "snapshot_f", 101)
+    assert "f" not in cache
+    assert len(cache) == 3
+
+    cache.clear()
+    assert not len(cache)
+    assert cache.size_bytes == 0
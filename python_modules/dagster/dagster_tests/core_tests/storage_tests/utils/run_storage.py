@@ -1,9 +1,17 @@
+import sys
+
 import pytest
 from dagster.core.definitions import PipelineDefinition
 from dagster.core.errors import DagsterRunAlreadyExists, DagsterSnapshotDoesNotExist
+from dagster.core.host_representation import (
+    ExternalPipelineOrigin,
+    ExternalRepositoryOrigin,
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+)
 from dagster.core.snap import create_pipeline_snapshot_id
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
-from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import PARENT_RUN_ID_TAG, PRIORITY_TAG, ROOT_RUN_ID_TAG
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.core.utils import make_new_run_id
 from dagster.daemon.types import DaemonHeartbeat, DaemonType
 from dagster.serdes import serialize_pp
@@ -44,6 +52,7 @@ def build_run(
         parent_run_id=None,
         root_run_id=None,
         pipeline_snapshot_id=None,
+        external_pipeline_origin=None,
     ):
         return PipelineRun(
             pipeline_name=pipeline_name,
@@ -55,6 +64,19 @@ def build_run(
             root_run_id=root_run_id,
             parent_run_id=parent_run_id,
             pipeline_snapshot_id=pipeline_snapshot_id,
+            external_pipeline_origin=external_pipeline_origin,
+        )
+
+    @staticmethod
+    def fake_pipeline_origin(pipeline_name):
+        return ExternalPipelineOrigin(
+            ExternalRepositoryOrigin(
+                ManagedGrpcPythonEnvRepositoryLocationOrigin(
+                    LoadableTargetOrigin(executable_path=sys.executable, python_file="fake.py")
+                ),
+                "fake_repo",
+            ),
+            pipeline_name,
         )
 
     def test_basic_storage(self, storage):
@@ -503,6 +525,62 @@ def test_fetch_by_status(self, storage):
             for run in storage.get_runs(PipelineRunsFilter(statuses=[PipelineRunStatus.SUCCESS]))
         } == set()
 
+    def test_get_queued_runs(self, storage):
+        assert storage
+        runs = [
+            ("default_first", PipelineRunStatus.QUEUED, {}),
+            ("low", PipelineRunStatus.QUEUED, {PRIORITY_TAG: "-1"}),
+            ("started_high", PipelineRunStatus.STARTED, {PRIORITY_TAG: "10"}),
+            ("high", PipelineRunStatus.QUEUED, {PRIORITY_TAG: "3"}),
+            ("malformed", PipelineRunStatus.QUEUED, {PRIORITY_TAG: "foo"}),
+            ("explicit_default", PipelineRunStatus.QUEUED, {PRIORITY_TAG: "0", "other": "tag"}),
+            ("higher", PipelineRunStatus.QUEUED, {PRIORITY_TAG: "5"}),
+            ("default_last", PipelineRunStatus.QUEUED, {"other": "tag"}),
+        ]
+        run_ids = {}
+        for name, status, tags in runs:
+            run_ids[name] = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_ids[name],
+                    pipeline_name="some_pipeline",
+                    status=status,
+                    tags=tags,
+                    external_pipeline_origin=TestRunStorage.fake_pipeline_origin("some_pipeline"),
+                )
+            )
+
+        expected_order = [
+            run_ids[name]
+            for name in [
+                "higher",
+                "high",
+                "default_first",
+                "malformed",
+                "explicit_default",
+                "default_last",
+                "low",
+            ]
+        ]
+        assert [run.run_id for run in storage.get_queued_runs()] == expected_order
+        assert [run.run_id for run in storage.get_queued_runs(limit=3)] == expected_order[:3]
+
+    def test_get_queued_runs_no_priorities(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for run_id in run_ids:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    status=PipelineRunStatus.QUEUED,
+                    external_pipeline_origin=TestRunStorage.fake_pipeline_origin("some_pipeline"),
+                )
+            )
+
+        assert [run.run_id for run in storage.get_queued_runs()] == run_ids
+        assert [run.run_id for run in storage.get_queued_runs(limit=2)] == run_ids[:2]
+
     def test_fetch_by_status_cursored(self, storage):
         assert storage
         one = make_new_run_id()
@@ -0,0 +1,217 @@
+import mock
+import pytest
+from dagster import (
+    Field,
+    Int,
+    ModeDefinition,
+    StringSource,
+    composite_solid,
+    configured,
+    pipeline,
+    solid,
+)
+from dagster.config.validate import process_config
+from dagster.core.errors import DagsterInvalidConfigError
+from dagster.core.system_config.objects import (
+    EnvironmentConfig,
+    EnvironmentConfigCache,
+    seed_environment_config_cache,
+)
+from dagster.core.test_utils import environ
+
+
+def define_config_pipeline():
+    @solid(config_schema={"num": Field(Int, default_value=1), "path": Field(StringSource)})
+    def configured_solid(context):
+        return context.solid_config["num"]
+
+    @pipeline(mode_defs=[ModeDefinition("default"), ModeDefinition("other")])
+    def config_pipeline():
+        configured_solid()
+
+    return config_pipeline
+
+
+def _run_config(num=2, path="/foo"):
+    return {"solids": {"configured_solid": {"config": {"num": num, "path": path}}}}
+
+
+def test_build_cached():
+    config_pipeline = define_config_pipeline()
+
+    with mock.patch(
+        "dagster.config.validate.process_config", wraps=process_config
+    ) as process_config_mock:
+        environment_config = EnvironmentConfig.build(config_pipeline, _run_config())
+        assert environment_config.solids["configured_solid"].config == {"num": 2, "path": "/foo"}
+        assert process_config_mock.call_count == 1
+
+        # an equal run config for the same pipeline and mode skips validation
+        run_config = _run_config()
+        cached = EnvironmentConfig.build(config_pipeline, run_config)
+        assert cached == environment_config
+        assert cached.original_config_dict is run_config
+        assert process_config_mock.call_count == 1
+
+        EnvironmentConfig.build(config_pipeline, _run_config(num=3))
+        assert process_config_mock.call_count == 2
+
+        EnvironmentConfig.build(config_pipeline, _run_config(), mode="other")
+        assert process_config_mock.call_count == 3
+
+        # a new definition of the same pipeline is built from scratch
+        EnvironmentConfig.build(define_config_pipeline(), _run_config())
+        assert process_config_mock.call_count == 4
+
+
+def test_build_cached_env_vars():
+    config_pipeline = define_config_pipeline()
+    run_config = _run_config(path={"env": "CONFIG_CACHE_TEST_PATH"})
+
+    with environ({"CONFIG_CACHE_TEST_PATH": "/foo"}):
+        environment_config = EnvironmentConfig.build(config_pipeline, run_config)
+        assert environment_config.solids["configured_solid"].config["path"] == "/foo"
+        assert EnvironmentConfig.build(config_pipeline, run_config) == environment_config
+
+    with environ({"CONFIG_CACHE_TEST_PATH": "/bar"}):
+        environment_config = EnvironmentConfig.build(config_pipeline, run_config)
+        assert environment_config.solids["configured_solid"].config["path"] == "/bar"
+
+
+def test_build_cached_copies():
+    config_pipeline = define_config_pipeline()
+
+    environment_config = EnvironmentConfig.build(config_pipeline, _run_config())
+    environment_config.solids["configured_solid"] = None
+
+    cached = EnvironmentConfig.build(config_pipeline, _run_config())
+    assert cached.solids["configured_solid"].config == {"num": 2, "path": "/foo"}
+    cached.solids.clear()
+    cached.resources.clear()
+
+    cached = EnvironmentConfig.build(config_pipeline, _run_config())
+    assert cached.solids["configured_solid"].config == {"num": 2, "path": "/foo"}
+    assert cached.resources
+
+
+def test_build_with_config_fns_not_cached():
+    @solid(config_schema={"num": Int})
+    def num_solid(context):
+        return context.solid_config["num"]
+
+    @configured(num_solid, config_schema={"base": Int})
+    def configured_num_solid(config):
+        return {"num": config["base"] + 1}
+
+    @composite_solid(
+        config_fn=lambda cfg: {"num_solid": {"config": {"num": cfg["num"]}}},
+        config_schema={"num": Int},
+    )
+    def mapped_composite():
+        num_solid()
+
+    @pipeline
+    def configured_pipeline():
+        configured_num_solid()
+
+    @pipeline
+    def composite_pipeline():
+        mapped_composite()
+
+    for pipeline_def, run_config in [
+        (configured_pipeline, {"solids": {"configured_num_solid": {"config": {"base": 1}}}}),
+        (composite_pipeline, {"solids": {"mapped_composite": {"config": {"num": 1}}}}),
+    ]:
+        with mock.patch(
+            "dagster.config.validate.process_config", wraps=process_config
+        ) as process_config_mock:
+            EnvironmentConfig.build(pipeline_def, run_config)
+            call_count = process_config_mock.call_count
+            EnvironmentConfig.build(pipeline_def, run_config)
+            assert process_config_mock.call_count == 2 * call_count
+
+
+def test_build_invalid_config_not_cached():
+    config_pipeline = define_config_pipeline()
+
+    for _ in range(2):
+        with pytest.raises(DagsterInvalidConfigError):
+            EnvironmentConfig.build(config_pipeline, _run_config(num="not_a_number"))
+
+
+def test_seed_environment_config_cache():
+    config_pipeline = define_config_pipeline()
+    environment_config = EnvironmentConfig.build(define_config_pipeline(), _run_config())
+
+    seed_environment_config_cache(config_pipeline, environment_config)
+    with mock.patch("dagster.config.validate.process_config") as process_config_mock:
+        assert EnvironmentConfig.build(config_pipeline, _run_config()) == environment_config
+        assert process_config_mock.call_count == 0
+
+
+def test_environment_config_cache_eviction():
+    config_pipeline = define_config_pipeline()
+    cache = EnvironmentConfigCache(max_entries=2)
+
+    run_configs = [_run_config(num=num) for num in range(3)]
+    for run_config in run_configs:
+        cache.put(config_pipeline, EnvironmentConfig.build(config_pipeline, run_config))
+
+    assert cache.get(config_pipeline, "default", run_configs[0]) is None
+    assert cache.get(config_pipeline, "default", run_configs[1]) is not None
+    assert cache.get(config_pipeline, "default", run_configs[2]) is not None
+    assert cache.get(config_pipeline, "other", run_configs[2]) is None
+
+    cache.clear()
+    assert cache.get(config_pipeline, "default", run_configs[2]) is None
+
+
+def define_config_heavy_pipeline(num_solids):
+    solids = []
+    for i in range(num_solids):
+
+        @solid(
+            name="solid_{}".format(i),
+            config_schema={
+                "num": Field(Int, default_value=i),
+                "name": str,
+                "options": {"retries": Field(Int, default_value=0), "tags": [str]},
+            },
+        )
+        def _solid(_):
+            pass
+
+        solids.append(_solid)
+
+    @pipeline
+    def config_heavy_pipeline():
+        for solid_def in solids:
+            solid_def()
+
+    return config_heavy_pipeline
+
+
+def test_environment_config_cache_many_solids():
+    num_solids = 200
+    config_heavy_pipeline = define_config_heavy_pipeline(num_solids)
+    run_config = {
+        "solids": {
+            "solid_{}".format(i): {
+                "config": {"name": "solid_{}".format(i), "options": {"tags": ["a", "b"]}}
+            }
+            for i in range(num_solids)
+        }
+    }
+
+    environment_config = EnvironmentConfig.build(config_heavy_pipeline, run_config)
+    assert environment_config.solids["solid_7"].config == {
+        "num": 7,
+        "name": "solid_7",
+        "options": {"retries": 0, "tags": ["a", "b"]},
+    }
+
+    with mock.patch(
+        "dagster.config.validate.process_config", wraps=process_config
+    ) as process_config_mock:
+        assert EnvironmentConfig.build(config_heavy_pipeline, run_config) == environment_config
+        assert process_config_mock.call_count == 0
@@ -0,0 +1,35 @@
+import io
+
+from dagster import execute_pipeline, lambda_solid, pipeline
+from dagster.core.debug import DebugRunPayload
+from dagster.core.test_utils import instance_for_test
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+
+
+@lambda_solid
+def emit_one():
+    return 1
+
+
+@pipeline
+def pipe_test():
+    emit_one()
+    emit_one()
+
+
+def test_write_for_run():
+    with instance_for_test() as instance:
+        run_result = execute_pipeline(pipe_test, instance=instance)
+        assert run_result.success
+        run = instance.get_run_by_id(run_result.run_id)
+
+        streamed = io.BytesIO()
+        DebugRunPayload.write_for_run(instance, run, streamed)
+
+        built = io.BytesIO()
+        DebugRunPayload.build(instance, run).write(built)
+
+        payload = deserialize_json_to_dagster_namedtuple(streamed.getvalue().decode())
+        assert isinstance(payload, DebugRunPayload)
+        assert payload == deserialize_json_to_dagster_namedtuple(built.getvalue().decode())
+        assert len(payload.event_list) == len(instance.all_logs(run.run_id))
@@ -5,8 +5,10 @@
 import pytest
 from dagster.core.execution.compute_logs import (
     mirror_stream_to_file,
+    redirect_to_file,
     should_disable_io_stream_redirect,
 )
+from dagster.seven import IS_WINDOWS
 from dagster.utils.test import get_temp_file_name
 
 
@@ -20,3 +22,33 @@ def test_capture():
 
         with open(capture_filepath, "r") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_capture_mirrors_to_stream():
+    with get_temp_file_name() as outer_filepath:
+        with get_temp_file_name() as capture_filepath:
+            with redirect_to_file(sys.stdout, outer_filepath):
+                print("BEFORE")
+                with mirror_stream_to_file(sys.stdout, capture_filepath) as pids:
+                    print("HELLO")
+                    for i in range(1000):
+                        print("LINE {}".format(i))
+                print("AFTER")
+
+            if not IS_WINDOWS:
+                # output is mirrored from this process, without spawning a tail process
+                assert pids == (None, None)
+
+            with open(capture_filepath, "r") as capture_stream:
+                captured = capture_stream.read()
+            assert "BEFORE" not in captured
+            assert captured.startswith("HELLO\n")
+            assert "LINE 999" in captured
+            assert "AFTER" not in captured
+
+            # everything captured was also written to the original stream, in order
+            with open(outer_filepath, "r") as outer_stream:
+                assert outer_stream.read() == "BEFORE\n" + captured + "AFTER\n"
@@ -15,11 +15,14 @@
     pipeline,
     reconstructable,
     resource,
+    seven,
     solid,
 )
 from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.seven import multiprocessing
 
@@ -166,6 +169,37 @@ def test_compute_log_manager_subscriptions():
         assert stderr[0].cursor > 400
 
 
+@pytest.mark.parametrize("polling_timeout", [None, 0.1])
+def test_compute_log_manager_subscription_updates(polling_timeout):
+    with seven.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir, polling_timeout=polling_timeout)
+        pipeline_run = PipelineRun(pipeline_name="spew_pipeline", run_id="live_run")
+        step_key = "spew.compute"
+
+        stdout = []
+        completed = []
+        manager.observable(pipeline_run.run_id, step_key, ComputeIOType.STDOUT).subscribe(
+            stdout.append, on_completed=lambda: completed.append(True)
+        )
+
+        def _wait_for(condition):
+            start = time.time()
+            while not condition():
+                assert time.time() - start < 10
+                time.sleep(0.05)
+
+        path = manager.get_local_path(pipeline_run.run_id, step_key, ComputeIOType.STDOUT)
+        with open(path, "a") as f:
+            f.write(HELLO_SOLID)
+
+        _wait_for(lambda: stdout and stdout[-1].data == HELLO_SOLID)
+
+        manager.on_watch_finish(pipeline_run, step_key)
+        _wait_for(lambda: completed)
+
+        manager.dispose()
+
+
 def gen_solid_name(length):
     return "".join(random.choice(string.ascii_lowercase) for x in range(length))
 
@@ -12,12 +12,14 @@
     String,
     composite_solid,
     dagster_type_loader,
+    execute_pipeline,
     pipeline,
     resource,
     solid,
     usable_as_dagster_type,
 )
 from dagster.core.definitions import InputDefinition
+from dagster.core.definitions.events import EventMetadataEntry
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.objects import StepOutputHandle
@@ -286,6 +288,50 @@ def test_resolve_memoized_execution_plan_partial_versioning():
     ]
 
 
+class IndexedVersionedInMemoryAssetStore(VersionedInMemoryAssetStore):
+    def __init__(self):
+        super(IndexedVersionedInMemoryAssetStore, self).__init__()
+        self.has_asset_calls = []
+
+    def set_asset(self, context, obj):
+        super(IndexedVersionedInMemoryAssetStore, self).set_asset(context, obj)
+        return EventMetadataEntry.path("/".join(self._get_keys(context)), "address")
+
+    def has_asset(self, context):
+        self.has_asset_calls.append(context.step_key)
+        return super(IndexedVersionedInMemoryAssetStore, self).has_asset(context)
+
+
+def test_resolve_memoized_execution_plan_indexed_versions():
+    asset_store = IndexedVersionedInMemoryAssetStore()
+    versioned_pipeline = versioned_pipeline_factory(asset_store)
+    instance = DagsterInstance.ephemeral()
+
+    speculative_execution_plan = create_execution_plan(versioned_pipeline)
+    memoized_execution_plan = resolve_memoized_execution_plan(
+        speculative_execution_plan, instance=instance
+    )
+    assert set(memoized_execution_plan.step_keys_to_execute) == {
+        "versioned_solid_no_input.compute",
+        "versioned_solid_takes_input.compute",
+    }
+    assert sorted(asset_store.has_asset_calls) == [
+        "versioned_solid_no_input.compute",
+        "versioned_solid_takes_input.compute",
+    ]
+
+    result = execute_pipeline(versioned_pipeline, instance=instance)
+    assert result.success
+
+    # the stored outputs are found in the event log, without probing the asset store
+    asset_store.has_asset_calls = []
+    memoized_execution_plan = resolve_memoized_execution_plan(
+        speculative_execution_plan, instance=instance
+    )
+    assert memoized_execution_plan.step_keys_to_execute == []
+    assert asset_store.has_asset_calls == []
+
+
 def _get_ext_version(config_value):
     return join_and_hash(str(config_value))
 
@@ -1,11 +1,17 @@
 import datetime
 import logging
 import re
+import threading
+import time
 
 import pendulum
 import pytest
 from dagster.core.test_utils import instance_for_test
-from dagster.daemon.controller import DagsterDaemonController, all_daemons_healthy
+from dagster.daemon.controller import (
+    DagsterDaemonController,
+    all_daemons_healthy,
+    get_daemon_status,
+)
 from dagster.daemon.daemon import SchedulerDaemon
 from dagster.daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster.daemon.types import DaemonType
@@ -160,3 +166,53 @@ def test_healthy_with_different_daemons():
         }
     ) as instance:
         assert not all_daemons_healthy(instance, curr_time=init_time)
+
+
+def test_hung_daemon_does_not_block_others():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster.core.run_coordinator.queued_run_coordinator",
+                "class": "QueuedRunCoordinator",
+                "config": {"dequeue_interval_seconds": 5},
+            },
+        }
+    ) as instance:
+        init_time = pendulum.now("UTC")
+        controller = DagsterDaemonController(instance, iteration_wait_seconds=0.1)
+
+        sensor_daemon = controller.get_daemon(DaemonType.SENSOR)
+        run_daemon = controller.get_daemon(DaemonType.QUEUED_RUN_COORDINATOR)
+
+        unblock = threading.Event()
+        sensor_daemon.run_iteration = unblock.wait
+
+        controller.run_iteration(init_time)
+        assert controller.is_iteration_in_progress(DaemonType.SENSOR)
+        assert not controller.is_iteration_in_progress(DaemonType.QUEUED_RUN_COORDINATOR)
+        assert run_daemon.last_iteration_time == init_time
+
+        # the run coordinator keeps iterating and heartbeating while the sensor daemon hangs
+        for seconds in range(5, 35, 5):
+            next_time = init_time + datetime.timedelta(seconds=seconds)
+            controller.run_iteration(next_time)
+            assert run_daemon.last_iteration_time == next_time
+            assert sensor_daemon.last_iteration_time == init_time
+
+        status_time = init_time + datetime.timedelta(seconds=100)
+        heartbeat_time = pendulum.instance(
+            instance.get_daemon_heartbeats()[DaemonType.QUEUED_RUN_COORDINATOR].timestamp
+        )
+        assert get_daemon_status(
+            instance, DaemonType.QUEUED_RUN_COORDINATOR, curr_time=heartbeat_time
+        ).healthy
+        assert not get_daemon_status(instance, DaemonType.SENSOR, curr_time=status_time).healthy
+
+        # once the hung iteration finishes, the sensor daemon is scheduled again
+        unblock.set()
+        for _ in range(50):
+            controller.run_iteration(status_time)
+            if sensor_daemon.last_iteration_time == status_time:
+                break
+            time.sleep(0.1)
+        assert sensor_daemon.last_iteration_time == status_time
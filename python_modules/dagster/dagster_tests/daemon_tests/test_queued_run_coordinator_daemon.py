@@ -1,6 +1,7 @@
 # pylint: disable=redefined-outer-name
 
 import pytest
+from dagster.core.host_representation import RepositoryLocationHandle
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.storage.tags import PRIORITY_TAG
 from dagster.core.test_utils import create_run_for_test, instance_for_test
@@ -126,3 +127,79 @@ def test_priority_on_malformed_tag(instance):
     coordinator.run_iteration()
 
     assert get_run_ids(instance.run_launcher.queue()) == ["bad-pri-run"]
+
+
+def test_tag_limits(instance):
+    create_run(
+        instance,
+        run_id="in-progress-redshift-run",
+        status=PipelineRunStatus.STARTED,
+        tags={"database": "redshift"},
+    )
+    create_run(
+        instance,
+        run_id="redshift-run-1",
+        status=PipelineRunStatus.QUEUED,
+        tags={"database": "redshift"},
+    )
+    create_run(
+        instance,
+        run_id="redshift-run-2",
+        status=PipelineRunStatus.QUEUED,
+        tags={"database": "redshift"},
+    )
+    create_run(
+        instance,
+        run_id="redshift-run-3",
+        status=PipelineRunStatus.QUEUED,
+        tags={"database": "redshift"},
+    )
+    create_run(
+        instance,
+        run_id="postgres-run",
+        status=PipelineRunStatus.QUEUED,
+        tags={"database": "postgres"},
+    )
+    create_run(instance, run_id="untagged-run", status=PipelineRunStatus.QUEUED)
+
+    coordinator = QueuedRunCoordinatorDaemon(
+        instance,
+        interval_seconds=5,
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "redshift", "limit": 2}],
+    )
+    coordinator.run_iteration()
+
+    assert get_run_ids(instance.run_launcher.queue()) == [
+        "redshift-run-1",
+        "postgres-run",
+        "untagged-run",
+    ]
+
+
+def test_location_handle_reused(instance, monkeypatch):
+    for i in range(3):
+        create_run(instance, run_id="queued-run-{}".format(i), status=PipelineRunStatus.QUEUED)
+
+    create_handle = RepositoryLocationHandle.create_from_repository_location_origin
+    location_origins = []
+
+    def _create_handle(origin):
+        location_origins.append(origin)
+        return create_handle(origin)
+
+    monkeypatch.setattr(
+        RepositoryLocationHandle,
+        "create_from_repository_location_origin",
+        staticmethod(_create_handle),
+    )
+
+    coordinator = QueuedRunCoordinatorDaemon(instance, interval_seconds=5, max_concurrent_runs=10)
+    coordinator.run_iteration()
+
+    assert get_run_ids(instance.run_launcher.queue()) == [
+        "queued-run-0",
+        "queued-run-1",
+        "queued-run-2",
+    ]
+    assert len(location_origins) == 1
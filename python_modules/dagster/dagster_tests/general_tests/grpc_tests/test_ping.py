@@ -6,6 +6,13 @@
 import pytest
 from dagster import check, seven
 from dagster.grpc import DagsterGrpcClient, DagsterGrpcServer, ephemeral_grpc_api_client
+from dagster.grpc.__generated__ import DagsterApiStub, api_pb2
+from dagster.grpc.client import (
+    _discard_shared_channel,
+    _get_shared_channel,
+    get_grpc_client_call_stats,
+    reset_grpc_client_call_stats,
+)
 from dagster.grpc.server import GrpcServerProcess, open_server_process
 from dagster.serdes.ipc import interrupt_ipc_subprocess_pid
 from dagster.utils import find_free_port, safe_tempfile_path
@@ -137,6 +144,69 @@ def test_streaming():
             assert result["echo"] == "foo"
 
 
+def test_shared_channel():
+    port = find_free_port()
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        client_one = DagsterGrpcClient(port=port)
+        client_two = DagsterGrpcClient(port=port)
+        assert client_one.ping("foo") == "foo"
+        assert client_two.ping("bar") == "bar"
+
+        channel = _get_shared_channel(
+            client_one._server_address  # pylint: disable=protected-access
+        )
+        assert channel is _get_shared_channel(
+            client_two._server_address  # pylint: disable=protected-access
+        )
+
+        client_one.close_channel()
+        assert channel is not _get_shared_channel(
+            client_one._server_address  # pylint: disable=protected-access
+        )
+        assert client_two.ping("baz") == "baz"
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+
+def test_discard_shared_channel():
+    port = find_free_port()
+    server_process = open_server_process(port=port, socket=None)
+    try:
+        client = DagsterGrpcClient(port=port)
+        server_address = client._server_address  # pylint: disable=protected-access
+        assert client.ping("foo") == "foo"
+
+        # a discarded channel is no longer shared, but calls already using it can carry on
+        channel = _get_shared_channel(server_address)
+        assert _discard_shared_channel(server_address, channel) is channel
+        assert _get_shared_channel(server_address) is not channel
+        assert DagsterApiStub(channel).Ping(api_pb2.PingRequest(echo="bar")).echo == "bar"
+
+        # only the channel still in use for the address is discarded
+        assert _discard_shared_channel(server_address, channel) is None
+
+        channel = _get_shared_channel(server_address)
+        client.shutdown_server()
+        assert _get_shared_channel(server_address) is not channel
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+
+
+def test_call_stats():
+    reset_grpc_client_call_stats()
+    with ephemeral_grpc_api_client() as api_client:
+        for _ in range(3):
+            assert api_client.ping("foo") == "foo"
+        list(api_client.streaming_ping(sequence_length=2, echo="foo"))
+
+    stats = get_grpc_client_call_stats()
+    assert stats["Ping"].count == 3
+    assert sum(stats["Ping"].buckets.values()) == 3
+    assert stats["Ping"].max_ms <= stats["Ping"].total_ms
+    assert stats["StreamingPing"].count == 1
+
+
 def test_get_server_id():
     with ephemeral_grpc_api_client() as api_client:
         assert api_client.get_server_id()
@@ -1,8 +1,18 @@
+import sys
 import threading
 import time
 
 import grpc
+import mock
+from dagster.core.host_representation import (
+    ExternalRepositoryOrigin,
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+)
+from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.grpc.client import ephemeral_grpc_api_client
+from dagster.grpc.server import DagsterApiServer
+from dagster.utils import file_relative_path
 
 
 def _stream_events_target(results, api_client):
@@ -39,3 +49,37 @@ def test_streaming_terminate():
 
         api_client._server_process.wait()  # pylint: disable=protected-access
         assert api_client._server_process.poll() == 0  # pylint: disable=protected-access
+
+
+def test_preload_does_not_block_startup():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        attribute="bar_repo",
+        python_file=file_relative_path(__file__, "grpc_repo.py"),
+    )
+    serialize_event = threading.Event()
+
+    def _wait_to_serialize(repository_def):
+        serialize_event.wait()
+        return external_repository_data_from_def(repository_def)
+
+    server_termination_event = threading.Event()
+    with mock.patch(
+        "dagster.grpc.server.external_repository_data_from_def", side_effect=_wait_to_serialize
+    ):
+        # the server is constructed while the repository snapshot is still being computed
+        server = DagsterApiServer(server_termination_event, loadable_target_origin)
+        try:
+            assert not serialize_event.is_set()
+            serialize_event.set()
+
+            # pylint: disable=protected-access
+            serialized_data, _hash = server._get_serialized_external_repository_data_and_hash(
+                ExternalRepositoryOrigin(
+                    ManagedGrpcPythonEnvRepositoryLocationOrigin(loadable_target_origin), "bar_repo"
+                )
+            )
+            assert serialized_data
+        finally:
+            server_termination_event.set()
+            server.cleanup()
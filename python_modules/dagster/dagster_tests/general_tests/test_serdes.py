@@ -3,11 +3,13 @@
 from enum import Enum
 
 import pytest
+from dagster import seven
 from dagster.check import CheckError, ParameterCheckError, inst_param, set_param
 from dagster.serdes import (
     Persistable,
     SerdesClassUsageError,
     _deserialize_json_to_dagster_namedtuple,
+    _loads,
     _pack_value,
     _serialize_dagster_namedtuple,
     _unpack_value,
@@ -379,3 +381,31 @@ def __new__(cls, a, b, c):
     assert isinstance(alphabet, SubstituteAlphabet)
     assert not isinstance(alphabet.c, DeprecatedAlphabet)
     assert isinstance(alphabet.c, SubstituteAlphabet)
+
+
+def test_str_enum_round_trip():
+    _TEST_WHITELIST_MAP = _initial_whitelist_map()
+
+    @_whitelist_for_serdes(whitelist_map=_TEST_WHITELIST_MAP)
+    class Color(str, Enum):
+        RED = "RED"
+
+    # str-valued enums must not be mistaken for plain strings
+    packed = _pack_value([Color.RED, "RED"], whitelist_map=_TEST_WHITELIST_MAP)
+    assert packed == [{"__enum__": "Color.RED"}, "RED"]
+    assert _unpack_value(packed, whitelist_map=_TEST_WHITELIST_MAP) == [Color.RED, "RED"]
+
+
+@pytest.mark.parametrize(
+    "json_str",
+    [
+        '{"foo": [1, -0, 1.5, true, null, "\\u00e9"]}',
+        '{"big_int": 123456789012345678901234567890}',
+        '{"nan": NaN, "inf": Infinity}',
+        '"raw \x01 control character"',
+    ],
+)
+def test_loads_matches_stdlib(json_str):
+    loaded = _loads(json_str)
+    expected = seven.json.loads(json_str)
+    assert repr(loaded) == repr(expected)
@@ -55,9 +55,22 @@ def error_sensor(context):
     raise Exception("womp womp")
 
 
+@sensor(pipeline_name="the_pipeline")
+def slow_sensor(_context):
+    time.sleep(8)
+    return RunRequest(run_key=None, run_config={}, tags={})
+
+
 @repository
 def the_repo():
-    return [the_pipeline, simple_sensor, error_sensor, always_on_sensor, run_key_sensor]
+    return [
+        the_pipeline,
+        simple_sensor,
+        error_sensor,
+        always_on_sensor,
+        run_key_sensor,
+        slow_sensor,
+    ]
 
 
 @contextmanager
@@ -304,3 +317,73 @@ def test_launch_once(external_repo_context, capfd):
             )
             captured = capfd.readouterr()
             assert f"Run {run.run_id} already completed with the run key `only_once` for run_key_sensor"
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_sensors_share_location_and_time_out(external_repo_context, monkeypatch, capfd):
+    freeze_datetime = pendulum.datetime(
+        year=2019, month=2, day=27, hour=23, minute=59, second=59,
+    ).in_tz("US/Central")
+    with instance_with_sensors(external_repo_context) as (instance, external_repo):
+        with pendulum.test(freeze_datetime):
+            external_sensors = [
+                external_repo.get_external_sensor(sensor_name)
+                for sensor_name in ["always_on_sensor", "error_sensor", "slow_sensor"]
+            ]
+            for external_sensor in external_sensors:
+                instance.add_job_state(
+                    JobState(
+                        external_sensor.get_external_origin(), JobType.SENSOR, JobStatus.RUNNING
+                    )
+                )
+
+            create_handle = RepositoryLocationHandle.create_from_repository_location_origin
+            location_origins = []
+
+            def _create_handle(origin):
+                location_origins.append(origin)
+                return create_handle(origin)
+
+            monkeypatch.setattr(
+                RepositoryLocationHandle,
+                "create_from_repository_location_origin",
+                staticmethod(_create_handle),
+            )
+
+            execute_sensor_iteration(
+                instance, get_default_daemon_logger("SensorDaemon"), sensor_timeout_seconds=4
+            )
+            wait_for_all_runs_to_start(instance)
+
+            # all three sensors are evaluated against a single load of the location
+            assert len(location_origins) == 1
+
+            always_on_sensor, error_sensor, slow_sensor = external_sensors
+            assert instance.get_runs_count() == 1
+            run = instance.get_runs()[0]
+
+            ticks = instance.get_job_ticks(always_on_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0], always_on_sensor, freeze_datetime, JobTickStatus.SUCCESS, [run.run_id]
+            )
+
+            ticks = instance.get_job_ticks(error_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                error_sensor,
+                freeze_datetime,
+                JobTickStatus.FAILURE,
+                [],
+                "Error occurred during the execution of evaluation_fn for sensor error_sensor",
+            )
+
+            ticks = instance.get_job_ticks(slow_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0], slow_sensor, freeze_datetime, JobTickStatus.FAILURE, [], "Deadline"
+            )
+
+            captured = capfd.readouterr()
+            assert "Error launching sensor run" in captured.out
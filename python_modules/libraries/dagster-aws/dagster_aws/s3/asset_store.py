@@ -4,17 +4,20 @@
 from dagster import AssetStore, Field, StringSource, check, resource
 from dagster.utils import PICKLE_PROTOCOL
 
-from .utils import construct_s3_client
+from .transfer import download_stream, upload_stream
+from .utils import construct_s3_client, s3_delete_key, s3_object_exists
 
 
 class PickledObjectS3AssetStore(AssetStore):
     def __init__(
-        self, s3_bucket, s3_session=None, s3_prefix=None,
+        self, s3_bucket, s3_session=None, s3_prefix=None, transfer_config=None,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.str_param(s3_prefix, "s3_prefix")
         self.s3 = s3_session or construct_s3_client(max_attempts=5)
         self.s3.head_bucket(Bucket=self.bucket)
+        # boto3.s3.transfer.TransferConfig for the multipart uploads and downloads of assets
+        self.transfer_config = transfer_config
 
     def _get_path(self, context):
         return "/".join([self.s3_prefix, "storage", *context.get_run_scoped_output_identifier()])
@@ -29,31 +32,13 @@ def _rm_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        def delete_for_results(store, results):
-            store.s3.delete_objects(
-                Bucket=store.bucket,
-                Delete={"Objects": [{"Key": result["Key"]} for result in results["Contents"]]},
-            )
-
-        if self._has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
-            delete_for_results(self, results)
-
-            continuation = results["IsTruncated"]
-            while continuation:
-                continuation_token = results["NextContinuationToken"]
-                results = self.s3.list_objects_v2(
-                    Bucket=self.bucket, Prefix=key, ContinuationToken=continuation_token
-                )
-                delete_for_results(self, results)
-                continuation = results["IsTruncated"]
+        s3_delete_key(self.s3, self.bucket, key)
 
     def _has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)["KeyCount"]
-        return bool(key_count > 0)
+        return s3_object_exists(self.s3, self.bucket, key)
 
     def _uri_for_key(self, key):
         check.str_param(key, "key")
@@ -61,7 +46,9 @@ def _uri_for_key(self, key):
 
     def get_asset(self, context):
         key = self._get_path(context)
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+        obj = download_stream(
+            self.s3, self.bucket, key, pickle.load, transfer_config=self.transfer_config
+        )
 
         return obj
 
@@ -69,12 +56,14 @@ def set_asset(self, context, obj):
         key = self._get_path(context)
         logging.info("Writing S3 object at: " + self._uri_for_key(key))
 
-        if self._has_object(key):
-            logging.warning("Removing existing S3 key: {key}".format(key=key))
-            self._rm_object(key)
-
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        self.s3.put_object(Bucket=self.bucket, Key=key, Body=pickled_obj)
+        # an upload replaces any existing object at the key, so there is no need to remove it first
+        upload_stream(
+            self.s3,
+            self.bucket,
+            key,
+            lambda write_file_obj: pickle.dump(obj, write_file_obj, PICKLE_PROTOCOL),
+            transfer_config=self.transfer_config,
+        )
 
 
 @resource(
@@ -1,19 +1,21 @@
+import io
 import logging
-import sys
-from io import BytesIO, StringIO
 
 from dagster import check
 from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.marshal import SerializationStrategy
 
-from .utils import construct_s3_client
+from .transfer import download_stream, upload_stream
+from .utils import construct_s3_client, s3_delete_key, s3_object_exists
 
 
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    def __init__(self, bucket, s3_session=None, transfer_config=None):
         self.bucket = check.str_param(bucket, "bucket")
 
         self.s3 = s3_session or construct_s3_client(max_attempts=5)
+        # boto3.s3.transfer.TransferConfig for the multipart uploads and downloads of objects
+        self.transfer_config = transfer_config
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__("s3", sep="/")
 
@@ -27,21 +29,17 @@ def set_object(self, key, obj, serialization_strategy=None):
             serialization_strategy, "serialization_strategy", SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning("Removing existing S3 key: {key}".format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            if serialization_strategy.write_mode == "w" and sys.version_info >= (3, 0):
-                with StringIO() as string_io:
-                    string_io = StringIO()
-                    serialization_strategy.serialize(obj, string_io)
-                    string_io.seek(0)
-                    bytes_io.write(string_io.read().encode("utf-8"))
+        # an upload replaces any existing object at the key, so there is no need to remove it first
+        def _write(write_file_obj):
+            if serialization_strategy.write_mode == "w":
+                text_io = io.TextIOWrapper(write_file_obj, encoding="utf-8")
+                serialization_strategy.serialize(obj, text_io)
+                text_io.flush()
+                text_io.detach()
             else:
-                serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+                serialization_strategy.serialize(obj, write_file_obj)
+
+        upload_stream(self.s3, self.bucket, key, _write, transfer_config=self.transfer_config)
 
         return self.uri_for_key(key)
 
@@ -52,15 +50,18 @@ def get_object(self, key, serialization_strategy=None):
             serialization_strategy, "serialization_strategy", SerializationStrategy
         )  # cannot be none here
 
+        def _read(read_file_obj):
+            if serialization_strategy.read_mode == "rb":
+                return serialization_strategy.deserialize(read_file_obj)
+
+            text_io = io.TextIOWrapper(read_file_obj, encoding=serialization_strategy.encoding)
+            obj = serialization_strategy.deserialize(text_io)
+            text_io.detach()
+            return obj
+
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
-            if serialization_strategy.read_mode == "rb"
-            else StringIO(
-                self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
-                .read()
-                .decode(serialization_strategy.encoding)
-            )
+        obj = download_stream(
+            self.s3, self.bucket, key, _read, transfer_config=self.transfer_config
         )
 
         return obj, self.uri_for_key(key)
@@ -69,31 +70,18 @@ def has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)["KeyCount"]
-        return bool(key_count > 0)
+        if s3_object_exists(self.s3, self.bucket, key):
+            return True
+
+        # type storage plugins may store a value as several objects under the key
+        results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key + self.sep, MaxKeys=1)
+        return results["KeyCount"] > 0
 
     def rm_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        def delete_for_results(store, results):
-            store.s3.delete_objects(
-                Bucket=store.bucket,
-                Delete={"Objects": [{"Key": result["Key"]} for result in results["Contents"]]},
-            )
-
-        if self.has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
-            delete_for_results(self, results)
-
-            continuation = results["IsTruncated"]
-            while continuation:
-                continuation_token = results["NextContinuationToken"]
-                results = self.s3.list_objects_v2(
-                    Bucket=self.bucket, Prefix=key, ContinuationToken=continuation_token
-                )
-                delete_for_results(self, results)
-                continuation = results["IsTruncated"]
+        s3_delete_key(self.s3, self.bucket, key, sep=self.sep)
 
         return self.uri_for_key(key)
 
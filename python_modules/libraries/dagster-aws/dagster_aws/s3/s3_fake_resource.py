@@ -26,15 +26,18 @@ def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argume
 
     def head_object(self, Bucket, Key, *args, **kwargs):
         self.mock_extras.head_object(*args, **kwargs)
-        return {"ContentLength": len(self.buckets.get(Bucket, {}).get(Key, b""))}
+        if not self.has_object(Bucket, Key):
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        return {"ContentLength": len(self.buckets[Bucket][Key])}
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {"KeyCount": 1, "Contents": [{"Key": key}], "IsTruncated": False}
-        else:
-            return {"KeyCount": 0, "Contents": [], "IsTruncated": False}
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        return {
+            "KeyCount": len(keys),
+            "Contents": [{"Key": key} for key in keys],
+            "IsTruncated": False,
+        }
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
@@ -47,10 +50,26 @@ def get_object(self, Bucket, Key, *args, **kwargs):
         self.mock_extras.get_object(*args, **kwargs)
         return {"Body": self._get_byte_stream(Bucket, Key)}
 
+    def delete_object(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.delete_object(*args, **kwargs)
+        self.buckets.get(Bucket, {}).pop(Key, None)
+
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete["Objects"]:
+            self.buckets.get(Bucket, {}).pop(obj["Key"], None)
+
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
 
+    def download_fileobj(self, Bucket, Key, Fileobj, *args, **kwargs):
+        if not self.has_object(Bucket, Key):
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+        self.mock_extras.download_fileobj(*args, **kwargs)
+        Fileobj.write(self.buckets[Bucket][Key])
+
     def has_object(self, bucket, key):
         return bucket in self.buckets and key in self.buckets[bucket]
 
@@ -0,0 +1,214 @@
+import io
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from boto3.s3.transfer import TransferConfig
+from dagster import check
+
+# Managed transfers split objects larger than the threshold into parts of the chunk size, and move
+# up to max_concurrency parts at a time, so that at most a few chunks are held in memory
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Bounds the data buffered between the thread that serializes or deserializes an object and the
+# thread that transfers it
+PIPE_MAX_CHUNKS = 4
+PIPE_WRITE_BUFFER_SIZE = 1024 * 1024
+
+_PIPE_POLL_INTERVAL = 0.1
+
+_EOF = object()
+
+
+def default_transfer_config():
+    return TransferConfig(
+        multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    )
+
+
+class _PipeFailedError(Exception):
+    pass
+
+
+class _ChunkPipe:
+    """A bounded pipe of byte chunks from a writing thread to a reading thread.
+
+    Either end can fail the pipe, after which the other end raises instead of blocking forever on
+    a peer that has gone away.
+    """
+
+    def __init__(self, max_chunks):
+        self._chunks = queue.Queue(maxsize=max_chunks)
+        self._error = None
+
+    def fail(self, error):
+        if self._error is None:
+            self._error = error
+
+    def _check(self):
+        if self._error is not None:
+            raise _PipeFailedError("The other end of the pipe failed") from self._error
+
+    def put(self, chunk):
+        while True:
+            self._check()
+            try:
+                self._chunks.put(chunk, timeout=_PIPE_POLL_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    def get(self):
+        while True:
+            self._check()
+            try:
+                return self._chunks.get(timeout=_PIPE_POLL_INTERVAL)
+            except queue.Empty:
+                pass
+
+
+class _PipeWriter(io.RawIOBase):
+    def __init__(self, pipe):
+        self._pipe = pipe
+        super(_PipeWriter, self).__init__()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        # the caller may reuse its buffer once we return
+        data = bytes(b)
+        if data:
+            self._pipe.put(data)
+        return len(data)
+
+
+class _PipeReader(io.RawIOBase):
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self._chunk = b""
+        self._offset = 0
+        self._eof = False
+        super(_PipeReader, self).__init__()
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._offset >= len(self._chunk):
+            if self._eof:
+                return 0
+            chunk = self._pipe.get()
+            if chunk is _EOF:
+                self._eof = True
+            else:
+                self._chunk, self._offset = chunk, 0
+
+        size = min(len(b), len(self._chunk) - self._offset)
+        b[:size] = memoryview(self._chunk)[self._offset : self._offset + size]
+        self._offset += size
+        return size
+
+
+def upload_stream(s3_session, bucket, key, write_fn, transfer_config=None):
+    """Upload the bytes that write_fn writes to a file object to an S3 key.
+
+    The bytes are streamed to a managed (multipart, for large objects) upload as they are written,
+    rather than collected in memory first. If write_fn raises, the upload is aborted and the key is
+    left as it was.
+
+    Args:
+        s3_session: The boto3 S3 client.
+        bucket (str): The bucket to upload to.
+        key (str): The key to upload to, which is overwritten if it exists.
+        write_fn (Callable[[BinaryIO], None]): Writes the object to the file object.
+        transfer_config (Optional[TransferConfig]): Configures the multipart transfer.
+    """
+    check.str_param(bucket, "bucket")
+    check.str_param(key, "key")
+    check.callable_param(write_fn, "write_fn")
+
+    pipe = _ChunkPipe(PIPE_MAX_CHUNKS)
+
+    def _upload():
+        try:
+            s3_session.upload_fileobj(
+                io.BufferedReader(_PipeReader(pipe)),
+                bucket,
+                key,
+                Config=transfer_config or default_transfer_config(),
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            pipe.fail(e)
+            raise
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_upload)
+        try:
+            writer = io.BufferedWriter(_PipeWriter(pipe), buffer_size=PIPE_WRITE_BUFFER_SIZE)
+            write_fn(writer)
+            writer.flush()
+            pipe.put(_EOF)
+        except _PipeFailedError:
+            # the upload failed, and its error is raised below
+            pass
+        except Exception as e:  # pylint: disable=broad-except
+            pipe.fail(e)
+            wait([future])
+            raise
+
+        future.result()
+
+
+def download_stream(s3_session, bucket, key, read_fn, transfer_config=None):
+    """Read an S3 key with read_fn, streaming the bytes from a managed (multipart, for large
+    objects) download as read_fn consumes them rather than collecting them in memory first.
+
+    Args:
+        s3_session: The boto3 S3 client.
+        bucket (str): The bucket to download from.
+        key (str): The key to download.
+        read_fn (Callable[[BinaryIO], Any]): Reads the object from the file object.
+        transfer_config (Optional[TransferConfig]): Configures the multipart transfer.
+
+    Returns:
+        Any: The value returned by read_fn.
+    """
+    check.str_param(bucket, "bucket")
+    check.str_param(key, "key")
+    check.callable_param(read_fn, "read_fn")
+
+    pipe = _ChunkPipe(PIPE_MAX_CHUNKS)
+
+    def _download():
+        try:
+            s3_session.download_fileobj(
+                bucket, key, _PipeWriter(pipe), Config=transfer_config or default_transfer_config()
+            )
+            pipe.put(_EOF)
+        except Exception as e:  # pylint: disable=broad-except
+            pipe.fail(e)
+            raise
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_download)
+        result = None
+        try:
+            reader = io.BufferedReader(_PipeReader(pipe))
+            result = read_fn(reader)
+            # drain whatever read_fn left unread, so that the download can complete
+            while reader.read(PIPE_WRITE_BUFFER_SIZE):
+                pass
+        except _PipeFailedError:
+            # the download failed, and its error is raised below
+            pass
+        except Exception as e:  # pylint: disable=broad-except
+            pipe.fail(e)
+            wait([future])
+            raise
+
+        future.result()
+        return result
@@ -1,6 +1,7 @@
 import boto3
 from botocore import __version__ as botocore_version
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from botocore.handlers import disable_signing
 from dagster import check
 from packaging import version
@@ -59,3 +60,49 @@ def construct_boto_client_retry_config(max_attempts):
     if version.parse(botocore_version) >= version.parse("1.15.0"):
         retry_config["mode"] = "standard"
     return Config(retries=retry_config)
+
+
+def s3_object_exists(s3_session, bucket, key):
+    """Check whether an object exists at exactly the given key, with a single HEAD request."""
+    check.str_param(bucket, "bucket")
+    check.str_param(key, "key")
+
+    try:
+        s3_session.head_object(Bucket=bucket, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return False
+        raise
+    return True
+
+
+def s3_delete_prefix(s3_session, bucket, prefix):
+    """Delete every object whose key starts with the given prefix."""
+    check.str_param(bucket, "bucket")
+    check.str_param(prefix, "prefix")
+
+    list_kwargs = {"Bucket": bucket, "Prefix": prefix}
+    while True:
+        results = s3_session.list_objects_v2(**list_kwargs)
+        contents = results.get("Contents", [])
+        if contents:
+            s3_session.delete_objects(
+                Bucket=bucket, Delete={"Objects": [{"Key": result["Key"]} for result in contents]},
+            )
+        if not results.get("IsTruncated"):
+            return
+        list_kwargs["ContinuationToken"] = results["NextContinuationToken"]
+
+
+def s3_delete_key(s3_session, bucket, key, sep="/"):
+    """Delete the object at exactly the given key, along with any objects stored under it.
+
+    Objects stored under the key are those whose keys start with ``key + sep``, so deleting
+    ``foo`` leaves ``foobar`` in place.
+    """
+    check.str_param(bucket, "bucket")
+    check.str_param(key, "key")
+    check.str_param(sep, "sep")
+
+    s3_session.delete_object(Bucket=bucket, Key=key)
+    s3_delete_prefix(s3_session, bucket, key + sep)
@@ -1,3 +1,5 @@
+import pytest
+from botocore.exceptions import ClientError
 from dagster import (
     AssetStoreContext,
     DagsterInstance,
@@ -13,6 +15,7 @@
 from dagster.core.execution.api import create_execution_plan, execute_plan
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.utils import make_new_run_id
+from dagster_aws.s3 import create_s3_fake_resource
 from dagster_aws.s3.asset_store import PickledObjectS3AssetStore, s3_asset_store
 
 
@@ -107,3 +110,29 @@ def test_s3_asset_store_execution(mock_s3_bucket):
 
     assert get_step_output(add_one_step_events, "add_one.compute")
     assert asset_store.get_asset(context) == 2
+
+
+def test_s3_asset_store_fake_session():
+    s3_session = create_s3_fake_resource()
+    asset_store = PickledObjectS3AssetStore(
+        "test-bucket", s3_session=s3_session, s3_prefix="dagster"
+    )
+    pipeline_def = define_inty_pipeline()
+    context = AssetStoreContext(
+        "return_one.compute",
+        "result",
+        {},
+        pipeline_def.name,
+        pipeline_def.solid_def_named("return_one"),
+        make_new_run_id(),
+    )
+
+    with pytest.raises(ClientError):
+        asset_store.get_asset(context)
+
+    asset_store.set_asset(context, 1)
+    asset_store.set_asset(context, 2)
+    # the existing object is overwritten, without checking for it or removing it first
+    assert not s3_session.mock_extras.list_objects_v2.called
+    assert not s3_session.mock_extras.delete_objects.called
+    assert asset_store.get_asset(context) == 2
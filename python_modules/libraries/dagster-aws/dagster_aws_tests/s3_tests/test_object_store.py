@@ -1,8 +1,13 @@
+import pytest
+from boto3.s3.transfer import TransferConfig
 from dagster.core.storage.object_store import DEFAULT_SERIALIZATION_STRATEGY
-from dagster_aws.s3 import S3ObjectStore
+from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster_aws.s3 import S3ObjectStore, create_s3_fake_resource
 
+MB = 1024 * 1024
 
-def test_s3_object_store(mock_s3_bucket, caplog):
+
+def test_s3_object_store(mock_s3_bucket):
     key = "foo"
 
     s3_obj_store = S3ObjectStore(mock_s3_bucket.name)
@@ -10,7 +15,6 @@ def test_s3_object_store(mock_s3_bucket, caplog):
     assert res_key == "s3://{s3_bucket}/{key}".format(s3_bucket=mock_s3_bucket.name, key=key)
 
     s3_obj_store.set_object(key, True, DEFAULT_SERIALIZATION_STRATEGY)
-    assert "Removing existing S3 key" in caplog.text
 
     assert s3_obj_store.has_object(key)
     assert s3_obj_store.get_object(key, DEFAULT_SERIALIZATION_STRATEGY)[0] == True
@@ -24,3 +28,89 @@ def test_s3_object_store(mock_s3_bucket, caplog):
     assert s3_obj_store.uri_for_key(key) == "s3://{s3_bucket}/{key}".format(
         s3_bucket=mock_s3_bucket.name, key=key
     )
+
+
+def test_s3_object_store_overwrite(mock_s3_bucket):
+    s3_obj_store = S3ObjectStore(mock_s3_bucket.name)
+    s3_obj_store.set_object("foo", True, DEFAULT_SERIALIZATION_STRATEGY)
+    s3_obj_store.set_object("foo", False, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY)[0] == False
+
+
+def test_s3_object_store_has_object_exact_key(mock_s3_bucket):
+    s3_obj_store = S3ObjectStore(mock_s3_bucket.name)
+    s3_obj_store.set_object("foobar", True, DEFAULT_SERIALIZATION_STRATEGY)
+    assert not s3_obj_store.has_object("foo")
+
+    # objects stored under the key, as by a type storage plugin
+    s3_obj_store.set_object("baz/part-0", True, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.has_object("baz")
+    s3_obj_store.rm_object("baz")
+    assert not s3_obj_store.has_object("baz")
+
+
+def test_s3_object_store_rm_object_exact_key(mock_s3_bucket):
+    s3_obj_store = S3ObjectStore(mock_s3_bucket.name)
+    s3_obj_store.set_object("foo", True, DEFAULT_SERIALIZATION_STRATEGY)
+    s3_obj_store.set_object("foo/part-0", True, DEFAULT_SERIALIZATION_STRATEGY)
+    s3_obj_store.set_object("foobar", True, DEFAULT_SERIALIZATION_STRATEGY)
+
+    s3_obj_store.rm_object("foo")
+    assert not s3_obj_store.has_object("foo")
+    assert not s3_obj_store.has_object("foo/part-0")
+    assert s3_obj_store.has_object("foobar")
+
+
+def test_s3_object_store_multipart(mock_s3_bucket):
+    # S3 requires every part but the last to be at least 5MB
+    s3_obj_store = S3ObjectStore(
+        mock_s3_bucket.name,
+        transfer_config=TransferConfig(
+            multipart_threshold=5 * MB, multipart_chunksize=5 * MB, max_concurrency=2
+        ),
+    )
+    value = [bytes([i]) * MB for i in range(12)]
+    s3_obj_store.set_object("foo", value, DEFAULT_SERIALIZATION_STRATEGY)
+
+    head = s3_obj_store.s3.head_object(Bucket=mock_s3_bucket.name, Key="foo")
+    # multipart uploads get an ETag of the form <digest>-<number of parts>
+    assert head["ETag"].strip('"').endswith("-3")
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY)[0] == value
+
+
+class FailingSerializationStrategy(PickleSerializationStrategy):
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(b"partial")
+        raise Exception("serialization failed")
+
+
+def test_s3_object_store_failed_serialization(mock_s3_bucket):
+    s3_obj_store = S3ObjectStore(mock_s3_bucket.name)
+    s3_obj_store.set_object("foo", True, DEFAULT_SERIALIZATION_STRATEGY)
+
+    with pytest.raises(Exception, match="serialization failed"):
+        s3_obj_store.set_object("foo", False, FailingSerializationStrategy())
+
+    # the existing object is left as it was
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY)[0] == True
+
+    with pytest.raises(Exception, match="serialization failed"):
+        s3_obj_store.set_object("bar", False, FailingSerializationStrategy())
+    assert not s3_obj_store.has_object("bar")
+
+
+def test_s3_object_store_fake_session():
+    s3_session = create_s3_fake_resource()
+    s3_obj_store = S3ObjectStore("test-bucket", s3_session=s3_session)
+
+    assert not s3_obj_store.has_object("foo")
+    s3_obj_store.set_object("foo", {"a": 1}, DEFAULT_SERIALIZATION_STRATEGY)
+    assert s3_obj_store.has_object("foo")
+
+    s3_obj_store.set_object("foo", {"a": 2}, DEFAULT_SERIALIZATION_STRATEGY)
+    # the existing object is overwritten rather than removed first
+    assert not s3_session.mock_extras.delete_objects.called
+    assert s3_obj_store.get_object("foo", DEFAULT_SERIALIZATION_STRATEGY)[0] == {"a": 2}
+
+    s3_obj_store.rm_object("foo")
+    assert not s3_obj_store.has_object("foo")
@@ -1,7 +1,10 @@
+import bisect
 import sys
 import time
 
 from celery.exceptions import TaskRevokedError
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.result import ResultSet
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
@@ -44,12 +47,9 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
         -1 * int(step.tags.get(DAGSTER_CELERY_STEP_PRIORITY_TAG, task_default_priority))
         + -1 * _get_run_priority(pipeline_context)
     )
-    priority_for_key = lambda step_key: (
-        priority_for_step(execution_plan.get_step_by_key(step_key))
-    )
     _warn_on_priority_misuse(pipeline_context, execution_plan)
 
-    step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
+    step_results = _StepResults(app)
     step_errors = {}
 
     with execution_plan.start(
@@ -69,41 +69,34 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 for key, result in step_results.items():
                     result.revoke()
                     active_execution.mark_interrupted(key)
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        yield DagsterEvent.engine_event(
-                            pipeline_context,
-                            'celery task for running step "{step_key}" was revoked.'.format(
-                                step_key=step_key,
-                            ),
-                            EngineEventData(marker_end=DELEGATE_MARKER),
+
+            # wakes up as soon as any outstanding task finishes, and otherwise after a tick so that
+            # interrupts and steps waiting to retry are checked
+            for step_key in step_results.wait_for_ready(TICK_SECONDS):
+                result = step_results.pop(step_key)
+                try:
+                    step_events = result.get()
+                except TaskRevokedError:
+                    step_events = []
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        'celery task for running step "{step_key}" was revoked.'.format(
                             step_key=step_key,
-                        )
-                    except Exception:  # pylint: disable=broad-except
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
-
-                    results_to_pop.append(step_key)
-
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(pipeline_context, step_key)
+                        ),
+                        EngineEventData(marker_end=DELEGATE_MARKER),
+                        step_key=step_key,
+                    )
+                except Exception:  # pylint: disable=broad-except
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_events = []
+                    step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+                for step_event in step_events:
+                    event = deserialize_json_to_dagster_namedtuple(step_event)
+                    yield event
+                    active_execution.handle_event(event)
+
+                active_execution.verify_complete(pipeline_context, step_key)
 
             # process skips from failures or uncovered inputs
             for event in active_execution.plan_events_iterator(pipeline_context):
@@ -134,8 +127,11 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                     priority = _get_step_priority(pipeline_context, step)
 
                     # Submit the Celery tasks
-                    step_results[step.key] = step_execution_fn(
-                        app, pipeline_context, step, queue, priority
+                    step_results.add(
+                        step.key,
+                        # results are processed highest priority first
+                        -1 * priority,
+                        step_execution_fn(app, pipeline_context, step, queue, priority),
                     )
 
                 except Exception:
@@ -148,7 +144,9 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            # nothing to wait on, e.g. while steps are waiting to retry
+            if not step_results:
+                time.sleep(TICK_SECONDS)
 
         if step_errors:
             raise DagsterSubprocessError(
@@ -164,6 +162,96 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             )
 
 
+class _ResultsReady(Exception):
+    pass
+
+
+class _StepResults(object):
+    """The celery results of the submitted steps that have not been processed yet.
+
+    Results are kept in priority order (and submission order within a priority) as steps are
+    submitted, rather than sorted on every tick. Where the result backend supports native joins
+    (e.g. redis and rpc), waiting for results consumes result messages as the tasks finish, rather
+    than asking the backend for the state of every outstanding task on every tick.
+    """
+
+    def __init__(self, app):
+        self._app = app
+        self._native_join = not app.conf.task_always_eager and app.backend.supports_native_join
+        self._results = {}  # Dict[str, celery.AsyncResult]
+        self._order = []  # List[Tuple[int, int, str]], sorted
+        self._entries = {}  # Dict[str, Tuple[int, int, str]]
+        self._step_keys_by_task_id = {}
+        self._num_submitted = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    def add(self, step_key, sort_key, result):
+        entry = (sort_key, self._num_submitted, step_key)
+        self._num_submitted += 1
+        bisect.insort(self._order, entry)
+        self._entries[step_key] = entry
+        self._results[step_key] = result
+        self._step_keys_by_task_id[result.id] = step_key
+
+    def pop(self, step_key):
+        entry = self._entries.pop(step_key)
+        del self._order[bisect.bisect_left(self._order, entry)]
+        result = self._results.pop(step_key)
+        del self._step_keys_by_task_id[result.id]
+        return result
+
+    def keys(self):
+        return [step_key for _, _, step_key in self._order]
+
+    def items(self):
+        return [(step_key, self._results[step_key]) for step_key in self.keys()]
+
+    def wait_for_ready(self, timeout):
+        """Wait up to timeout seconds for any of the results to be ready.
+
+        Returns:
+            List[str]: The keys of the steps whose results are ready, in priority order.
+        """
+        if not self._results:
+            return []
+
+        if self._native_join:
+            ready_step_keys = [
+                self._step_keys_by_task_id[task_id] for task_id in self._wait_native(timeout)
+            ]
+        else:
+            ready_step_keys = self._poll()
+            if not ready_step_keys:
+                time.sleep(timeout)
+
+        return sorted(ready_step_keys, key=self._entries.__getitem__)
+
+    def _poll(self):
+        return [step_key for step_key, result in self._results.items() if result.ready()]
+
+    def _wait_native(self, timeout):
+        ready_task_ids = []
+
+        def _stop_when_ready():
+            # called between waits for result messages, once the results received so far have
+            # been yielded
+            if ready_task_ids:
+                raise _ResultsReady()
+
+        result_set = ResultSet(list(self._results.values()), app=self._app)
+        try:
+            for task_id, _meta in result_set.iter_native(
+                timeout=timeout, on_interval=_stop_when_ready
+            ):
+                ready_task_ids.append(task_id)
+        except (_ResultsReady, CeleryTimeoutError):
+            pass
+
+        return ready_task_ids
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall pipeline run priority plus the individual
     step priority.
@@ -0,0 +1,91 @@
+import time
+import uuid
+
+from celery import Celery
+from dagster_celery.core_execution_loop import _StepResults
+
+
+class FakeResult(object):
+    def __init__(self, task_id, ready=False):
+        self.id = task_id
+        self.is_ready = ready
+
+    def ready(self):
+        return self.is_ready
+
+
+def _eager_app():
+    app = Celery("test_core_execution_loop")
+    app.conf.task_always_eager = True
+    return app
+
+
+def _native_join_app():
+    # the in-memory cache backend supports native joins, which it implements by polling the cache
+    app = Celery("test_core_execution_loop", backend="cache+memory://")
+    app.conf.task_always_eager = False
+    assert app.backend.supports_native_join
+    return app
+
+
+def test_step_results_priority_order():
+    step_results = _StepResults(_eager_app())
+    assert not step_results
+
+    step_results.add("low", 0, FakeResult("1"))
+    step_results.add("high", -10, FakeResult("2"))
+    step_results.add("low_2", 0, FakeResult("3"))
+    step_results.add("mid", -5, FakeResult("4"))
+
+    assert len(step_results) == 4
+    # highest priority (lowest sort key) first, then in submission order
+    assert step_results.keys() == ["high", "mid", "low", "low_2"]
+
+    assert step_results.pop("mid").id == "4"
+    assert [key for key, _ in step_results.items()] == ["high", "low", "low_2"]
+
+
+def test_step_results_wait_for_ready_polls_eager_results():
+    step_results = _StepResults(_eager_app())
+    assert step_results.wait_for_ready(0) == []
+
+    step_results.add("low", 0, FakeResult("1", ready=True))
+    step_results.add("pending", -10, FakeResult("2"))
+    step_results.add("high", -5, FakeResult("3", ready=True))
+
+    assert step_results.wait_for_ready(0) == ["high", "low"]
+    for step_key in ["high", "low"]:
+        step_results.pop(step_key)
+
+    assert step_results.wait_for_ready(0) == []
+    assert step_results.keys() == ["pending"]
+
+
+def test_step_results_wait_for_ready_native_join():
+    app = _native_join_app()
+    task_ids = {step_key: str(uuid.uuid4()) for step_key in ["low", "pending", "high"]}
+
+    step_results = _StepResults(app)
+    step_results.add("low", 0, app.AsyncResult(task_ids["low"]))
+    step_results.add("pending", -10, app.AsyncResult(task_ids["pending"]))
+    step_results.add("high", -5, app.AsyncResult(task_ids["high"]))
+
+    # none of the results are ready, so the wait times out
+    start = time.time()
+    assert step_results.wait_for_ready(0.5) == []
+    assert time.time() - start >= 0.5
+
+    app.backend.store_result(task_ids["low"], None, "SUCCESS")
+    app.backend.store_result(task_ids["high"], None, "SUCCESS")
+
+    # returns as soon as some of the results are ready, rather than waiting out the timeout for the
+    # rest of them
+    start = time.time()
+    assert step_results.wait_for_ready(30) == ["high", "low"]
+    assert time.time() - start < 10
+
+    for step_key in ["high", "low"]:
+        step_results.pop(step_key)
+
+    app.backend.store_result(task_ids["pending"], None, "SUCCESS")
+    assert step_results.wait_for_ready(30) == ["pending"]
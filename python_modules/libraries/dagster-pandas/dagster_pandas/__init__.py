@@ -13,12 +13,16 @@
     all_unique_validator,
     categorical_column_validator_factory,
     column_range_validation_factory,
+    column_regex_validation_factory,
+    column_unique_validation_factory,
     dtype_in_set_validation_factory,
     non_null_validation,
     nonnull,
+    vectorized_validator,
 )
 from .data_frame import (
     DataFrame,
+    DataFrameParquetSerializationStrategy,
     create_dagster_pandas_dataframe_type,
     create_structured_dataframe_type,
 )
@@ -29,6 +33,7 @@
 
 __all__ = [
     "DataFrame",
+    "DataFrameParquetSerializationStrategy",
     "create_dagster_pandas_dataframe_type",
     "create_structured_dataframe_type",
     "PandasColumn",
@@ -47,4 +52,7 @@
     "nonnull",
     "non_null_validation",
     "categorical_column_validator_factory",
+    "column_regex_validation_factory",
+    "column_unique_validation_factory",
+    "vectorized_validator",
 ]
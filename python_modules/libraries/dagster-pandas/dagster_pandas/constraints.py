@@ -1,8 +1,10 @@
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from dagster import DagsterType, EventMetadataEntry, TypeCheck, check
 from dagster.utils.backcompat import experimental_class_warning
@@ -378,10 +380,23 @@ def validate(self, dataframe):
             )
 
 
+DEFAULT_MAX_OFFENDING_ROWS = 100
+
+
 def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+def _validate_columns(validate_column_fn, columns, max_workers=None):
+    """Runs validate_column_fn over each of the columns, in a pool of up to max_workers threads if
+    given, and returns the results in the order of the columns."""
+    if not max_workers or len(columns) < 2:
+        return [validate_column_fn(column) for column in columns]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(validate_column_fn, columns))
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -396,25 +411,52 @@ class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_rows (Optional[int]): the most offending values to report for each column, defaults to 100.
+                    Set to None to report all of them.
+        max_workers (Optional[int]): if set, independent columns are validated in a pool of up to this many threads.
     """
 
+    def __init__(
+        self,
+        description,
+        validation_fn,
+        resulting_exception,
+        raise_or_typecheck=True,
+        name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+        max_workers=None,
+    ):
+        self.max_offending_rows = check.opt_int_param(max_offending_rows, "max_offending_rows")
+        self.max_workers = check.opt_int_param(max_workers, "max_workers")
+        super(ColumnAggregateConstraintWithMetadata, self).__init__(
+            description,
+            validation_fn,
+            resulting_exception,
+            raise_or_typecheck=raise_or_typecheck,
+            name=name,
+        )
+
     def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
+
+        def _validate_column(column):
+            # TODO: grab extra metadata
+            return self.validation_fn(data[column])
 
         offending_columns = set()
         offending_values = {}
-        for column in columns:
-            # TODO: grab extra metadata
-            res = self.validation_fn(relevant_data[column])
+        results = _validate_columns(_validate_column, columns, max_workers=self.max_workers)
+        for column, res in zip(columns, results):
             if not res[0]:
                 offending_columns.add(column)
-                if not res[1].get("actual") is None:
-                    offending_values[column] = [x.item() for x in res[1].get("actual").to_numpy()]
-                else:
-                    offending_values[column] = [x.item() for x in relevant_data[column].to_numpy()]
+                actual = res[1].get("actual")
+                if actual is None:
+                    actual = data[column]
+                offending_values[column] = [
+                    x.item() for x in actual.to_numpy()[: self.max_offending_rows]
+                ]
         if len(offending_columns) == 0 and not self.raise_or_typecheck:
             return TypeCheck(success=True)
         elif len(offending_columns) > 0:
@@ -438,7 +480,8 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
     This class is useful for constructing single constraints that
     you want to apply to multiple columns of your dataframe
     The main difference from the base class in terms of construction is that now, your validation_fns should operate on
-    individual values.
+    individual values, or, if decorated with :py:func:`~dagster_pandas.constraints.vectorized_validator`, on whole
+    columns at once.
     args:
         description (str): description of the constraint
         validation_fn (Callable[[Any], Tuple[bool, dict[str, Union[dict,list, str, set]]]]:
@@ -450,23 +493,58 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
         raise_or_typecheck (Optional[bool]): whether to raise an exception (if set to True) or emit a failed typecheck event
                     (if set to False) when validation fails
         name (Optional[str]): what to call the constraint, defaults to the class name.
+        max_offending_rows (Optional[int]): the most offending rows to report for each column, defaults to 100.
+                    Set to None to report all of them.
+        max_workers (Optional[int]): if set, independent columns are validated in a pool of up to this many threads.
     """
 
+    def __init__(
+        self,
+        description,
+        validation_fn,
+        resulting_exception,
+        raise_or_typecheck=True,
+        name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+        max_workers=None,
+    ):
+        self.max_offending_rows = check.opt_int_param(max_offending_rows, "max_offending_rows")
+        self.max_workers = check.opt_int_param(max_workers, "max_workers")
+        super(ColumnConstraintWithMetadata, self).__init__(
+            description,
+            validation_fn,
+            resulting_exception,
+            raise_or_typecheck=raise_or_typecheck,
+            name=name,
+        )
+
     def validate(self, data, *columns, **kwargs):
         if len(columns) == 0:
             columns = data.columns
 
         columns = [column for column in columns if column in data.columns]
-        relevant_data = data[list(columns)]
+
+        def _validate_column(column):
+            if getattr(self.validation_fn, "vectorized", False):
+                invalid = ~np.asarray(self.validation_fn(data[column])[0], dtype=bool)
+            else:
+                # TODO:  grab metadata from here
+                invalid = np.asarray(
+                    data[column].apply(lambda x: not self.validation_fn(x)[0]), dtype=bool
+                )
+            return np.flatnonzero(invalid)
+
         offending = {}
         offending_values = {}
-        # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
-        for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+        results = _validate_columns(_validate_column, columns, max_workers=self.max_workers)
+        for column, positions in zip(columns, results):
+            if len(positions) == 0:
+                continue
+            sample = positions[: self.max_offending_rows]
+            offending[column] = ["row " + str(i) for i in data.index[sample].tolist()]
+            if len(sample) < len(positions):
+                offending[column].append("and {} more rows".format(len(positions) - len(sample)))
+            offending_values[column] = data[column].iloc[sample].tolist()
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -505,6 +583,9 @@ class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
             type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
                                                 ConstraintWithMetadata
             name (Optional[str]): what to call the constraint, defaults to the class name.
+            max_offending_rows (Optional[int]): the most offending rows to report for each column and function,
+                                                defaults to 100. Set to None to report all of them.
+            max_workers (Optional[int]): if set, the columns are validated in a pool of up to this many threads.
     """
 
     def __init__(
@@ -515,26 +596,46 @@ def __init__(
         raise_or_typecheck=True,
         type_for_internal=ColumnConstraintWithMetadata,
         name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+        max_workers=None,
     ):
         # TODO:  support multiple descriptions
         self.column_to_fn_dict = check.dict_param(
             fn_and_columns_dict, "fn_and_columns_dict", key_type=str
         )
 
+        internal_kwargs = {"raise_or_typecheck": False}
+        if issubclass(
+            type_for_internal, (ColumnConstraintWithMetadata, ColumnAggregateConstraintWithMetadata)
+        ):
+            internal_kwargs["max_offending_rows"] = max_offending_rows
+        column_to_validators = {
+            column: [
+                (
+                    fn,
+                    type_for_internal(
+                        fn.__doc__, fn, ColumnWithMetadataException, **internal_kwargs
+                    ),
+                )
+                for fn in fn_arr
+            ]
+            for column, fn_arr in self.column_to_fn_dict.items()
+        }
+
         def validation_fn(data, *args, **kwargs):
+            columns = [column for column in self.column_to_fn_dict if column in data.columns]
+
+            def _validate_column(column):
+                return [
+                    (fn, validator.validate(DataFrame(data[column]), column, *args, **kwargs))
+                    for fn, validator in column_to_validators[column]
+                ]
+
             metadict = defaultdict(dict)
             truthparam = True
-            for column, fn_arr in self.column_to_fn_dict.items():
-                if column not in data.columns:
-                    continue
-                for fn in fn_arr:
-                    # TODO:  do this more effectively
-                    new_validator = type_for_internal(
-                        fn.__doc__, fn, ColumnWithMetadataException, raise_or_typecheck=False
-                    )
-                    result = new_validator.validate(
-                        DataFrame(data[column]), column, *args, **kwargs
-                    )
+            results = _validate_columns(_validate_column, columns, max_workers=self.max_workers)
+            for column, column_results in zip(columns, results):
+                for fn, result in column_results:
                     result_val = result.success
                     if result_val:
                         continue
@@ -563,6 +664,8 @@ def validation_fn(data, *args, **kwargs):
             resulting_exception,
             raise_or_typecheck=raise_or_typecheck,
             name=name,
+            max_offending_rows=max_offending_rows,
+            max_workers=max_workers,
         )
 
     def validate(self, data, *args, **kwargs):
@@ -584,9 +687,10 @@ class MultiAggregateConstraintWithMetadata(MultiColumnConstraintWithMetadata):
             resulting_exception (type): the response to generate if validation fails. Subclass of
                                         ConstraintWithMetadataException
             raise_or_typecheck (Optional[bool]):  whether to raise an exception (true) or a failed typecheck (false)
-            type_for_internal (Optional[type]): what type to use for internal validators.  Subclass of
-                                                ConstraintWithMetadata
             name (Optional[str]): what to call the constraint, defaults to the class name.
+            max_offending_rows (Optional[int]): the most offending values to report for each column and function,
+                                                defaults to 100. Set to None to report all of them.
+            max_workers (Optional[int]): if set, the columns are validated in a pool of up to this many threads.
     """
 
     def __init__(
@@ -596,6 +700,8 @@ def __init__(
         resulting_exception,
         raise_or_typecheck=True,
         name=None,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+        max_workers=None,
     ):
         super(MultiAggregateConstraintWithMetadata, self).__init__(
             description,
@@ -604,9 +710,59 @@ def __init__(
             raise_or_typecheck=raise_or_typecheck,
             type_for_internal=ColumnAggregateConstraintWithMetadata,
             name=name,
+            max_offending_rows=max_offending_rows,
+            max_workers=max_workers,
         )
 
 
+def vectorized_validator(func):
+    """
+    decorator for column validation functions that operate on a whole column at once
+    The decorated function should take a pd.Series and return a tuple of a boolean mask that is True for each valid
+    value, and a dict of metadata. Column constraints then validate each column with a single call, rather than
+    calling the function once per value. Called on a single value, the decorated function returns a tuple of a
+    boolean for success or failure and the metadata, like any other column validation function.
+    Usage:
+        pass decorated functions as column validators to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+    Example:
+        .. code-block:: python
+            @vectorized_validator
+            def positive_validation_fn(column):
+                return column > 0, {}
+
+            positive_validation_fn.__doc__ = "checks whether values are positive"
+    """
+
+    @wraps(func)
+    def validator(values):
+        if isinstance(values, pd.Series):
+            return func(values)
+        mask, metadata = func(pd.Series([values], dtype=object))
+        return bool(np.asarray(mask, dtype=bool)[0]), metadata
+
+    validator.vectorized = True
+    return validator
+
+
+def _isinstance_mask(column, types):
+    """A boolean mask of which values of the column are instances of the given types, as the values
+    would be passed one at a time to a column validation function."""
+    if column.dtype == object:
+        return np.array(column.map(lambda x: isinstance(x, types)), dtype=bool)
+
+    # the non-null values of a typed column all box to the same type, as do its nulls
+    notnull = column.notna().to_numpy()
+    mask = np.zeros(len(column), dtype=bool)
+    for selected in (notnull, ~notnull):
+        if selected.any():
+            value = column.iloc[[selected.argmax()]].astype(object).iloc[0]
+            mask[selected] = isinstance(value, types)
+    return mask
+
+
+@vectorized_validator
 def non_null_validation(x):
     """
     validates that a particular value in a column is not null
@@ -617,7 +773,7 @@ def non_null_validation(x):
         Generally, you should prefer to use nonnull as a decorator/wrapper rather than using this
         directly.
     """
-    return not pd.isnull(x), {}
+    return x.notna().to_numpy(), {}
 
 
 def all_unique_validator(column, ignore_missing_vals=False):
@@ -669,11 +825,20 @@ def nonnull(func):
             the column validator you want to error on nulls
     """
 
-    @wraps(func)
-    def nvalidator(val):
-        origval = func(val)
-        nval = non_null_validation(val)
-        return origval[0] and nval[0], {}
+    if getattr(func, "vectorized", False):
+
+        @vectorized_validator
+        @wraps(func)
+        def nvalidator(column):
+            return np.asarray(func(column)[0], dtype=bool) & non_null_validation(column)[0], {}
+
+    else:
+
+        @wraps(func)
+        def nvalidator(val):
+            origval = func(val)
+            nval = non_null_validation(val)
+            return origval[0] and nval[0], {}
 
     nvalidator.__doc__ += " and ensures no values are null"
 
@@ -727,10 +892,15 @@ def create_dataframe(_):
         else:
             maxim = sys.maxsize
 
-    def in_range_validation_fn(x):
-        if ignore_missing_vals and pd.isnull(x):
-            return True, {}
-        return (isinstance(x, (type(minim), type(maxim)))) and (x <= maxim) and (x >= minim), {}
+    @vectorized_validator
+    def in_range_validation_fn(column):
+        valid = _isinstance_mask(column, (type(minim), type(maxim)))
+        if valid.any():
+            values = column[valid]
+            valid[valid] = np.asarray((values <= maxim) & (values >= minim), dtype=bool)
+        if ignore_missing_vals:
+            valid |= column.isnull().to_numpy()
+        return valid, {}
 
     in_range_validation_fn.__doc__ = "checks whether values are between {} and {}".format(
         minim, maxim
@@ -781,10 +951,12 @@ def create_dataframe(_):
 
     categories = set(categories)
 
-    def categorical_validation_fn(x):
-        if ignore_missing_vals and pd.isnull(x):
-            return True, {}
-        return (x in categories), {}
+    @vectorized_validator
+    def categorical_validation_fn(column):
+        valid = np.array(column.isin(categories), dtype=bool)
+        if ignore_missing_vals:
+            valid |= column.isnull().to_numpy()
+        return valid, {}
 
     categorical_validation_fn.__doc__ = "checks whether values are within this set of values: {}".format(
         categories
@@ -833,10 +1005,12 @@ def create_dataframe(_):
 
     """
 
-    def dtype_in_set_validation_fn(x):
-        if ignore_missing_vals and pd.isnull(x):
-            return True, {}
-        return isinstance(x, datatypes), {}
+    @vectorized_validator
+    def dtype_in_set_validation_fn(column):
+        valid = _isinstance_mask(column, datatypes)
+        if ignore_missing_vals:
+            valid |= column.isnull().to_numpy()
+        return valid, {}
 
     dtype_in_set_validation_fn.__doc__ = "checks whether values are this type/types: {}".format(
         datatypes
@@ -847,8 +1021,127 @@ def dtype_in_set_validation_fn(x):
     return dtype_in_set_validation_fn
 
 
+def column_unique_validation_factory(ignore_missing_vals=False):
+    """
+    factory for validators testing if column values are unique
+    Every repeat of a value that appeared earlier in the column is flagged as offending.
+    Args:
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a validation function for this constraint
+
+    Usage:
+        pass returned functions as column validators to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+
+    Example:
+        .. code-block:: python
+            unique_validation_fn = column_unique_validation_factory()
+            column_validator = MultiColumnConstraintWithMetadata(
+                            "confirms values are unique",
+                            {'bar': [unique_validation_fn]},
+                            ColumnWithMetadataException,
+                            raise_or_typecheck=False,
+                        )
+            ntype = create_structured_dataframe_type(
+            "UniqueType",
+            columns_validator=column_validator
+            )
+            @solid(output_defs=[OutputDefinition(name='basic_dataframe', dagster_type=ntype)])
+            def create_dataframe(_):
+                yield Output(
+                DataFrame({'foo': [1, 2, 7], 'bar': [9, 10, 10]}), output_name='basic_dataframe',
+            )
+            #will fail with
+            metadata['offending'] == {'bar': {'unique_validation_fn': ['row 2']}}
+            metadata['actual'] == {'bar': {'unique_validation_fn': [10]}}
+
+    """
+
+    @vectorized_validator
+    def unique_validation_fn(column):
+        valid = ~column.duplicated().to_numpy()
+        if ignore_missing_vals:
+            valid |= column.isnull().to_numpy()
+        return valid, {}
+
+    unique_validation_fn.__doc__ = "checks whether values are unique"
+    if ignore_missing_vals:
+        unique_validation_fn.__doc__ += ", ignoring nulls"
+
+    return unique_validation_fn
+
+
+def column_regex_validation_factory(regex, ignore_missing_vals=False):
+    """
+    factory for validators testing if column values are strings matching a regular expression
+    Args:
+        regex(str): the regular expression that the whole of each value must match
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a validation function for this constraint
+
+    Usage:
+        pass returned functions as column validators to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+
+    Example:
+        .. code-block:: python
+            regex_validation_fn = column_regex_validation_factory(r"[a-z]+@[a-z]+\.com")
+            column_validator = MultiColumnConstraintWithMetadata(
+                            "confirms values are email addresses",
+                            {'email': [regex_validation_fn]},
+                            ColumnWithMetadataException,
+                            raise_or_typecheck=False,
+                        )
+            ntype = create_structured_dataframe_type(
+            "EmailType",
+            columns_validator=column_validator
+            )
+            @solid(output_defs=[OutputDefinition(name='basic_dataframe', dagster_type=ntype)])
+            def create_dataframe(_):
+                yield Output(
+                DataFrame({'email': ['a@b.com', 'c@d', 7]}), output_name='basic_dataframe',
+            )
+            #will fail with
+            metadata['offending'] == {'email': {'regex_validation_fn': ['row 1', 'row 2']}}
+            metadata['actual'] == {'email': {'regex_validation_fn': ['c@d', 7]}}
+
+    """
+    check.str_param(regex, "regex")
+    # anchor the end of the match, as str.fullmatch is not available in all supported pandas versions
+    anchored_regex = r"(?:{})\Z".format(regex)
+
+    @vectorized_validator
+    def regex_validation_fn(column):
+        valid = _isinstance_mask(column, str)
+        if valid.any():
+            valid[valid] = np.asarray(
+                column[valid].astype(str).str.match(anchored_regex), dtype=bool
+            )
+        if ignore_missing_vals:
+            valid |= column.isnull().to_numpy()
+        return valid, {}
+
+    regex_validation_fn.__doc__ = "checks whether values are strings matching {}".format(regex)
+    if ignore_missing_vals:
+        regex_validation_fn.__doc__ += ", ignoring nulls"
+
+    return regex_validation_fn
+
+
 class ColumnRangeConstraintWithMetadata(ColumnConstraintWithMetadata):
-    def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True):
+    def __init__(
+        self,
+        minim=None,
+        maxim=None,
+        columns=None,
+        raise_or_typecheck=True,
+        max_offending_rows=DEFAULT_MAX_OFFENDING_ROWS,
+        max_workers=None,
+    ):
         self.name = self.__class__.__name__
 
         description = "Confirms values are between {} and {}".format(minim, maxim)
@@ -857,6 +1150,8 @@ def __init__(self, minim=None, maxim=None, columns=None, raise_or_typecheck=True
             validation_fn=column_range_validation_factory(minim=minim, maxim=maxim),
             resulting_exception=ColumnWithMetadataException,
             raise_or_typecheck=raise_or_typecheck,
+            max_offending_rows=max_offending_rows,
+            max_workers=max_workers,
         )
         self.columns = columns
 
@@ -5,6 +5,7 @@
     DagsterType,
     EventMetadataEntry,
     Field,
+    SerializationStrategy,
     StringSource,
     TypeCheck,
     check,
@@ -87,6 +88,33 @@ def dataframe_loader(_context, config):
         )
 
 
+class DataFrameParquetSerializationStrategy(SerializationStrategy):
+    """Serializes pandas dataframes to Parquet, which is columnar and compressed, and doesn't need
+    the whole dataframe to be pickled into a single buffer.
+
+    Requires pyarrow or fastparquet, and dataframes whose column names are strings. Pass it as the
+    ``serialization_strategy`` of a dataframe type to use it wherever values of the type are
+    stored, e.g. by ``typed_fs_object_manager`` or by intermediate storage.
+    """
+
+    def __init__(self, name="parquet"):
+        super(DataFrameParquetSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        value.to_parquet(write_file_obj)
+
+    def deserialize(self, read_file_obj):
+        return pd.read_parquet(read_file_obj)
+
+    def serialize_to_file(self, value, write_path):
+        check.str_param(write_path, "write_path")
+        value.to_parquet(write_path)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, "read_path")
+        return pd.read_parquet(read_path)
+
+
 def df_type_check(_, value):
     if not isinstance(value, pd.DataFrame):
         return TypeCheck(success=False)
@@ -158,6 +186,7 @@ def create_dagster_pandas_dataframe_type(
     dataframe_constraints=None,
     loader=None,
     materializer=None,
+    serialization_strategy=None,
 ):
     """
     Constructs a custom pandas dataframe dagster type.
@@ -177,6 +206,9 @@ def create_dagster_pandas_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        serialization_strategy (Optional[SerializationStrategy]): How values of the type are
+            serialized when they are stored, e.g. :py:class:`DataFrameParquetSerializationStrategy`.
+            If None, we will default to pickling.
     """
     # We allow for the plugging in of dagster_type_loaders/materializers so that
     # Users can load and materialize their custom dataframes via configuration their own way if the default
@@ -217,6 +249,7 @@ def _dagster_type_check(_, value):
         loader=loader if loader else dataframe_loader,
         materializer=materializer if loader else dataframe_materializer,
         description=description,
+        serialization_strategy=serialization_strategy,
     )
 
 
@@ -229,6 +262,7 @@ def create_structured_dataframe_type(
     dataframe_validator=None,
     loader=None,
     materializer=None,
+    serialization_strategy=None,
 ):
     """
 
@@ -251,6 +285,9 @@ def create_structured_dataframe_type(
         materializer (Optional[DagsterTypeMaterializer]): An instance of a class
             that inherits from :py:class:`~dagster.DagsterTypeMaterializer`. If None, we will
             default to using `dataframe_materializer`.
+        serialization_strategy (Optional[SerializationStrategy]): How values of the type are
+            serialized when they are stored, e.g. :py:class:`DataFrameParquetSerializationStrategy`.
+            If None, we will default to pickling.
 
     Returns:
         a DagsterType with the corresponding name and packaged validation.
@@ -305,6 +342,7 @@ def _dagster_type_check(_, value):
         loader=loader if loader else dataframe_loader,
         materializer=materializer if loader else dataframe_materializer,
         description=description,
+        serialization_strategy=serialization_strategy,
     )
 
 
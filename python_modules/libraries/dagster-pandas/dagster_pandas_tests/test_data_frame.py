@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from dagster import (
     AssetMaterialization,
@@ -6,6 +8,7 @@
     EventMetadataEntry,
     Field,
     InputDefinition,
+    ModeDefinition,
     Output,
     OutputDefinition,
     Selector,
@@ -15,17 +18,23 @@
     execute_pipeline,
     execute_solid,
     pipeline,
+    seven,
     solid,
 )
+from dagster.core.storage.fs_object_manager import typed_fs_object_manager
 from dagster.utils import safe_tempfile_path
 from dagster_pandas.constraints import (
     ColumnDTypeInSetConstraint,
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
 )
-from dagster_pandas.data_frame import _execute_summary_stats, create_dagster_pandas_dataframe_type
+from dagster_pandas.data_frame import (
+    DataFrameParquetSerializationStrategy,
+    _execute_summary_stats,
+    create_dagster_pandas_dataframe_type,
+)
 from dagster_pandas.validation import PandasColumn
-from pandas import DataFrame, read_csv
+from pandas import DataFrame, read_csv, read_parquet
 
 
 def test_create_pandas_dataframe_dagster_type():
@@ -247,3 +256,34 @@ def did_i_win(_, df):
     materialization_events = solid_result.materialization_events_during_compute
     assert len(materialization_events) == 1
     assert materialization_events[0].event_specific_data.materialization.label == "nothing"
+
+
+def test_dataframe_parquet_serialization_strategy():
+    pytest.importorskip("pyarrow")
+
+    ParquetDataFrame = create_dagster_pandas_dataframe_type(
+        name="ParquetDataFrame", serialization_strategy=DataFrameParquetSerializationStrategy(),
+    )
+
+    @solid(output_defs=[OutputDefinition(ParquetDataFrame)])
+    def create_dataframe(_):
+        return DataFrame({"foo": [1, 2, 3], "bar": ["a", "b", "c"]})
+
+    @solid(input_defs=[InputDefinition("df", ParquetDataFrame)])
+    def count_rows(_, df):
+        return len(df)
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"asset_store": typed_fs_object_manager})])
+    def parquet_pipeline():
+        count_rows(create_dataframe())
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        result = execute_pipeline(
+            parquet_pipeline,
+            run_config={"resources": {"asset_store": {"config": {"base_dir": tmpdir_path}}}},
+        )
+        assert result.success
+        assert result.result_for_solid("count_rows").output_value() == 3
+
+        path = os.path.join(tmpdir_path, result.run_id, "create_dataframe.compute", "result")
+        assert read_parquet(path).equals(DataFrame({"foo": [1, 2, 3], "bar": ["a", "b", "c"]}))
@@ -10,6 +10,13 @@
     MultiColumnConstraintWithMetadata,
     MultiConstraintWithMetadata,
     StrictColumnsWithMetadata,
+    all_unique_validator,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    column_regex_validation_factory,
+    column_unique_validation_factory,
+    nonnull,
+    vectorized_validator,
 )
 from pandas import DataFrame
 
@@ -191,3 +198,92 @@ def test_range_constraint():
     assert {"bar": [3], "baz": [4]} == val["actual"]
     range_val = ColumnRangeConstraintWithMetadata(raise_or_typecheck=False)
     assert range_val.validate(df).success
+
+
+def test_vectorized_column_constraint():
+    calls = []
+
+    @vectorized_validator
+    def column_num_validation_function(column):
+        calls.append(column.name)
+        return (column >= 3, {})
+
+    df = DataFrame({"foo": [1, 2], "bar": [3, 2], "baz": [1, 4]})
+    column_val = ColumnConstraintWithMetadata(
+        "Confirms values greater than 3",
+        column_num_validation_function,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    val = column_val.validate(df, *df.columns).metadata_entries[0].entry_data.data
+    assert {"foo": ["row 0", "row 1"], "bar": ["row 1"], "baz": ["row 0"]} == val["offending"]
+    assert {"foo": [1, 2], "bar": [2], "baz": [1]} == val["actual"]
+    # each column is validated with a single call
+    assert calls == ["foo", "bar", "baz"]
+
+
+def test_column_constraint_max_offending_rows():
+    df = DataFrame({"foo": list(range(10)), "bar": [0] * 10}, index=list(range(10, 20)))
+    range_val = ColumnRangeConstraintWithMetadata(
+        5, 20, raise_or_typecheck=False, max_offending_rows=2
+    )
+    val = range_val.validate(df).metadata_entries[0].entry_data.data
+    assert {
+        "foo": ["row 10", "row 11", "and 3 more rows"],
+        "bar": ["row 10", "row 11", "and 8 more rows"],
+    } == val["offending"]
+    assert {"foo": [0, 1], "bar": [0, 0]} == val["actual"]
+
+    range_val = ColumnRangeConstraintWithMetadata(
+        5, 20, raise_or_typecheck=False, max_offending_rows=None
+    )
+    val = range_val.validate(df).metadata_entries[0].entry_data.data
+    assert len(val["offending"]["bar"]) == 10
+
+
+def test_aggregate_constraint_max_offending_rows():
+    df = DataFrame({"foo": [1, 1, 2, 2, 3, 3]})
+    aggregate_val = ColumnAggregateConstraintWithMetadata(
+        "Confirms all values are unique",
+        all_unique_validator,
+        ConstraintWithMetadataException,
+        raise_or_typecheck=False,
+        max_offending_rows=2,
+    )
+    val = aggregate_val.validate(df).metadata_entries[0].entry_data.data
+    assert [1, 2] == val["actual"]["foo"]
+
+
+def test_multi_column_constraint_max_workers():
+    df = DataFrame(
+        {
+            "foo": [1, 2, 3.5, 4],
+            "bar": ["a@b.com", "c@d", "e@f.com", "a@b.com"],
+            "baz": [1, 1, 2, 3],
+        }
+    )
+    fn_and_columns_dict = {
+        "foo": [nonnull(column_range_validation_factory(0.0, 3.0))],
+        "bar": [column_regex_validation_factory(r"[a-z]+@[a-z]+\.com")],
+        "baz": [column_unique_validation_factory(), categorical_column_validator_factory([1, 2])],
+    }
+    serial_val = MultiColumnConstraintWithMetadata(
+        "Complex confirmation",
+        fn_and_columns_dict,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+    parallel_val = MultiColumnConstraintWithMetadata(
+        "Complex confirmation",
+        fn_and_columns_dict,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+        max_workers=3,
+    )
+    val = serial_val.validate(df).metadata_entries[0].entry_data.data
+    assert val == parallel_val.validate(df).metadata_entries[0].entry_data.data
+    assert {
+        "foo": {"in_range_validation_fn": ["row 2", "row 3"]},
+        "bar": {"regex_validation_fn": ["row 1"]},
+        "baz": {"unique_validation_fn": ["row 1"], "categorical_validation_fn": ["row 3"]},
+    } == val["offending"]
@@ -2,11 +2,14 @@
     all_unique_validator,
     categorical_column_validator_factory,
     column_range_validation_factory,
+    column_regex_validation_factory,
+    column_unique_validation_factory,
     dtype_in_set_validation_factory,
     non_null_validation,
     nonnull,
 )
 from numpy import nan as NaN
+from pandas import Series
 
 
 def test_unique():
@@ -52,3 +55,47 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+def test_vectorized_validators():
+    series = Series([1, 5, NaN, 20])
+
+    range_validator = column_range_validation_factory(minim=0.0, maxim=10.0)
+    assert range_validator.vectorized
+    assert list(range_validator(series)[0]) == [True, True, False, False]
+
+    range_validator = column_range_validation_factory(
+        minim=0.0, maxim=10.0, ignore_missing_vals=True
+    )
+    assert list(range_validator(series)[0]) == [True, True, True, False]
+
+    assert list(non_null_validation(series)[0]) == [True, True, False, True]
+    assert list(nonnull(range_validator)(series)[0]) == [True, True, False, False]
+
+    mixed = Series([1, 1.5, "a", None])
+    dtype_validator = dtype_in_set_validation_factory((int, float))
+    assert list(dtype_validator(mixed)[0]) == [True, True, False, False]
+    assert list(column_range_validation_factory(0, 10)(mixed)[0]) == [True, False, False, False]
+
+    categorical_validator = categorical_column_validator_factory(["a", "b"])
+    assert list(categorical_validator(Series(["a", "c", "b"]))[0]) == [True, False, True]
+
+
+def test_column_unique():
+    testfunc = column_unique_validation_factory()
+    assert testfunc(1)[0]
+    assert list(testfunc(Series([1, 2, 1, NaN, NaN]))[0]) == [True, True, False, True, False]
+
+    testfunc = column_unique_validation_factory(ignore_missing_vals=True)
+    assert list(testfunc(Series([1, 2, 1, NaN, NaN]))[0]) == [True, True, False, True, True]
+
+
+def test_regex():
+    testfunc = column_regex_validation_factory(r"[a-z]+@[a-z]+\.com")
+    assert testfunc("a@b.com")[0]
+    assert not testfunc("a@b.com.au")[0]
+    assert not testfunc(7)[0]
+    assert list(testfunc(Series(["a@b.com", "c@d", 7, NaN]))[0]) == [True, False, False, False]
+
+    testfunc = column_regex_validation_factory(r"[a-z]+@[a-z]+\.com", ignore_missing_vals=True)
+    assert list(testfunc(Series(["a@b.com", "c@d", NaN]))[0]) == [True, False, True]
@@ -0,0 +1,59 @@
+"""add run stats and step stats tables
+
+Revision ID: 37002abd0bc4
+Revises: 2a2bd7b2e6d4
+Create Date: 2026-10-19 01:12:40.215321
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "37002abd0bc4"
+down_revision = "2a2bd7b2e6d4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the summary tables live next to the event log
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("run_stats"):
+        op.create_table(
+            "run_stats",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("run_id", sa.String(255), unique=True),
+            sa.Column("steps_succeeded", sa.Integer, nullable=False, default=0),
+            sa.Column("steps_failed", sa.Integer, nullable=False, default=0),
+            sa.Column("materializations", sa.Integer, nullable=False, default=0),
+            sa.Column("expectations", sa.Integer, nullable=False, default=0),
+            sa.Column("start_time", sa.types.TIMESTAMP),
+            sa.Column("end_time", sa.types.TIMESTAMP),
+        )
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("run_id", sa.String(255), nullable=False),
+            sa.Column("step_key", sa.String, nullable=False),
+            sa.Column("status", sa.String(63)),
+            sa.Column("start_time", sa.types.TIMESTAMP),
+            sa.Column("end_time", sa.types.TIMESTAMP),
+            sa.Column("attempts", sa.Integer),
+            sa.UniqueConstraint("run_id", "step_key"),
+        )
+
+
+def downgrade():
+    if has_table("step_stats"):
+        op.drop_table("step_stats")
+
+    if has_table("run_stats"):
+        op.drop_table("run_stats")
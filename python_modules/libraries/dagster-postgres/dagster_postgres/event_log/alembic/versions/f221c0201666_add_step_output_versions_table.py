@@ -0,0 +1,49 @@
+"""add step output versions table
+
+Revision ID: f221c0201666
+Revises: 37002abd0bc4
+Create Date: 2026-10-19 02:05:11.634718
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from dagster.core.storage.migration.utils import has_table
+
+# alembic magic breaks pylint
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "f221c0201666"
+down_revision = "37002abd0bc4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # the index lives next to the event log
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("step_output_versions"):
+        op.create_table(
+            "step_output_versions",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("pipeline_name", sa.String, nullable=False),
+            sa.Column("run_id", sa.String(255), nullable=False),
+            sa.Column("step_key", sa.String, nullable=False),
+            sa.Column("output_name", sa.String, nullable=False),
+            sa.Column("version", sa.String, nullable=False),
+            sa.Column("address", sa.Text, nullable=False),
+            sa.Column("create_timestamp", sa.DateTime, server_default=sa.text("CURRENT_TIMESTAMP")),
+        )
+        op.create_index(
+            "idx_step_output_version",
+            "step_output_versions",
+            ["pipeline_name", "step_key", "output_name", "version"],
+            unique=False,
+        )
+
+
+def downgrade():
+    if has_table("step_output_versions"):
+        op.drop_table("step_output_versions")
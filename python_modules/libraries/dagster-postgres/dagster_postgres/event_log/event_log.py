@@ -1,9 +1,9 @@
 import threading
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 import psycopg2
 import sqlalchemy as db
-from dagster import check
+from dagster import Field, check
 from dagster.core.events.log import EventRecord
 from dagster.core.storage.event_log import (
     AssetAwareSqlEventLogStorage,
@@ -11,7 +11,8 @@
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.sql import create_engine, get_alembic_config, run_alembic_upgrade
+from dagster.core.storage.event_log.sql_event_log import unique_asset_key_events
+from dagster.core.storage.sql import get_alembic_config, run_alembic_upgrade
 from dagster.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
@@ -19,7 +20,13 @@
 )
 
 from ..pynotify import await_pg_notifications
-from ..utils import create_pg_connection, pg_config, pg_statement_timeout, pg_url_from_config
+from ..utils import (
+    create_pg_connection,
+    create_pg_engine,
+    pg_db_config,
+    pg_pool_config,
+    pg_url_from_config,
+)
 
 CHANNEL_NAME = "run_events"
 
@@ -42,31 +49,47 @@ class PostgresEventLogStorage(AssetAwareSqlEventLogStorage, ConfigurableClass):
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
 
+    By default, the storage opens a new connection for every operation. To keep a pool of open
+    connections instead, e.g. when many events are written concurrently, add a ``pool`` block to
+    the config:
+
+    .. code-block:: YAML
+
+        event_log_storage:
+          module: dagster_postgres.event_log
+          class: PostgresEventLogStorage
+          config:
+            postgres_url: ...
+            pool:
+              pool_size: 5
+              max_overflow: 10
+              pool_recycle: 3600
+              pool_pre_ping: true
     """
 
-    def __init__(self, postgres_url, inst_data=None):
+    def __init__(self, postgres_url, inst_data=None, pool_config=None):
+        super(PostgresEventLogStorage, self).__init__()
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._pool_config = check.opt_dict_param(pool_config, "pool_config", key_type=str)
         self._disposed = False
 
         self._event_watcher = PostgresEventWatcher(self.postgres_url)
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
-        )
+        self._engine = create_pg_engine(self.postgres_url, pool_config=self._pool_config)
         self._secondary_index_cache = {}
 
         with self.connect() as conn:
             SqlEventLogStorageMetadata.create_all(conn)
 
     def optimize_for_dagit(self, statement_timeout):
-        # When running in dagit, hold an open connection and set statement_timeout
-        self._engine = create_engine(
+        # When running in dagit, hold open connections and set statement_timeout
+        self._engine.dispose()
+        self._engine = create_pg_engine(
             self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            pool_size=1,
-            connect_args={"options": pg_statement_timeout(statement_timeout)},
+            pool_config=self._pool_config or {"pool_size": 1},
+            statement_timeout=statement_timeout,
         )
 
     def upgrade(self):
@@ -79,12 +102,20 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return pg_config()
+        # the pool config sits next to the connection settings, which therefore can't be a Selector
+        # as for the other postgres storages - pg_url_from_config checks that exactly one is set
+        return {
+            "postgres_url": Field(str, is_required=False),
+            "postgres_db": Field(pg_db_config(), is_required=False),
+            "pool": Field(pg_pool_config(), is_required=False),
+        }
 
     @staticmethod
     def from_config_value(inst_data, config_value):
         return PostgresEventLogStorage(
-            inst_data=inst_data, postgres_url=pg_url_from_config(config_value)
+            inst_data=inst_data,
+            postgres_url=pg_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -101,19 +132,63 @@ def store_event(self, event):
         check.inst_param(event, "event", EventRecord)
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
         with self.connect() as conn:
-            result_proxy = conn.execute(
-                insert_event_statement.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+            # notifications are only delivered once the transaction commits
+            with conn.begin():
+                result_proxy = conn.execute(
+                    insert_event_statement.returning(
+                        SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                    )
                 )
-            )
-            res = result_proxy.fetchone()
-            result_proxy.close()
-            conn.execute(
-                """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
-                (res[0] + "_" + str(res[1]),),
-            )
-            if event.is_dagster_event and event.dagster_event.asset_key:
-                self.store_asset_key(conn, event)
+                res = result_proxy.fetchone()
+                result_proxy.close()
+                conn.execute(
+                    """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                    (res[0] + "_" + str(res[1]),),
+                )
+                if event.is_dagster_event and event.dagster_event.asset_key:
+                    self.store_asset_key(conn, event)
+                self.store_stats(conn, [event])
+                self.store_step_output_versions(conn, [event])
+
+    def store_events(self, events):
+        """Store a batch of events with a single multi-row insert.
+        Args:
+            events (List[EventRecord]): The events to store.
+        """
+        check.list_param(events, "events", of_type=EventRecord)
+        if not events:
+            return
+
+        with self.connect() as conn:
+            with conn.begin():
+                result_proxy = conn.execute(
+                    SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+                    .values([self.prepare_event_row(event) for event in events])
+                    .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+                )
+                res = result_proxy.fetchall()
+                result_proxy.close()
+                for run_id, record_id in res:
+                    conn.execute(
+                        """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
+                        (run_id + "_" + str(record_id),),
+                    )
+
+                asset_key_events = unique_asset_key_events(events)
+                if asset_key_events:
+                    conn.execute(
+                        db.dialects.postgresql.insert(AssetKeyTable)
+                        .values(
+                            [
+                                dict(asset_key=event.dagster_event.asset_key.to_string())
+                                for event in asset_key_events
+                            ]
+                        )
+                        .on_conflict_do_nothing(index_elements=[AssetKeyTable.c.asset_key])
+                    )
+
+                self.store_stats(conn, events)
+                self.store_step_output_versions(conn, events)
 
     def store_asset_key(self, conn, event):
         check.inst_param(event, "event", EventRecord)
@@ -126,6 +201,22 @@ def store_asset_key(self, conn, event):
             .on_conflict_do_nothing(index_elements=[AssetKeyTable.c.asset_key])
         )
 
+    def upsert_stats_row(self, conn, table, key_values, insert_values, update_values):
+        # a single statement, since connections autocommit and a failed insert can't be retried
+        # as an update inside an enclosing transaction
+        insert_statement = db.dialects.postgresql.insert(table).values(
+            **dict(key_values, **insert_values)
+        )
+        index_elements = [table.c[name] for name in key_values]
+        if update_values:
+            conn.execute(
+                insert_statement.on_conflict_do_update(
+                    index_elements=index_elements, set_=update_values
+                )
+            )
+        else:
+            conn.execute(insert_statement.on_conflict_do_nothing(index_elements=index_elements))
+
     def connect(self, run_id=None):
         return create_pg_connection(self._engine, __file__, "event log")
 
@@ -159,6 +250,7 @@ def dispose(self):
         if not self._disposed:
             self._disposed = True
             self._event_watcher.close()
+            self._engine.dispose()
 
 
 EventWatcherProcessStartedEvent = namedtuple("EventWatcherProcessStartedEvent", "")
@@ -183,45 +275,59 @@ def dispose(self):
 
 
 def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+    # A single engine holding one open connection fetches the events for every notification
+    engine = create_pg_engine(
+        conn_string, pool_config={"pool_size": 1, "max_overflow": 0, "pool_pre_ping": True}
+    )
 
     try:
-        for notif in await_pg_notifications(
+        for notifs in await_pg_notifications(
             conn_string,
             channels=[CHANNEL_NAME],
             timeout=POLLING_CADENCE,
             yield_on_timeout=True,
             exit_event=watcher_thread_exit,
+            yield_batches=True,
         ):
-            if notif is None:
+            if notifs is None:
                 if watcher_thread_exit.is_set():
                     break
-            else:
+                continue
+
+            indexes_by_run_id = OrderedDict()
+            for notif in notifs:
                 run_id, index_str = notif.payload.split("_")
-                if run_id not in run_id_dict:
-                    continue
+                if run_id in run_id_dict:
+                    indexes_by_run_id.setdefault(run_id, set()).add(int(index_str))
 
-                index = int(index_str)
+            for run_id, indexes in indexes_by_run_id.items():
                 with dict_lock:
                     handlers = handlers_dict.get(run_id, [])
 
-                engine = create_engine(
-                    conn_string, isolation_level="AUTOCOMMIT", poolclass=db.pool.NullPool
-                )
-                try:
-                    res = engine.execute(
-                        db.select([SqlEventLogStorageTable.c.event]).where(
-                            SqlEventLogStorageTable.c.id == index
-                        ),
-                    )
-                    dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-                finally:
-                    engine.dispose()
-
-                for (cursor, callback) in handlers:
-                    if index >= cursor:
-                        callback(dagster_event)
+                # The events for a burst of notifications are fetched with a single range query.
+                # Events in the range that were notified separately are skipped here, so that
+                # each event is delivered exactly once.
+                with engine.connect() as conn:
+                    rows = conn.execute(
+                        db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                        .where(SqlEventLogStorageTable.c.run_id == run_id)
+                        .where(SqlEventLogStorageTable.c.id >= min(indexes))
+                        .where(SqlEventLogStorageTable.c.id <= max(indexes))
+                        .order_by(SqlEventLogStorageTable.c.id.asc())
+                    ).fetchall()
+
+                for index, event_json in rows:
+                    if index not in indexes:
+                        continue
+
+                    dagster_event = deserialize_json_to_dagster_namedtuple(event_json)
+                    for (cursor, callback) in handlers:
+                        if index >= cursor:
+                            callback(dagster_event)
     except psycopg2.OperationalError:
         pass
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher:
@@ -78,6 +78,7 @@ def await_pg_notifications(
     yield_on_timeout=False,
     handle_signals=None,
     exit_event=None,
+    yield_batches=False,
 ):
     """Subscribe to PostgreSQL notifications, and handle them
     in infinite-loop style.
@@ -86,12 +87,16 @@ def await_pg_notifications(
     If you've enabled 'yield_on_timeout', yields None on timeout.
     If you've enabled 'handle_keyboardinterrupt', yields False on
     interrupt.
+    If you've enabled 'yield_batches', yields a list of all the
+    notifications received together, in the order they were sent,
+    instead of yielding each notification on its own.
     """
 
     check.str_param(conn_string, "conn_string")
     channels = None if channels is None else check.list_param(channels, "channels", of_type=str)
     check.float_param(timeout, "timeout")
     check.bool_param(yield_on_timeout, "yield_on_timeout")
+    check.bool_param(yield_batches, "yield_batches")
 
     conn = get_conn(conn_string)
 
@@ -129,8 +134,12 @@ def await_pg_notifications(
                     while conn.notifies:
                         notify_list.append(conn.notifies.pop())
 
-                    for notif in notify_list:
-                        yield notif
+                    if yield_batches:
+                        if notify_list:
+                            yield list(reversed(notify_list))
+                    else:
+                        for notif in notify_list:
+                            yield notif
 
             except select.error as e:
                 e_num, _e_message = e  # pylint: disable=unpacking-non-sequence
@@ -27,6 +27,7 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
     """
 
     def __init__(self, postgres_url, inst_data=None):
+        super(PostgresRunStorage, self).__init__()
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
 
@@ -0,0 +1,37 @@
+"""add run status index
+
+Revision ID: b601eb913efa
+Revises: c9159e740d7e
+Create Date: 2026-10-18 20:41:07.126483
+
+"""
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# pylint: disable=no-member
+
+# revision identifiers, used by Alembic.
+revision = "b601eb913efa"
+down_revision = "c9159e740d7e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if not "idx_run_status" in indices:
+            op.create_index("idx_run_status", "runs", ["status", "id"], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        if "idx_run_status" in indices:
+            op.drop_index("idx_run_status", "runs")
@@ -6,7 +6,7 @@
 import six
 import sqlalchemy
 from dagster import Field, IntSource, Selector, StringSource, check
-from dagster.core.storage.sql import get_alembic_config, handle_schema_errors
+from dagster.core.storage.sql import create_engine, get_alembic_config, handle_schema_errors
 from dagster.seven import quote_plus as urlquote
 
 
@@ -21,21 +21,56 @@ def get_conn(conn_string):
 
 
 def pg_config():
-    return Selector(
-        {
-            "postgres_url": str,
-            "postgres_db": {
-                "username": StringSource,
-                "password": StringSource,
-                "hostname": StringSource,
-                "db_name": StringSource,
-                "port": Field(IntSource, is_required=False, default_value=5432),
-            },
-        }
-    )
+    return Selector({"postgres_url": str, "postgres_db": pg_db_config()})
+
+
+def pg_db_config():
+    return {
+        "username": StringSource,
+        "password": StringSource,
+        "hostname": StringSource,
+        "db_name": StringSource,
+        "port": Field(IntSource, is_required=False, default_value=5432),
+    }
+
+
+def pg_pool_config():
+    return {
+        "pool_size": Field(
+            IntSource,
+            is_required=False,
+            default_value=5,
+            description="The number of connections to keep open in the pool.",
+        ),
+        "max_overflow": Field(
+            IntSource,
+            is_required=False,
+            default_value=10,
+            description="The number of connections to open beyond pool_size when the pool is "
+            "exhausted. They are closed as soon as they are returned to the pool.",
+        ),
+        "pool_recycle": Field(
+            IntSource,
+            is_required=False,
+            default_value=3600,
+            description="The number of seconds after which a pooled connection is replaced, or -1 "
+            "to never replace pooled connections.",
+        ),
+        "pool_pre_ping": Field(
+            bool,
+            is_required=False,
+            default_value=True,
+            description="Whether to test pooled connections for liveness before using them.",
+        ),
+    }
 
 
 def pg_url_from_config(config_value):
+    check.invariant(
+        bool(config_value.get("postgres_url")) != bool(config_value.get("postgres_db")),
+        "Exactly one of postgres_url and postgres_db must be set in the postgres storage config.",
+    )
+
     if config_value.get("postgres_url"):
         return config_value["postgres_url"]
 
@@ -111,6 +146,30 @@ def create_pg_connection(engine, dunder_file, storage_type_desc=None):
             conn.close()
 
 
+def create_pg_engine(postgres_url, pool_config=None, statement_timeout=None):
+    """Creates an autocommit engine for the given postgres url.
+
+    Without a pool_config, connections are not pooled, so that no connections are held open per
+    DagsterInstance. Otherwise pool_config holds the keyword arguments for the engine's QueuePool,
+    as in pg_pool_config.
+    """
+    check.str_param(postgres_url, "postgres_url")
+    check.opt_dict_param(pool_config, "pool_config", key_type=str)
+    check.opt_int_param(statement_timeout, "statement_timeout")
+
+    if pool_config:
+        pool_kwargs = pool_config
+    else:
+        pool_kwargs = {"poolclass": sqlalchemy.pool.NullPool}
+
+    if statement_timeout is not None:
+        pool_kwargs = dict(
+            pool_kwargs, connect_args={"options": pg_statement_timeout(statement_timeout)}
+        )
+
+    return create_engine(postgres_url, isolation_level="AUTOCOMMIT", **pool_kwargs)
+
+
 def pg_statement_timeout(millis):
     check.int_param(millis, "millis")
     return "-c statement_timeout={}".format(millis)
@@ -18,9 +18,11 @@
     solid,
 )
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
-from dagster.core.events import DagsterEventType
+from dagster.core.definitions.events import AssetStoreOperationType
+from dagster.core.events import AssetStoreOperationData, DagsterEvent, DagsterEventType
 from dagster.core.events.log import DagsterEventRecord, construct_event_logger
 from dagster.core.execution.api import execute_run
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.stats import StepEventStatus
 from dagster.core.storage.event_log.migration import migrate_asset_key_data
 from dagster.core.test_utils import instance_for_test
@@ -98,6 +100,28 @@ def _solids():
     assert Counter(event_types(out_events)) == Counter(event_types(events))
 
 
+def test_store_events_batch(conn_string):
+    asset_key = AssetKey(["path", "to", "batched_asset"])
+
+    @solid
+    def materialize_twice(_):
+        yield AssetMaterialization(asset_key=asset_key)
+        yield AssetMaterialization(asset_key=asset_key)
+        yield Output(1)
+
+    def _solids():
+        materialize_twice()
+
+    events, result = synthesize_events(_solids)
+
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    event_log_storage.store_events(events)
+
+    out_events = event_log_storage.get_logs_for_run(result.run_id)
+    assert event_types(out_events) == event_types(events)
+    assert set(event_log_storage.get_all_asset_keys()) == {asset_key}
+
+
 def event_types(out_events):
     return list(map(lambda e: e.dagster_event.event_type, out_events))
 
@@ -269,6 +293,30 @@ def _solids():
     assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
 
+def test_iter_logs_for_run_multiple_runs(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = synthesize_events(_solids)
+    events_two, result_two = synthesize_events(_solids)
+    # interleave the events of the runs so that the record ids of each run aren't contiguous
+    for event_one, event_two in zip(events_one, events_two):
+        event_log_storage.store_event(event_one)
+        event_log_storage.store_event(event_two)
+
+    for run_id, events in [(result_one.run_id, events_one), (result_two.run_id, events_two)]:
+        out_events = list(event_log_storage.iter_logs_for_run(run_id, batch_size=2))
+        assert out_events == event_log_storage.get_logs_for_run(run_id)
+        assert event_types(out_events) == event_types(events)
+        assert set(map(lambda e: e.run_id, out_events)) == {run_id}
+
+
 def test_listen_notify_single_run_event(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
@@ -380,6 +428,60 @@ def _solids():
         del event_log_storage
 
 
+def test_listen_notify_batched_events_in_order(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    run_id = make_new_run_id()
+    events, _ = synthesize_events(_solids, run_id=run_id)
+
+    # a batch of events is stored in one transaction, so the watcher receives the notifications for
+    # all of them together
+    event_list = []
+    event_log_storage.event_watcher.watch_run(run_id, 0, event_list.append)
+
+    try:
+        event_log_storage.store_events(events)
+
+        start = time.time()
+        while len(event_list) < len(events) and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert event_types(event_list) == event_types(events)
+    finally:
+        del event_log_storage
+
+
+def test_pooled_storage(conn_string):
+    event_log_storage = PostgresEventLogStorage(
+        conn_string, pool_config={"pool_size": 1, "max_overflow": 0, "pool_pre_ping": True}
+    )
+    event_log_storage.wipe()
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, result = synthesize_events(_solids)
+    try:
+        for event in events:
+            event_log_storage.store_event(event)
+
+        assert event_log_storage._engine.pool.size() == 1  # pylint: disable=protected-access
+        assert len(event_log_storage.get_logs_for_run(result.run_id)) == len(events)
+    finally:
+        event_log_storage.dispose()
+
+
 def test_load_from_config(hostname):
     url_cfg = """
       event_log_storage:
@@ -415,6 +517,27 @@ def test_load_from_config(hostname):
             assert from_url.postgres_url == from_explicit.postgres_url
 
 
+def test_load_pool_from_config(hostname):
+    pool_cfg = """
+      event_log_storage:
+        module: dagster_postgres.event_log
+        class: PostgresEventLogStorage
+        config:
+            postgres_url: postgresql://test:test@{hostname}:5432/test
+            pool:
+              pool_size: 2
+    """.format(
+        hostname=hostname
+    )
+
+    # pylint: disable=protected-access
+    with instance_for_test(overrides=yaml.safe_load(pool_cfg)) as instance:
+        pool = instance._event_storage._engine.pool
+        assert pool.size() == 2
+        assert pool._max_overflow == 10
+        assert pool._pre_ping
+
+
 def test_asset_materialization(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
@@ -595,3 +718,124 @@ def _one():
     assert step_stats[0].status == StepEventStatus.FAILURE
     assert step_stats[0].end_time > step_stats[0].start_time
     assert step_stats[0].attempts == 4
+
+
+def test_run_step_stats_secondary_index(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+    def should_retry(context, _input):
+        raise RetryRequested(max_retries=3)
+
+    def _one():
+        should_retry(should_succeed())
+
+    event_log_storage.reindex()
+    assert event_log_storage.has_secondary_index("run_stats_table")
+    assert event_log_storage.has_secondary_index("step_stats_table")
+
+    events, result = synthesize_events(_one, check_success=False)
+    event_log_storage.store_events(events)
+
+    # the summary tables are maintained as events are written, and agree with the raw event log
+    # pylint: disable=protected-access
+    assert (
+        event_log_storage.get_stats_for_run(result.run_id)
+        == event_log_storage._get_stats_for_runs_from_event_log([result.run_id])[result.run_id]
+    )
+    assert sorted(event_log_storage.get_step_stats_for_run(result.run_id)) == sorted(
+        event_log_storage._get_step_stats_for_runs_from_event_log([result.run_id])[result.run_id]
+    )
+
+    retry_stats = event_log_storage.get_step_stats_for_run(
+        result.run_id, step_keys=["should_retry.compute"]
+    )
+    assert len(retry_stats) == 1
+    assert retry_stats[0].status == StepEventStatus.FAILURE
+    assert retry_stats[0].attempts == 4
+
+
+def test_run_step_stats_fresh_run(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    with event_log_storage.connect() as conn:
+        assert event_log_storage.has_stats_tables(conn)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events, result = synthesize_events(_solids)
+    for event in events:
+        # the first PIPELINE_START and STEP_START of the run insert its summary rows
+        event_log_storage.store_event(event)
+
+    run_stats = event_log_storage.get_stats_for_run(result.run_id)
+    assert run_stats.steps_succeeded == 1
+    assert run_stats.start_time
+    assert run_stats.end_time >= run_stats.start_time
+
+    step_stats = event_log_storage.get_step_stats_for_run(result.run_id)
+    assert len(step_stats) == 1
+    assert step_stats[0].status == StepEventStatus.SUCCESS
+    assert step_stats[0].attempts == 1
+
+
+def _asset_store_operation_record(run_id, op, version=None, path=None):
+    return DagsterEventRecord(
+        None,
+        "",
+        "debug",
+        "",
+        run_id,
+        time.time(),
+        step_key="A",
+        pipeline_name="a_pipe",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_STORE_OPERATION.value,
+            "a_pipe",
+            step_key="A",
+            event_specific_data=AssetStoreOperationData(
+                op=op,
+                step_key="A",
+                output_name="result",
+                asset_store_key="asset_store",
+                metadata_entries=[EventMetadataEntry.fspath(path)] if path else None,
+                version=version,
+            ),
+        ),
+    )
+
+
+def test_step_output_versions_secondary_index(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+    event_log_storage.reindex()
+    assert event_log_storage.has_secondary_index("step_output_versions_table")
+
+    run_id_one = make_new_run_id()
+    run_id_two = make_new_run_id()
+    event_log_storage.store_event(
+        _asset_store_operation_record(run_id_one, AssetStoreOperationType.SET_ASSET, "v1", "/one")
+    )
+    event_log_storage.store_events(
+        [
+            _asset_store_operation_record(
+                run_id_two, AssetStoreOperationType.SET_ASSET, "v1", "/two"
+            ),
+            _asset_store_operation_record(
+                run_id_two, AssetStoreOperationType.SET_ASSET, "v2", "/two_v2"
+            ),
+        ]
+    )
+
+    key = ("a_pipe", StepOutputHandle("A", "result"))
+    assert event_log_storage.get_addresses_for_step_output_versions({key: "v1"}) == {key: "/two"}
+    assert event_log_storage.get_addresses_for_step_output_versions({key: "v3"}) == {key: None}
+
+    event_log_storage.store_event(
+        _asset_store_operation_record(run_id_two, AssetStoreOperationType.RM_ASSET)
+    )
+    assert event_log_storage.get_addresses_for_step_output_versions({key: "v1"}) == {key: "/one"}
+    assert event_log_storage.get_addresses_for_step_output_versions({key: "v2"}) == {key: None}